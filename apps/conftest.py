@@ -1,3 +1,9 @@
+from typing import Any, Callable
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
 from rest_framework.test import APIClient
 
 import pytest
@@ -19,3 +25,46 @@ def another_api_client(another_user: User) -> APIClient:
     client = APIClient()
     client.force_authenticate(user=another_user)
     return client
+
+
+def get_queries_count(client: APIClient, url: str) -> int:
+    """Return number of queries made by a successful GET request."""
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    return len(context.captured_queries)
+
+
+@pytest.fixture
+def assert_constant_queries_count() -> Callable:
+    """Return assertion that endpoint's queries count doesn't grow with data.
+
+    The assertion requests the url with a single related object, adds more
+    objects with `add_objects(count)` and requests the url again, so any
+    query made per each object (N+1) fails the assertion.
+
+    Example:
+        assert_constant_queries_count(
+            api_client,
+            reverse("v1:wallet-list"),
+            lambda count: WalletFactory.create_batch(count, user=user),
+        )
+
+    """
+
+    def assert_queries_count(
+        client: APIClient,
+        url: str,
+        add_objects: Callable[[int], Any],
+        count: int = 5,
+    ) -> None:
+        add_objects(1)
+        # Warm up caches, which are filled by the first request
+        get_queries_count(client, url)
+        single_object_queries_count = get_queries_count(client, url)
+
+        add_objects(count)
+        assert get_queries_count(client, url) == single_object_queries_count
+
+    return assert_queries_count
@@ -117,3 +117,54 @@ class UpdateModelWithoutPatchMixin:
 
     update = mixins.UpdateModelMixin.update
     perform_update = mixins.UpdateModelMixin.perform_update
+
+
+class ActionEagerLoadingMixin:
+    """Mixin which allows to define eager-loading plans per action.
+
+    Related objects used by action's serializer are loaded with
+    ``select_related`` and ``prefetch_related`` of ``get_queryset()`` result,
+    so serializing a list doesn't make queries per each object.
+    It should be used for ``GenericViewSet``
+    Examples:
+        class NoteViewSet(ActionEagerLoadingMixin, viewsets.ModelViewSet):
+            queryset = Note.objects.all()
+            serializer_class = NoteSerializer
+            select_related_map = {
+                "default": ("author",),
+            }
+            prefetch_related_map = {
+                "retrieve": ("comments__author",),
+            }
+
+    """
+
+    select_related_map = None
+    prefetch_related_map = None
+
+    def get_queryset(self):
+        """Return queryset with related objects of current action."""
+        queryset = super().get_queryset()
+        select_related = self.get_select_related()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        prefetch_related = self.get_prefetch_related()
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+    def get_select_related(self):
+        """Return `select_related` lookups for view's action."""
+        return self.get_lookups_from_map(self.select_related_map)
+
+    def get_prefetch_related(self):
+        """Return `prefetch_related` lookups for view's action."""
+        return self.get_lookups_from_map(self.prefetch_related_map)
+
+    def get_lookups_from_map(self, lookups_map):
+        """Return lookups of view's action or `default` ones from map."""
+        if not isinstance(lookups_map, dict):
+            return ()
+        if self.action in lookups_map:
+            return lookups_map[self.action]
+        return lookups_map.get("default", ())
@@ -4,10 +4,13 @@ from typing import Any
 
 import django
 from django.conf import settings
+from django.core.paginator import InvalidPage
 from django.db.models import QuerySet
+from django.http import Http404
 from django.urls import reverse_lazy
 from django.views.generic import ListView, TemplateView
 
+from libs.pagination import KeysetPaginator
 from libs.utils import get_changelog_html, get_latest_version
 
 Changelog = namedtuple("Changelog", ["name", "text", "version", "open_api_ui"])
@@ -73,12 +76,25 @@ class BaseListView(ListView):
     Allow pagination and filtering in a list view page. All models will be
     inherited from this BaseListView class.
 
+    Views with `keyset_ordering` also support keyset pagination, enabled by
+    `pagination=keyset` query param. It doesn't count objects and uses a
+    cursor instead of page numbers, so deep pages are as fast as the first.
+
     """
 
     paginate_by = 10
     paginate_by_options = [5, 10, 15, 20, 25, 50, 100]
     filter_class = None
     filtering = None
+    keyset_ordering = None
+
+    @property
+    def is_keyset_paginated(self) -> bool:
+        """Return whether keyset pagination is requested and supported."""
+        return bool(
+            self.keyset_ordering
+            and self.request.GET.get("pagination") == "keyset",
+        )
 
     def get_paginate_by(self, queryset) -> int:
         """Return the number of items to paginate by."""
@@ -87,6 +103,18 @@ class BaseListView(ListView):
             return int(paginate_by)
         return self.paginate_by
 
+    def paginate_queryset(self, queryset, page_size) -> tuple:
+        """Paginate the queryset by keyset if it is requested."""
+        if not self.is_keyset_paginated:
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = KeysetPaginator(queryset, page_size, self.keyset_ordering)
+        try:
+            page = paginator.get_page(self.request.GET.get("cursor"))
+        except InvalidPage as error:
+            raise Http404(str(error)) from error
+        return (paginator, page, page.object_list, page.has_other_pages())
+
     def get_queryset(self) -> QuerySet:
         """Get object queryset and add django_filter instance."""
         qs = super().get_queryset()
@@ -105,6 +133,7 @@ class BaseListView(ListView):
 
         data_to_update["filter"] = self.filtering
         data_to_update["paginate_by_options"] = self.paginate_by_options
+        data_to_update["is_keyset_paginated"] = self.is_keyset_paginated
         data_to_update["paginate_by"] = self.get_paginate_by(
             context["object_list"],
         )
@@ -76,8 +76,9 @@ class ExchangeRateSerializer(ModelBaseSerializer):
             rate=1 / validated_data["rate"],
             user=self.context["request"].user,
         )
+        instance = super().create(validated_data)
 
-        return super().create(validated_data)
+        return instance
 
     def update(self, instance, validated_data):
         """Do not allow user to update source and destination currency.
@@ -88,15 +89,17 @@ class ExchangeRateSerializer(ModelBaseSerializer):
         validated_data.pop("source_currency", None)
         validated_data.pop("destination_currency", None)
 
-        # Update the reverse exchange rate.
-        ExchangeRate.objects.filter(
+        # Update the reverse exchange rate, saving it records its history.
+        reverse_rate = ExchangeRate.objects.get(
+            user=instance.user,
             source_currency=instance.destination_currency,
             destination_currency=instance.source_currency,
-        ).update(
-            rate=1 / validated_data["rate"],
         )
+        reverse_rate.rate = 1 / validated_data["rate"]
+        reverse_rate.save()
+        instance = super().update(instance, validated_data)
 
-        return super().update(instance, validated_data)
+        return instance
 
     class Meta:
         model = ExchangeRate
@@ -20,6 +20,9 @@ class ExchangeRateViewSet(
     ordering_fields = ("source_currency", "destination_currency")
     search_fields = ("source_currency", "destination_currency")
     queryset = ExchangeRate.objects.all()
+    select_related_map = {
+        "default": ("source_currency", "destination_currency"),
+    }
 
     def get_queryset(self):
         return super().get_queryset().filter(
@@ -7,3 +7,7 @@ class RatesConfig(AppConfig):
 
     name = "apps.rates"
     verbose_name = _("Rates")
+
+    def ready(self):
+        # pylint: disable=unused-import
+        from . import signals  # noqa
@@ -55,3 +55,7 @@ BASIC_CURRENCIES = [
         "code": "EUR",
     },
 ]
+
+RATE_MATRIX_CACHE_KEY = "rates:matrix:{user_id}"
+
+RATE_MATRIX_CACHE_TIMEOUT = 60 * 60 * 24
@@ -91,8 +91,9 @@ class ExchangeRateUpdateForm(ModelForm):
         )
         reverse_rate.rate = Decimal(1) / self.instance.rate
         reverse_rate.save()
+        instance = super().save(*args, **kwargs)
 
-        return super().save(*args, **kwargs)
+        return instance
 
     class Meta:
         model = ExchangeRate
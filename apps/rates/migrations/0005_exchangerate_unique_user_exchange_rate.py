@@ -0,0 +1,30 @@
+# Generated by Django 4.2 on 2026-10-18 12:06
+
+from django.db import migrations, models
+
+
+def delete_duplicated_rates(apps, schema_editor) -> None:
+    """Keep only the latest exchange rate of each user's currency pair."""
+    ExchangeRate = apps.get_model("rates", "ExchangeRate")
+    latest_rates = ExchangeRate.objects.values(
+        "user", "source_currency", "destination_currency",
+    ).annotate(latest_id=models.Max("id")).values_list("latest_id", flat=True)
+    ExchangeRate.objects.exclude(id__in=list(latest_rates)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rates', '0004_alter_exchangerate_rate'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_duplicated_rates,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='exchangerate',
+            constraint=models.UniqueConstraint(fields=('user', 'source_currency', 'destination_currency'), name='unique_user_exchange_rate'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2 on 2026-10-18 13:00
+
+from datetime import date
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django_extensions.db.fields
+
+
+def create_initial_history(apps, schema_editor) -> None:
+    """Make current rates effective for all past dates, as they were."""
+    ExchangeRate = apps.get_model("rates", "ExchangeRate")
+    ExchangeRateHistory = apps.get_model("rates", "ExchangeRateHistory")
+    ExchangeRateHistory.objects.bulk_create(
+        (
+            ExchangeRateHistory(
+                user_id=rate.user_id,
+                source_currency_id=rate.source_currency_id,
+                destination_currency_id=rate.destination_currency_id,
+                rate=rate.rate,
+                effective_from=date.min,
+            )
+            for rate in ExchangeRate.objects.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('rates', '0005_exchangerate_unique_user_exchange_rate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExchangeRateHistory',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('rate', models.DecimalField(decimal_places=6, max_digits=14, verbose_name='Exchange rate')),
+                ('effective_from', models.DateField(verbose_name='Effective from')),
+                ('destination_currency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='rates.currency', verbose_name='Destination currency')),
+                ('source_currency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='rates.currency', verbose_name='Source currency')),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='User of this rate')),
+            ],
+            options={
+                'verbose_name': 'Exchange rate history',
+                'verbose_name_plural': 'Exchange rate history',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='exchangeratehistory',
+            constraint=models.UniqueConstraint(fields=('user', 'source_currency', 'destination_currency', 'effective_from'), name='unique_user_exchange_rate_history'),
+        ),
+        migrations.RunPython(
+            create_initial_history,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-18 13:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rates', '0006_exchange_rate_history'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='exchangeratehistory',
+            name='rate',
+            field=models.DecimalField(decimal_places=6, max_digits=14, null=True, verbose_name='Exchange rate'),
+        ),
+    ]
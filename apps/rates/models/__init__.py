@@ -1,2 +1,3 @@
 from .currency import Currency
 from .exchange_rate import ExchangeRate
+from .exchange_rate_history import ExchangeRateHistory
@@ -43,6 +43,12 @@ class ExchangeRate(BaseModel):
     class Meta:
         verbose_name = _("Exchange rate")
         verbose_name_plural = _("Exchange rates")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "source_currency", "destination_currency"],
+                name="unique_user_exchange_rate",
+            ),
+        ]
 
     def __str__(self):
         return (
@@ -0,0 +1,76 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import BaseModel
+from apps.users.models import User
+
+
+class ExchangeRateHistory(BaseModel):
+    """Exchange rate of users effective from a date.
+
+    A rate is effective until the next rate of the same currency pair.
+
+    Attrs:
+        user: referenced to User, identified the user who owns this rate
+        source_currency * rate = destination_currency, no rate since the
+            pair was deleted
+        effective_from: first day the rate is applied on
+
+    """
+
+    user = models.ForeignKey(
+        verbose_name=_("User of this rate"),
+        to=User,
+        on_delete=models.CASCADE,
+        # Covered by the unique constraint below, which starts with user
+        db_index=False,
+    )
+
+    source_currency = models.ForeignKey(
+        verbose_name=_("Source currency"),
+        to="rates.Currency",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    destination_currency = models.ForeignKey(
+        verbose_name=_("Destination currency"),
+        to="rates.Currency",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    rate = models.DecimalField(
+        verbose_name=_("Exchange rate"),
+        decimal_places=6,
+        max_digits=14,
+        null=True,
+    )
+
+    effective_from = models.DateField(
+        verbose_name=_("Effective from"),
+    )
+
+    class Meta:
+        verbose_name = _("Exchange rate history")
+        verbose_name_plural = _("Exchange rate history")
+        constraints = [
+            # Its index finds the rate as of a date by scanning one pair's
+            # rates backwards from the date
+            models.UniqueConstraint(
+                fields=[
+                    "user",
+                    "source_currency",
+                    "destination_currency",
+                    "effective_from",
+                ],
+                name="unique_user_exchange_rate_history",
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.source_currency.code} to "
+            f"{self.destination_currency.code} "
+            f"from {self.effective_from}"
+        )
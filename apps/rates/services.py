@@ -0,0 +1,202 @@
+import bisect
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from apps.users.models import User
+
+from .constants import RATE_MATRIX_CACHE_KEY, RATE_MATRIX_CACHE_TIMEOUT
+from .models import ExchangeRate, ExchangeRateHistory
+
+RateMatrix = dict[tuple[str, str], Decimal]
+# Rates of currency pairs as lists of (effective from, rate) sorted by date,
+# rate is None since the pair was deleted
+RateHistory = dict[tuple[str, str], list[tuple[date, Decimal | None]]]
+
+
+def get_user_rates(user: User) -> RateMatrix:
+    """Get all user's exchange rates.
+
+    The rate matrix is memoized on the user instance for the rest of the
+    request and cached per user, so it is loaded from the database in one
+    query only after an invalidation.
+
+    Returns:
+        dict: rates mapped by (source currency code, destination currency
+        code) pairs.
+
+    """
+    if (rates := getattr(user, "cached_rate_matrix", None)) is not None:
+        return rates
+
+    cache_key = RATE_MATRIX_CACHE_KEY.format(user_id=user.pk)
+    rates = cache.get(cache_key)
+    if rates is None:
+        rates = {
+            (source, destination): rate
+            for source, destination, rate in ExchangeRate.objects.filter(
+                user=user,
+            ).values_list(
+                "source_currency__code",
+                "destination_currency__code",
+                "rate",
+            )
+        }
+        cache.set(cache_key, rates, RATE_MATRIX_CACHE_TIMEOUT)
+
+    user.cached_rate_matrix = rates
+    return rates
+
+
+def invalidate_user_rates(user: User) -> None:
+    """Drop cached rate matrix of user after their rates are changed.
+
+    The cache is dropped right away and once again after the transaction is
+    committed, so a concurrent request can't cache rates that are about to
+    change.
+
+    """
+    cache_key = RATE_MATRIX_CACHE_KEY.format(user_id=user.pk)
+    user.cached_rate_matrix = None
+    cache.delete(cache_key)
+    transaction.on_commit(lambda: cache.delete(cache_key))
+
+
+def get_rate(
+    rates: RateMatrix,
+    source_currency: str | None,
+    destination_currency: str,
+) -> Decimal:
+    """Get rate between two currencies from a loaded rate matrix.
+
+    Same currencies and pairs without a user's rate are converted 1:1.
+
+    """
+    return rates.get((source_currency, destination_currency), Decimal(1))
+
+
+def convert_amounts(
+    amounts: dict[str | None, Decimal],
+    rates: RateMatrix,
+    destination_currency: str,
+) -> Decimal:
+    """Convert amounts mapped by currency code and sum them up."""
+    return sum(
+        (
+            amount * get_rate(rates, currency, destination_currency)
+            for currency, amount in amounts.items()
+        ),
+        Decimal(0),
+    )
+
+
+def record_rate_history(exchange_rate: ExchangeRate) -> None:
+    """Make a saved exchange rate effective from today.
+
+    The first rate of a currency pair is effective for all past dates too,
+    so transactions made before the rate was added are converted with it
+    as well. Changes made on the same day replace each other.
+
+    """
+    pair_history = ExchangeRateHistory.objects.filter(
+        user_id=exchange_rate.user_id,
+        source_currency_id=exchange_rate.source_currency_id,
+        destination_currency_id=exchange_rate.destination_currency_id,
+    )
+    ExchangeRateHistory.objects.update_or_create(
+        user_id=exchange_rate.user_id,
+        source_currency_id=exchange_rate.source_currency_id,
+        destination_currency_id=exchange_rate.destination_currency_id,
+        effective_from=(
+            timezone.localdate() if pair_history.exists() else date.min
+        ),
+        defaults={"rate": exchange_rate.rate},
+    )
+
+
+def close_rate_history(exchange_rate: ExchangeRate) -> None:
+    """Make a deleted exchange rate's pair have no rate from today.
+
+    Dates before the deletion keep their rates, later ones are converted
+    1:1 like pairs missing in user's rate matrix.
+
+    """
+    ExchangeRateHistory.objects.update_or_create(
+        user_id=exchange_rate.user_id,
+        source_currency_id=exchange_rate.source_currency_id,
+        destination_currency_id=exchange_rate.destination_currency_id,
+        effective_from=timezone.localdate(),
+        defaults={"rate": None},
+    )
+
+
+def get_rate_as_of(
+    user_id: int,
+    source_currency: str | None,
+    destination_currency: str,
+    as_of: date,
+) -> Decimal:
+    """Get user's rate between two currencies effective on a date.
+
+    The rate is found in one query by the index of user's rate history.
+    Same currencies and pairs without a rate on the date (never added or
+    deleted by then) are converted 1:1.
+
+    """
+    if source_currency is None or source_currency == destination_currency:
+        return Decimal(1)
+    rate = ExchangeRateHistory.objects.filter(
+        user_id=user_id,
+        source_currency__code=source_currency,
+        destination_currency__code=destination_currency,
+        effective_from__lte=as_of,
+    ).order_by("-effective_from").values_list("rate", flat=True).first()
+    return Decimal(1) if rate is None else rate
+
+
+def get_user_rate_history(user: User) -> RateHistory:
+    """Get all user's exchange rate history in one query.
+
+    Returns:
+        dict: lists of (effective from, rate) sorted by date, mapped by
+        (source currency code, destination currency code) pairs.
+
+    """
+    history = defaultdict(list)
+    for source, destination, effective_from, rate in (
+        ExchangeRateHistory.objects.filter(user=user).order_by(
+            "effective_from",
+        ).values_list(
+            "source_currency__code",
+            "destination_currency__code",
+            "effective_from",
+            "rate",
+        )
+    ):
+        history[(source, destination)].append((effective_from, rate))
+    return dict(history)
+
+
+def get_historical_rate(
+    history: RateHistory,
+    source_currency: str | None,
+    destination_currency: str,
+    as_of: date,
+) -> Decimal:
+    """Get rate effective on a date from a loaded rate history.
+
+    Works like `get_rate_as_of` without querying the database.
+
+    """
+    pair_history = history.get((source_currency, destination_currency), [])
+    position = bisect.bisect_right(
+        pair_history,
+        as_of,
+        key=lambda entry: entry[0],
+    )
+    rate = pair_history[position - 1][1] if position else None
+    return Decimal(1) if rate is None else rate
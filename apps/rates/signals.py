@@ -0,0 +1,61 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.users.models import User
+
+from .models import ExchangeRate
+from .services import (
+    close_rate_history,
+    invalidate_user_rates,
+    record_rate_history,
+)
+
+
+@receiver(post_save, sender=ExchangeRate)
+def add_rate_to_history(
+    sender,
+    instance: ExchangeRate,
+    **kwargs,
+) -> None:
+    """Keep user's rate history in sync with a saved exchange rate."""
+    record_rate_history(instance)
+
+
+@receiver(post_delete, sender=ExchangeRate)
+def close_deleted_rate_history(
+    sender,
+    instance: ExchangeRate,
+    origin=None,
+    **kwargs,
+) -> None:
+    """End user's rate history of a deleted exchange rate's pair.
+
+    Skipped when rates are deleted with their user or currency, which
+    deletes their history as well.
+
+    """
+    if isinstance(origin, sender) or (
+        isinstance(origin, QuerySet) and origin.model is sender
+    ):
+        close_rate_history(instance)
+
+
+@receiver(post_save, sender=ExchangeRate)
+@receiver(post_delete, sender=ExchangeRate)
+def invalidate_owner_rates(
+    sender,
+    instance: ExchangeRate,
+    **kwargs,
+) -> None:
+    """Drop cached rate matrix of the owner of a changed exchange rate.
+
+    The owner loaded with the rate gets its memoized matrix dropped too,
+    otherwise the owner isn't loaded just to be invalidated.
+
+    """
+    user = (
+        instance.user if sender.user.is_cached(instance)
+        else User(pk=instance.user_id)
+    )
+    invalidate_user_rates(user)
@@ -0,0 +1,58 @@
+from itertools import permutations
+from typing import Callable
+
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+import pytest
+
+from apps.rates.factories import ExchangeRateFactory
+from apps.rates.models import Currency
+from apps.users.models import User
+
+
+@pytest.fixture
+def add_exchange_rates(normal_user: User) -> Callable[[int], None]:
+    """Return function adding exchange rates of new currency pairs."""
+    currency_pairs = permutations(Currency.objects.all()[:4], 2)
+
+    def add_rates(count: int) -> None:
+        for _ in range(count):
+            source_currency, destination_currency = next(currency_pairs)
+            ExchangeRateFactory(
+                user=normal_user,
+                source_currency=source_currency,
+                destination_currency=destination_currency,
+            )
+
+    return add_rates
+
+
+def test_exchange_rate_list_api_queries_count(
+    api_client: APIClient,
+    add_exchange_rates: Callable[[int], None],
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure exchange rate list api doesn't make queries per rate."""
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:exchange-rate-list"),
+        add_exchange_rates,
+    )
+
+
+def test_exchange_rate_detail_api_queries_count(
+    api_client: APIClient,
+    normal_user: User,
+    add_exchange_rates: Callable[[int], None],
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure exchange rate detail api doesn't depend on number of rates."""
+    add_exchange_rates(1)
+    exchange_rate = normal_user.exchangerate_set.get()
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:exchange-rate-detail", kwargs={"pk": exchange_rate.pk}),
+        add_exchange_rates,
+    )
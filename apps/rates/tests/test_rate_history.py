@@ -0,0 +1,243 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+import pytest
+
+from apps.rates.factories import ExchangeRateFactory
+from apps.rates.models import Currency, ExchangeRate, ExchangeRateHistory
+from apps.rates.services import (
+    get_historical_rate,
+    get_rate_as_of,
+    get_user_rate_history,
+)
+from apps.transactions.factories import WalletFactory
+from apps.transactions.models import Category, Transaction, Wallet
+from apps.transactions.services import import_transactions
+from apps.users.models import User
+
+
+@pytest.fixture
+def wallet_rate(
+    normal_user: User,
+    first_currency: Currency,
+    last_currency: Currency,
+) -> ExchangeRate:
+    """Create a rate from wallet's currency to user's default one."""
+    return ExchangeRateFactory(
+        user=normal_user,
+        source_currency=last_currency,
+        destination_currency=first_currency,
+        rate=Decimal(2),
+    )
+
+
+@pytest.fixture
+def foreign_wallet(normal_user: User, last_currency: Currency) -> Wallet:
+    """Create a wallet in a currency other than user's default one."""
+    return WalletFactory(
+        user=normal_user,
+        currency=last_currency,
+        balance=Decimal(100),
+    )
+
+
+@pytest.fixture
+def expense_category() -> Category:
+    """Return a default expense category."""
+    return Category.objects.filter(user__isnull=True, is_income=False).first()
+
+
+def test_first_rate_applies_to_past_dates(
+    normal_user: User,
+    wallet_rate: ExchangeRate,
+) -> None:
+    """Ensure the first rate of a pair is effective for all dates."""
+    assert get_rate_as_of(
+        normal_user.pk,
+        wallet_rate.source_currency.code,
+        wallet_rate.destination_currency.code,
+        date(2000, 1, 1),
+    ) == Decimal(2)
+
+
+def test_rate_change_keeps_previous_rate(
+    normal_user: User,
+    wallet_rate: ExchangeRate,
+    django_assert_num_queries,
+) -> None:
+    """Ensure changing a rate doesn't affect dates before the change."""
+    wallet_rate.rate = Decimal(4)
+    wallet_rate.save()
+    today = timezone.localdate()
+    pair = (
+        wallet_rate.source_currency.code,
+        wallet_rate.destination_currency.code,
+    )
+
+    assert ExchangeRateHistory.objects.filter(user=normal_user).count() == 2
+    with django_assert_num_queries(1):
+        assert get_rate_as_of(
+            normal_user.pk,
+            *pair,
+            today - timedelta(days=1),
+        ) == Decimal(2)
+    assert get_rate_as_of(normal_user.pk, *pair, today) == Decimal(4)
+
+
+def test_transaction_is_reverted_with_applied_rate(
+    api_client: APIClient,
+    wallet_rate: ExchangeRate,
+    foreign_wallet: Wallet,
+    expense_category: Category,
+) -> None:
+    """Ensure deleting a transaction restores balance after a rate change."""
+    api_client.post(
+        reverse("v1:transaction-list"),
+        {
+            "amount": Decimal(10),
+            "category": expense_category.pk,
+            "wallet": foreign_wallet.pk,
+            "date": timezone.localdate(),
+        },
+    )
+    transaction = Transaction.objects.get(wallet=foreign_wallet)
+    foreign_wallet.refresh_from_db()
+
+    assert transaction.applied_rate == Decimal(2)
+    assert foreign_wallet.balance == Decimal(95)
+
+    wallet_rate.rate = Decimal(4)
+    wallet_rate.save()
+    api_client.delete(
+        reverse("v1:transaction-detail", kwargs={"pk": transaction.pk}),
+    )
+    foreign_wallet.refresh_from_db()
+
+    assert foreign_wallet.balance == Decimal(100)
+
+
+def test_deleted_rate_is_not_applied_after_deletion(
+    normal_user: User,
+    wallet_rate: ExchangeRate,
+) -> None:
+    """Ensure a deleted pair keeps its rate only for earlier dates."""
+    wallet_rate.delete()
+    today = timezone.localdate()
+    pair = (
+        wallet_rate.source_currency.code,
+        wallet_rate.destination_currency.code,
+    )
+
+    assert get_rate_as_of(normal_user.pk, *pair, today) == Decimal(1)
+    assert get_rate_as_of(
+        normal_user.pk,
+        *pair,
+        today - timedelta(days=1),
+    ) == Decimal(2)
+    assert get_historical_rate(
+        get_user_rate_history(normal_user),
+        *pair,
+        today,
+    ) == Decimal(1)
+
+
+@pytest.fixture
+def backdated_expense_data(
+    wallet_rate: ExchangeRate,
+    foreign_wallet: Wallet,
+    expense_category: Category,
+) -> dict[str, Any]:
+    """Return data of an expense made before the wallet's rate has changed.
+
+    With today's rate the wallet seems to cover the amount, but the rate of
+    yesterday applied to the wallet would overdraw it.
+
+    """
+    wallet_rate.rate = Decimal(4)
+    wallet_rate.save()
+    return {
+        "amount": Decimal(300),
+        "category": expense_category.pk,
+        "wallet": foreign_wallet.pk,
+        "date": timezone.localdate() - timedelta(days=1),
+        "note": "",
+        "is_shared": False,
+    }
+
+
+def test_backdated_expense_api_is_checked_with_applied_rate(
+    api_client: APIClient,
+    foreign_wallet: Wallet,
+    backdated_expense_data: dict[str, Any],
+) -> None:
+    """Ensure API balance check uses the rate of transaction's date."""
+    response = api_client.post(
+        reverse("v1:transaction-list"),
+        backdated_expense_data,
+    )
+    foreign_wallet.refresh_from_db()
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert foreign_wallet.balance == Decimal(100)
+
+
+def test_backdated_expense_view_is_checked_with_applied_rate(
+    auth_client: Client,
+    foreign_wallet: Wallet,
+    backdated_expense_data: dict[str, Any],
+) -> None:
+    """Ensure form balance check uses the rate of transaction's date."""
+    response = auth_client.post(
+        reverse("transaction-create"),
+        backdated_expense_data,
+    )
+    foreign_wallet.refresh_from_db()
+
+    assert response.status_code == 200
+    assert not Transaction.objects.filter(wallet=foreign_wallet).exists()
+    assert foreign_wallet.balance == Decimal(100)
+
+
+def test_imported_transactions_get_rate_of_their_date(
+    normal_user: User,
+    wallet_rate: ExchangeRate,
+    foreign_wallet: Wallet,
+    expense_category: Category,
+) -> None:
+    """Ensure imported transactions get the rate effective on their dates."""
+    wallet_rate.rate = Decimal(4)
+    wallet_rate.save()
+    today = timezone.localdate()
+
+    import_transactions(
+        normal_user,
+        foreign_wallet,
+        [
+            {
+                "date": today - timedelta(days=1),
+                "amount": "10",
+                "category": expense_category.name,
+            },
+            {
+                "date": today,
+                "amount": "20",
+                "category": expense_category.name,
+            },
+        ],
+    )
+    foreign_wallet.refresh_from_db()
+
+    assert list(
+        Transaction.objects.filter(wallet=foreign_wallet).order_by(
+            "date",
+        ).values_list("applied_rate", flat=True),
+    ) == [Decimal(2), Decimal(4)]
+    assert foreign_wallet.balance == Decimal(90)
@@ -0,0 +1,72 @@
+from decimal import Decimal
+from typing import Any
+
+from django.test import Client
+from django.urls import reverse
+
+from apps.rates.models import ExchangeRate
+from apps.rates.services import get_user_rates
+from apps.users.models import User
+
+
+def test_user_rates_are_cached(
+    normal_user: User,
+    exchange_rate: ExchangeRate,
+    django_assert_num_queries,
+) -> None:
+    """Ensure that rate matrix is loaded from the database only once."""
+    with django_assert_num_queries(1):
+        rates = get_user_rates(normal_user)
+
+    fresh_user = User.objects.get(pk=normal_user.pk)
+    with django_assert_num_queries(0):
+        assert get_user_rates(fresh_user) == rates
+
+    pair = (
+        exchange_rate.source_currency.code,
+        exchange_rate.destination_currency.code,
+    )
+    assert rates[pair] == exchange_rate.rate
+
+
+def test_user_rates_cache_invalidation(
+    normal_user: User,
+    auth_client: Client,
+    exchange_rate_valid_data: dict[str, Any],
+) -> None:
+    """Ensure that creating a rate drops the cached rate matrix."""
+    assert get_user_rates(User.objects.get(pk=normal_user.pk)) == {}
+
+    response = auth_client.post(
+        reverse("rate-create"),
+        exchange_rate_valid_data,
+    )
+    assert response.status_code == 302
+
+    rates = get_user_rates(User.objects.get(pk=normal_user.pk))
+    assert len(rates) == 2
+
+
+def test_user_rates_cache_invalidated_by_model_changes(
+    normal_user: User,
+    exchange_rate: ExchangeRate,
+) -> None:
+    """Ensure rates changed or deleted outside of forms drop the cache."""
+    fresh_user = User.objects.get(pk=normal_user.pk)
+    pair = (
+        exchange_rate.source_currency.code,
+        exchange_rate.destination_currency.code,
+    )
+    assert pair in get_user_rates(fresh_user)
+
+    rate = ExchangeRate.objects.get(pk=exchange_rate.pk)
+    rate.rate = Decimal(3)
+    rate.save()
+
+    assert get_user_rates(User.objects.get(pk=normal_user.pk))[pair] == (
+        Decimal(3)
+    )
+
+    rate.delete()
+
+    assert get_user_rates(User.objects.get(pk=normal_user.pk)) == {}
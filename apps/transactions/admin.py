@@ -10,9 +10,17 @@ from django_object_actions import (
     takes_instance_or_queryset,
 )
 
-from apps.core.admin import BaseAdmin
-
-from .models import Bank, SharedBill, Transaction, Wallet
+from apps.core.admin import BaseAdmin, ReadOnlyAdmin
+
+from .models import (
+    Bank,
+    DailySpending,
+    SharedBill,
+    Transaction,
+    Wallet,
+    WeeklyReport,
+)
+from .services import invalidate_home_page, update_wallet_balance
 
 
 class SharedBillInline(admin.TabularInline):
@@ -95,7 +103,12 @@ class WalletAdmin(DjangoObjectActions, BaseAdmin):
         request: HttpRequest,
         queryset: QuerySet,
     ) -> HttpResponseRedirect | HttpResponse:
-        """Create action to modify Wallet's balance."""
+        """Create action to modify Wallet's balance.
+
+        Balance is increased and decreased with an update that sends no
+        signals, so owners' cached home pages are invalidated explicitly.
+
+        """
 
         def get_wallet_balance(request_data, wallet_pk) -> Decimal:
             """Get wallet balance from form."""
@@ -116,7 +129,8 @@ class WalletAdmin(DjangoObjectActions, BaseAdmin):
         if "add" in request.POST:
             for wallet in queryset:
                 balance = get_wallet_balance(request.POST, wallet.pk)
-                wallet.set_balance(wallet.balance + Decimal(balance))
+                update_wallet_balance(wallet.pk, Decimal(balance))
+                invalidate_home_page(wallet.user_id)
 
             self.message_user(
                 request,
@@ -129,7 +143,8 @@ class WalletAdmin(DjangoObjectActions, BaseAdmin):
         if "reduce" in request.POST:
             for wallet in queryset:
                 balance = get_wallet_balance(request.POST, wallet.pk)
-                wallet.set_balance(wallet.balance - Decimal(balance))
+                update_wallet_balance(wallet.pk, -Decimal(balance))
+                invalidate_home_page(wallet.user_id)
 
             self.message_user(
                 request,
@@ -175,3 +190,29 @@ class SharedBillAdmin(BaseAdmin):
     list_display = ("id", "transaction", "friend")
     list_display_links = ("id", "transaction", "friend")
     search_fields = ("id", "transaction", "friend")
+
+
+@admin.register(DailySpending)
+class DailySpendingAdmin(ReadOnlyAdmin):
+    """Provide read-only Admin UI for DailySpending model."""
+
+    ordering = ("-date",)
+    list_display = ("user", "date", "category", "amount", "count")
+    list_display_links = ("user", "date", "category")
+    search_fields = ("user__username", "category__name")
+
+
+@admin.register(WeeklyReport)
+class WeeklyReportAdmin(ReadOnlyAdmin):
+    """Provide read-only Admin UI for stored weekly report snapshots."""
+
+    ordering = ("-end_date",)
+    list_display = (
+        "start_date",
+        "end_date",
+        "transactions_count",
+        "categories_count",
+        "active_users_count",
+        "new_users_count",
+    )
+    list_display_links = ("start_date", "end_date")
@@ -1,14 +1,20 @@
 from apps.core.api.serializers import ModelBaseSerializer
 from apps.core.exceptions import NonFieldValidationError
 from apps.transactions.api.transactions.serializers import (
-    TransactionSerializer,
+    TransactionsSummarySerializer,
 )
 from apps.transactions.models import Category
 from apps.transactions.services import can_create_more_category
 
 
-class CategoryListSerializer(ModelBaseSerializer):
-    """Serializer for Category list API."""
+class CategorySerializer(TransactionsSummarySerializer, ModelBaseSerializer):
+    """Serializer for Category API.
+
+    Only summary of user's transactions of the category is included, the
+    transactions are available in the paginated
+    `categories/{id}/transactions/` API.
+
+    """
 
     def create(self, validated_data):
         """Create new category for authenticated user.
@@ -52,23 +58,11 @@ class CategoryListSerializer(ModelBaseSerializer):
             "name",
             "is_income",
             "user",
+            "transactions_count",
+            "transactions_amount",
+            "last_transaction_date",
         )
         read_only_fields = (
             "id",
             "user",
         )
-
-
-class CategoryDetailSerializer(CategoryListSerializer):
-    """Serializer for Category detail API.
-
-    Add 'transactions' field to the response.
-
-    """
-
-    transactions = TransactionSerializer(many=True, read_only=True)
-
-    class Meta(CategoryListSerializer.Meta):
-        """Add transactions field to the detail API's response."""
-
-        fields = CategoryListSerializer.Meta.fields + ("transactions",)
@@ -1,12 +1,22 @@
-from django.db.models import Prefetch, Q
+from django.db.models import Q
 
 from rest_framework import mixins
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
 
 from apps.core.api.mixins import UpdateModelWithoutPatchMixin
 from apps.core.api.views import BaseViewSet
+from apps.transactions.api.transactions.mixins import (
+    TransactionsSubResourceMixin,
+)
+from apps.transactions.api.transactions.serializers import (
+    TransactionSerializer,
+)
 from apps.transactions.models import Category
+from apps.transactions.services import annotate_transactions_summary
 
-from .serializers import CategoryDetailSerializer, CategoryListSerializer
+from .serializers import CategorySerializer
 
 
 class CategoryViewSet(
@@ -14,31 +24,33 @@ class CategoryViewSet(
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
     UpdateModelWithoutPatchMixin,
+    TransactionsSubResourceMixin,
     BaseViewSet,
 ):
     """View set for Category model."""
 
-    serializer_class = CategoryListSerializer
+    serializer_class = CategorySerializer
+    serializers_map = {
+        "transactions": TransactionSerializer,
+    }
     ordering_fields = ("name", "balance")
     search_fields = ("name",)
     queryset = Category.objects.all()
-    serializers_map = {
-        "list": CategoryListSerializer,
-        "retrieve": CategoryDetailSerializer,
-        "default": CategoryListSerializer,
-    }
 
     def get_queryset(self):
-        """Return all categories for the authenticated user."""
-        qs = super().get_queryset().filter(
+        """Return all categories for the authenticated user.
+
+        Categories are annotated with summary of user's transactions.
+
+        """
+        queryset = super().get_queryset().filter(
             Q(user=self.request.user) | Q(user__isnull=True),
         )
-        if self.action == "list":
-            return qs
-        return qs.prefetch_related(
-            Prefetch(
-                "transaction_set",
-                queryset=self.request.user.transaction_set.all(),
-                to_attr="transactions",
-            ),
-        )
+        if self.action == "transactions":
+            return queryset
+        return annotate_transactions_summary(queryset, self.request.user)
+
+    @action(methods=["get"], detail=True)
+    def transactions(self, request: Request, pk: str) -> Response:
+        """List filtered and paginated user's transactions of the category."""
+        return self.list_transactions(self.get_object().transaction_set.all())
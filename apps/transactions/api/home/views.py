@@ -1,4 +1,6 @@
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
 from rest_framework import permissions, status
 from rest_framework.generics import GenericAPIView
@@ -7,11 +9,12 @@ from rest_framework.response import Response
 
 from apps.transactions.constants import HOME_PAGE_STATS
 from apps.transactions.services import (
+    get_cached_home_page_data,
+    get_home_page_etag,
+    get_home_page_modified,
     get_period,
+    get_period_spending_stats,
     get_recent_transactions,
-    get_top_spending,
-    get_total_spending,
-    get_transactions_by_period,
     get_user_excluding_currencies,
     get_user_total_balance_by_currencies,
 )
@@ -19,6 +22,11 @@ from apps.transactions.services import (
 from .serializers import HomeSerializer
 
 
+def get_tab(request: Request) -> str:
+    """Return home page tab chosen in request."""
+    return request.GET.get("tab", HOME_PAGE_STATS["default_tab"])
+
+
 class HomeView(GenericAPIView):
     """Provide API view for home page.
 
@@ -30,13 +38,42 @@ class HomeView(GenericAPIView):
         - Percentage compared to last month/week
         - Recent transactions
 
+    Serialized data is cached per user and tab until user's transactions,
+    wallets, categories, rates or profile are changed. Responses have ETag
+    and Last-Modified of the cached data, so conditional requests are
+    answered with 304 without computing anything.
+
     """
 
     permission_classes = (permissions.IsAuthenticated,)
     serializer_class = HomeSerializer
 
+    @method_decorator(
+        condition(
+            etag_func=lambda request: get_home_page_etag(
+                request.user.pk,
+                "api",
+                get_tab(request),
+            ),
+            last_modified_func=lambda request: get_home_page_modified(
+                request.user.pk,
+            ),
+        ),
+    )
     def get(self, request: Request, *args, **kwargs) -> Response:
         """Retrieve business-required information for home page view."""
+        return Response(
+            get_cached_home_page_data(
+                request.user.pk,
+                "api",
+                get_tab(request),
+                lambda: self.get_homepage_data(request),
+            ),
+            status=status.HTTP_200_OK,
+        )
+
+    def get_homepage_data(self, request: Request) -> dict:
+        """Compute serialized information for home page."""
         homepage_data = {}
         homepage_data["excluding_currencies"] = get_user_excluding_currencies(
             request.user,
@@ -48,45 +85,20 @@ class HomeView(GenericAPIView):
             request.user,
             HOME_PAGE_STATS["num_recent_transactions"],
         )
-        homepage_data["tab"] = request.GET.get(
-            "tab",
-            HOME_PAGE_STATS["default_tab"],
-        )
+        homepage_data["tab"] = get_tab(request)
 
         now = timezone.now()
         begin_period, begin_prev_period = get_period(
             now,
             homepage_data["tab"],
         )
-        transactions = get_transactions_by_period(
-            request.user,
-            begin_period,
-            now,
-        )
-        total_period = get_total_spending(transactions)
-        prev_transactions = get_transactions_by_period(
-            request.user,
-            begin_prev_period,
-            begin_period - timezone.timedelta(days=1),
-        )
-        total_prev_period = get_total_spending(prev_transactions)
-
-        homepage_data["total_period"] = total_period
-        homepage_data["total_prev_period"] = total_prev_period
-        homepage_data["top_spending"] = get_top_spending(
-            transactions,
-            total_period,
-            HOME_PAGE_STATS["num_top_spending"],
+        homepage_data.update(
+            get_period_spending_stats(
+                request.user,
+                begin_prev_period,
+                begin_period,
+                now,
+            ),
         )
 
-        if total_prev_period == 0:
-            homepage_data["stats"] = 100
-        else:
-            stats = (total_period - total_prev_period) / total_prev_period
-            stats_percent = stats * 100
-            homepage_data["stats"] = round(stats_percent)
-
-        return Response(
-            HomeSerializer(homepage_data).data,
-            status=status.HTTP_200_OK,
-        )
+        return HomeSerializer(homepage_data).data
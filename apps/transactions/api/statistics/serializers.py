@@ -0,0 +1,66 @@
+from datetime import date
+from typing import Any
+
+from django.utils import timezone
+
+from rest_framework import serializers
+
+from apps.core.api.serializers import BaseSerializer
+from apps.transactions.constants import MONTHLY_STATISTICS
+
+MONTH_FORMAT = "%Y-%m"
+
+
+# pylint: disable=abstract-method
+class MonthlyStatisticsQuerySerializer(BaseSerializer):
+    """Serializer for query params of monthly statistics API.
+
+    Months are given as `YYYY-MM`, the last `default_months_count` months
+    are used by default.
+
+    """
+
+    start_month = serializers.DateField(
+        input_formats=[MONTH_FORMAT],
+        required=False,
+    )
+    end_month = serializers.DateField(
+        input_formats=[MONTH_FORMAT],
+        required=False,
+    )
+    group_by = serializers.ChoiceField(
+        choices=MONTHLY_STATISTICS["group_by_choices"],
+        required=False,
+    )
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Fill default range of months and check its order."""
+        attrs.setdefault(
+            "end_month",
+            timezone.localdate().replace(day=1),
+        )
+        if "start_month" not in attrs:
+            end_month = attrs["end_month"]
+            year, month = divmod(
+                end_month.year * 12 + end_month.month
+                - MONTHLY_STATISTICS["default_months_count"],
+                12,
+            )
+            attrs["start_month"] = date(year, month + 1, 1)
+        if attrs["start_month"] > attrs["end_month"]:
+            raise serializers.ValidationError(
+                {"start_month": "Start month must not be after end month."},
+            )
+        return super().validate(attrs)
+
+
+# pylint: disable=abstract-method
+class MonthlyStatisticsSerializer(serializers.Serializer):
+    """Serializer for income and expense of a month."""
+
+    month = serializers.DateField(format=MONTH_FORMAT)
+    category = serializers.IntegerField(required=False)
+    wallet = serializers.IntegerField(required=False)
+    income = serializers.DecimalField(max_digits=20, decimal_places=3)
+    expense = serializers.DecimalField(max_digits=20, decimal_places=3)
+    transactions_count = serializers.IntegerField()
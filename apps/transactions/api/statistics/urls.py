@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import MonthlyStatisticsView
+
+urlpatterns = [
+    path("", MonthlyStatisticsView.as_view(), name="monthly-statistics"),
+]
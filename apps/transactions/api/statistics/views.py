@@ -0,0 +1,44 @@
+from rest_framework import permissions, status
+from rest_framework.generics import GenericAPIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from apps.transactions.services import get_monthly_statistics
+
+from .serializers import (
+    MonthlyStatisticsQuerySerializer,
+    MonthlyStatisticsSerializer,
+)
+
+
+class MonthlyStatisticsView(GenericAPIView):
+    """Provide API view for monthly income and expense statistics.
+
+    Statistics are grouped by month and optionally by category or wallet,
+    amounts are in user's default currency. They are read from a view
+    refreshed every hour, so the latest transactions may be missing.
+
+    """
+
+    permission_classes = (permissions.IsAuthenticated,)
+    serializer_class = MonthlyStatisticsSerializer
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        """Retrieve user's statistics for the range of months."""
+        query_serializer = MonthlyStatisticsQuerySerializer(
+            data=request.query_params,
+            context=self.get_serializer_context(),
+        )
+        query_serializer.is_valid(raise_exception=True)
+
+        statistics = get_monthly_statistics(
+            user=request.user,
+            **query_serializer.validated_data,
+        )
+        return Response(
+            {
+                "currency": request.user.default_currency,
+                "results": self.get_serializer(statistics, many=True).data,
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,54 @@
+from django.db.models import QuerySet
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from libs.api.pagination import LimitOffsetOrKeysetPagination
+
+from apps.transactions.filters import TransactionFilter
+
+from .serializers import TransactionSerializer
+
+
+class TransactionsSubResourceMixin:
+    """Mixin which lists transactions of viewset's object.
+
+    Transactions are filtered with `TransactionFilter` and paginated like
+    the transaction list API, including the keyset mode.
+    Examples:
+        class WalletViewSet(TransactionsSubResourceMixin, BaseViewSet):
+
+            @action(methods=["get"], detail=True)
+            def transactions(self, request, pk=None):
+                return self.list_transactions(
+                    self.get_object().transaction_set.all(),
+                )
+
+    """
+
+    keyset_ordering = ("-date", "-id")
+
+    def list_transactions(self, queryset: QuerySet) -> Response:
+        """Return filtered page of transactions from queryset."""
+        filterset = TransactionFilter(
+            self.request.query_params,
+            queryset=queryset.filter(user=self.request.user),
+            request=self.request,
+        )
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        paginator = LimitOffsetOrKeysetPagination()
+        page = paginator.paginate_queryset(
+            filterset.qs.select_related("user").prefetch_related(
+                "user__friends",
+            ).order_by(*self.keyset_ordering),
+            self.request,
+            view=self,
+        )
+        serializer = TransactionSerializer(
+            page,
+            many=True,
+            context=self.get_serializer_context(),
+        )
+        return paginator.get_paginated_response(serializer.data)
@@ -1,14 +1,14 @@
-from decimal import Decimal
+import os
 
 from django.utils import timezone
 
+from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
-from apps.core.api.serializers import ModelBaseSerializer
-from apps.rates.models import ExchangeRate
-from apps.transactions.constants import PREMIUM_USER
-from apps.transactions.models import Transaction
-from apps.transactions.services import count_streak
+from apps.core.api.serializers import BaseSerializer, ModelBaseSerializer
+from apps.rates.services import get_rate_as_of
+from apps.transactions.constants import TRANSACTION_IMPORT_FORMATS
+from apps.transactions.models import Transaction, Wallet
 from apps.users.api.serializers import UserSerializer
 
 
@@ -16,13 +16,15 @@ class TransactionSerializer(ModelBaseSerializer):
     """Provide Serializer class for Transaction model."""
 
     user = UserSerializer(read_only=True)
+    wallet = serializers.PrimaryKeyRelatedField(
+        queryset=Wallet.objects.select_related("currency"),
+    )
 
     def validate(self, attrs: dict) -> dict:
         """Validate transaction data before create or update.
 
         Restrict user from entering an amount that is greater than the wallet's
-        balance. Hence, check if current user is qualified to become premium
-        user.
+        balance converted with the rate effective on transaction's date.
 
         """
         attrs = super().validate(attrs)
@@ -30,37 +32,18 @@ class TransactionSerializer(ModelBaseSerializer):
         amount = attrs["amount"]
         category = attrs["category"]
         wallet = attrs["wallet"]
-        rate_obj = ExchangeRate.objects.filter(
-            user=self._request.user,
-            source_currency=wallet.currency,
-            destination_currency__code=self._request.user.default_currency,
-        ).first()
-
-        rate = rate_obj.rate if rate_obj else Decimal(1)
+        rate = get_rate_as_of(
+            self._request.user.pk,
+            wallet.currency.code if wallet.currency else None,
+            self._request.user.default_currency,
+            attrs.get("date", timezone.localdate()),
+        )
 
         if not category.is_income and amount > wallet.balance * rate:
             raise ValidationError(
                 "Amount cannot be greater than wallet's balance",
             )
 
-        if self._request.user.is_premium:
-            return attrs
-
-        today = timezone.now()
-        transaction_dates = Transaction.objects.filter(
-            user=self._request.user,
-            date__lte=today,
-        ).order_by("date").values("date")
-        transaction_count = transaction_dates.count()
-        transaction_streak = count_streak(transaction_dates.distinct())
-
-        if (
-            transaction_count >= PREMIUM_USER["transaction_count"] - 1 and
-            transaction_streak >= PREMIUM_USER["transaction_streak"] - 1
-        ):
-            self._request.user.is_premium = True
-            self._request.user.save()
-
         return attrs
 
     class Meta:
@@ -75,3 +58,66 @@ class TransactionSerializer(ModelBaseSerializer):
             "is_shared",
         )
         read_only_fields = ("id", "user")
+
+
+# pylint: disable=abstract-method
+class TransactionsSummarySerializer(serializers.Serializer):
+    """Serializer fields with summary of user's transactions.
+
+    Values are annotated by `annotate_transactions_summary` service, objects
+    without annotations (e.g. just created) have no transactions yet.
+
+    """
+
+    transactions_count = serializers.IntegerField(read_only=True, default=0)
+    transactions_amount = serializers.DecimalField(
+        max_digits=20,
+        decimal_places=3,
+        read_only=True,
+        default=0,
+    )
+    last_transaction_date = serializers.DateField(
+        read_only=True,
+        default=None,
+    )
+
+
+class TransactionImportSerializer(BaseSerializer):
+    """Provide Serializer class for importing transactions from a file.
+
+    File format is detected by file's extension if it's not provided.
+
+    """
+
+    file = serializers.FileField()
+    wallet = serializers.PrimaryKeyRelatedField(
+        queryset=Wallet.objects.select_related("currency"),
+    )
+    file_format = serializers.ChoiceField(
+        choices=TRANSACTION_IMPORT_FORMATS,
+        required=False,
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Restrict wallets to the current user's ones.
+
+        Wallets are filtered by user's pk, so schema generation with an
+        anonymous user gets no wallets instead of an error.
+
+        """
+        super().__init__(*args, **kwargs)
+        wallet_field = self.fields["wallet"]
+        wallet_field.queryset = wallet_field.queryset.filter(
+            user_id=getattr(self._user, "pk", None),
+        )
+
+    def validate(self, attrs: dict) -> dict:
+        """Detect file format from file's extension if it's not set."""
+        if "file_format" not in attrs:
+            extension = os.path.splitext(attrs["file"].name)[1]
+            attrs["file_format"] = extension.lstrip(".").lower()
+        if attrs["file_format"] not in TRANSACTION_IMPORT_FORMATS:
+            raise ValidationError(
+                {"file_format": "Unsupported file format."},
+            )
+        return attrs
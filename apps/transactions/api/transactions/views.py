@@ -1,14 +1,32 @@
+import csv
+
 from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 
 from rest_framework import mixins, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from libs.api.pagination import LimitOffsetOrKeysetPagination
+
 from apps.core.api.mixins import UpdateModelWithoutPatchMixin
 from apps.core.api.views import BaseViewSet
+from apps.transactions.constants import (
+    TRANSACTION_EXPORT_CONTENT_TYPES,
+    TRANSACTION_SEARCH_CONFIG,
+)
+from apps.transactions.filters import TransactionFilter
 from apps.transactions.models import Transaction
+from apps.transactions.services import (
+    export_transactions,
+    import_transactions,
+    read_transactions,
+)
 
-from .serializers import TransactionSerializer
+from .serializers import TransactionImportSerializer, TransactionSerializer
 
 
 class TransactionViewSet(
@@ -22,20 +40,30 @@ class TransactionViewSet(
     """Provide API ViewSet for Transaction model."""
 
     serializer_class = TransactionSerializer
+    serializers_map = {
+        "import_transactions": TransactionImportSerializer,
+    }
     queryset = Transaction.objects.all()
+    filterset_class = TransactionFilter
+    pagination_class = LimitOffsetOrKeysetPagination
+    keyset_ordering = ("-date", "-id")
+    select_related_map = {
+        "list": ("user",),
+        "retrieve": ("user",),
+    }
+    prefetch_related_map = {
+        "list": ("user__friends",),
+        "retrieve": ("user__friends",),
+    }
     ordering_fields = ("amount", "date")
-    search_fields = (
-        "amount",
-        "date",
-        "category",
-        "wallet",
-        "note",
-        "is_shared",
-    )
+    # Searched with the indexed search vector of these fields
+    search_fields = ("note", "category__name")
+    search_vector_field = "search_vector"
+    search_config = TRANSACTION_SEARCH_CONFIG
 
     def get_queryset(self) -> QuerySet:
         """Return transactions only from current authenticated user."""
-        return Transaction.objects.filter(
+        return super().get_queryset().filter(
             user=self.request.user,
         ).order_by("-date")
 
@@ -53,3 +81,49 @@ class TransactionViewSet(
             status=status.HTTP_201_CREATED,
             headers=headers,
         )
+
+    @action(methods=["post"], detail=False, url_path="import")
+    def import_transactions(self, request: Request) -> Response:
+        """Import transactions from a CSV or OFX file into a wallet.
+
+        Invalid rows are skipped and reported with their row numbers.
+
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = import_transactions(
+                user=request.user,
+                wallet=serializer.validated_data["wallet"],
+                rows=read_transactions(
+                    serializer.validated_data["file"],
+                    serializer.validated_data["file_format"],
+                ),
+            )
+        except (csv.Error, UnicodeDecodeError) as error:
+            raise ValidationError({"file": str(error)}) from error
+        return Response(result, status=status.HTTP_200_OK)
+
+    @action(methods=["get"], detail=False)
+    def export(self, request: Request) -> StreamingHttpResponse:
+        """Stream all filtered transactions as a CSV or JSON Lines file.
+
+        The format is chosen by `file_format` query parameter, CSV by
+        default. Rows are read with a server-side cursor, so memory usage
+        doesn't depend on the number of transactions.
+
+        """
+        file_format = request.query_params.get("file_format", "csv")
+        if file_format not in TRANSACTION_EXPORT_CONTENT_TYPES:
+            raise ValidationError({"file_format": "Unsupported file format."})
+
+        queryset = self.filter_queryset(self.get_queryset())
+        filename = f"transactions-{timezone.now().date()}.{file_format}"
+        return StreamingHttpResponse(
+            export_transactions(queryset, file_format),
+            content_type=TRANSACTION_EXPORT_CONTENT_TYPES[file_format],
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+            },
+        )
@@ -2,37 +2,34 @@ from typing import Any
 
 from apps.core.api.serializers import ModelBaseSerializer
 from apps.core.exceptions import NonFieldValidationError
-from apps.rates.models import ExchangeRate
+from apps.rates.services import get_user_rates
 from apps.transactions.api.transactions.serializers import (
-    TransactionSerializer,
+    TransactionsSummarySerializer,
 )
 from apps.transactions.models import Wallet
 from apps.transactions.services import can_create_more_wallets
 
 
-class WalletSerializer(ModelBaseSerializer):
-    """Serializer for representing `Wallet`."""
+class WalletSerializer(TransactionsSummarySerializer, ModelBaseSerializer):
+    """Serializer for representing `Wallet`.
 
-    transactions = TransactionSerializer(
-        source="transaction_set",
-        many=True,
-        read_only=True,
-    )
+    Wallet's transactions are available in the paginated
+    `wallets/{id}/transactions/` API, only their summary is included.
+
+    """
 
     def validate(self, attrs: dict) -> dict:
         """Validate that there is an exchange rate for the currency."""
+        user = self.context["request"].user
         if (
             "currency" in attrs and
-            attrs["currency"].code != (
-                self.context["request"].user.default_currency
-            )
+            attrs["currency"].code != user.default_currency
         ):
-            if not ExchangeRate.objects.filter(
-                source_currency=attrs["currency"],
-                destination_currency__code=(
-                    self.context["request"].user.default_currency
-                ),
-            ).exists():
+            exchange_rate_pair = (
+                attrs["currency"].code,
+                user.default_currency,
+            )
+            if exchange_rate_pair not in get_user_rates(user):
                 raise NonFieldValidationError(
                     "There is no exchange rate for this currency.",
                 )
@@ -60,8 +57,7 @@ class WalletSerializer(ModelBaseSerializer):
     def update(self, instance, validated_data) -> Any:
         """Update the data of the wallet.
 
-        Do not allow user to change the wallet's user, currency,
-        and transactions.
+        Do not allow user to change the wallet's user and currency.
 
         Raise NonFieldValidationError if user tries to change the currency of
         the wallet.
@@ -80,9 +76,8 @@ class WalletSerializer(ModelBaseSerializer):
             "bank",
             "balance",
             "currency",
-            "transactions",
-        )
-        read_only_fields = (
-            "user",
-            "transactions",
+            "transactions_count",
+            "transactions_amount",
+            "last_transaction_date",
         )
+        read_only_fields = ("user",)
@@ -1,8 +1,18 @@
 from rest_framework import mixins
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
 
 from apps.core.api.mixins import UpdateModelWithoutPatchMixin
 from apps.core.api.views import BaseViewSet
+from apps.transactions.api.transactions.mixins import (
+    TransactionsSubResourceMixin,
+)
+from apps.transactions.api.transactions.serializers import (
+    TransactionSerializer,
+)
 from apps.transactions.models import Wallet
+from apps.transactions.services import annotate_transactions_summary
 
 from .serializers import WalletSerializer
 
@@ -12,15 +22,31 @@ class WalletViewSet(
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
     UpdateModelWithoutPatchMixin,
+    TransactionsSubResourceMixin,
     BaseViewSet,
 ):
     """View set for Wallet model."""
 
     serializer_class = WalletSerializer
+    serializers_map = {
+        "transactions": TransactionSerializer,
+    }
     ordering_fields = ("name", "balance")
     search_fields = ("name",)
     queryset = Wallet.objects.all()
 
     def get_queryset(self):
-        """Return all wallets for authenticated user."""
-        return Wallet.objects.filter(user=self.request.user)
+        """Return all wallets for authenticated user.
+
+        Wallets are annotated with summary of their transactions.
+
+        """
+        queryset = super().get_queryset().filter(user=self.request.user)
+        if self.action == "transactions":
+            return queryset
+        return annotate_transactions_summary(queryset, self.request.user)
+
+    @action(methods=["get"], detail=True)
+    def transactions(self, request: Request, pk: str) -> Response:
+        """List filtered and paginated transactions of the wallet."""
+        return self.list_transactions(self.get_object().transaction_set.all())
@@ -7,3 +7,7 @@ class TransactionsConfig(AppConfig):
 
     name = "apps.transactions"
     verbose_name = _("Transactions")
+
+    def ready(self):
+        # pylint: disable=unused-import
+        from . import signals  # noqa
@@ -14,6 +14,13 @@ HOME_PAGE_STATS = {
     "max_floating_points": 3,
     "default_tab": "month",
 }
+HOME_PAGE_CACHE = {
+    "version_key": "home:version:{user_id}",
+    "data_key": "home:data:{user_id}:{view}:{tab}:{day}:{version}",
+    # Tabs with cached data, others are echoed back and computed as weeks
+    "tabs": ("week", "month"),
+    "timeout": 60 * 60 * 24,
+}
 
 DEFAULT_BANKS = [
     {
@@ -53,3 +60,47 @@ DEFAULT_BANKS = [
         "code": "HDB",
     },
 ]
+
+TRANSACTION_IMPORT = {
+    "chunk_size": 1000,
+    "max_reported_errors": 100,
+    # Default categories of rows from files without categories, e.g. OFX
+    "income_category": "Incoming transfer",
+    "expense_category": "Outgoing transfer",
+}
+TRANSACTION_IMPORT_FORMATS = ("csv", "ofx")
+
+# Text search configuration of transactions' search vector, notes are
+# written in many languages, so words are not stemmed
+TRANSACTION_SEARCH_CONFIG = "simple"
+# Weight of note's words in transaction's search vector
+TRANSACTION_SEARCH_NOTE_WEIGHT = "A"
+
+TRANSACTION_EXPORT = {
+    "chunk_size": 2000,
+    "fields": {
+        "date": "date",
+        "amount": "amount",
+        "category": "category__name",
+        "wallet": "wallet__name",
+        "note": "note",
+        "is_shared": "is_shared",
+    },
+}
+TRANSACTION_EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/jsonl",
+}
+
+TRANSACTION_REPORT = {
+    "period_days": 7,
+    "batch_size": 500,
+    # Keep sent marks and progress longer than a week to cover late retries
+    "cache_timeout": 60 * 60 * 24 * 8,
+    "max_retries": 3,
+}
+
+MONTHLY_STATISTICS = {
+    "group_by_choices": ("category", "wallet"),
+    "default_months_count": 12,
+}
@@ -23,7 +23,7 @@ class TransactionFactory(factory.django.DjangoModelFactory):
 
     note = factory.Faker("sentence")
     is_shared = factory.Faker("pybool")
-    date = factory.Faker("date")
+    date = factory.Faker("date_object")
     category = factory.SubFactory(
         "apps.transactions.factories.CategoryFactory",
     )
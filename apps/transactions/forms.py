@@ -1,15 +1,16 @@
-from decimal import Decimal
 from typing import Any
 
 from django import forms
+from django.db import transaction as db_transaction
 from django.db.models import Q
 from django.forms import DateInput, ModelForm, ValidationError
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from apps.rates.models import ExchangeRate
+from apps.rates.services import get_rate_as_of, get_user_rates
 from apps.transactions.services import can_create_more_wallets
 from apps.users.models import User
+from apps.users.services import get_sent_friend_ids
 
 from .constants import NORMAL_USER_LIMITS
 from .models import Category, Transaction, Wallet
@@ -106,12 +107,11 @@ class WalletForm(ModelForm):
 
         user_chosen_currency = self.cleaned_data.get("currency")
         if user_chosen_currency.code != self.user.default_currency:
-            exchange_rate = ExchangeRate.objects.filter(
-                user=self.user,
-                source_currency=user_chosen_currency,
-                destination_currency__code=self.user.default_currency,
+            exchange_rate_pair = (
+                user_chosen_currency.code,
+                self.user.default_currency,
             )
-            if not exchange_rate.exists():
+            if exchange_rate_pair not in get_user_rates(self.user):
                 raise ValidationError(
                     "There is not an exchange rate between "
                     f"{user_chosen_currency} and "
@@ -190,8 +190,12 @@ class TransactionForm(ModelForm):
         """
         self.user = kwargs.pop("user")
         super().__init__(*args, **kwargs)
-        self.fields["wallet"].queryset = Wallet.objects.filter(user=self.user)
-        self.fields["tagged_friends"].queryset = self.user.friends.all()
+        self.fields["wallet"].queryset = Wallet.objects.filter(
+            user=self.user,
+        ).select_related("currency")
+        self.fields["tagged_friends"].queryset = User.objects.filter(
+            pk__in=get_sent_friend_ids(self.user.pk),
+        )
         self.fields["category"].queryset = Category.objects.filter(
             Q(user=self.user) | Q(user__isnull=True),
         )
@@ -212,7 +216,9 @@ class TransactionForm(ModelForm):
         """Check if user's wallet can handle the transaction amount.
 
         Ensure that if a transaction is not income type, the amount cannot be
-        greater than current balance of user's chosen wallet.
+        greater than current balance of user's chosen wallet. The amount is
+        converted with the rate effective on transaction's date, the same
+        one that is applied to wallet's balance.
 
         """
         amount = self.cleaned_data["amount"]
@@ -220,13 +226,12 @@ class TransactionForm(ModelForm):
         wallet = self.cleaned_data["wallet"]
         is_shared = self.cleaned_data["is_shared"]
         tagged_friends = self.cleaned_data.get("tagged_friends", None)
-        rate_obj = ExchangeRate.objects.filter(
-            user=self.user,
-            source_currency=wallet.currency,
-            destination_currency__code=self.user.default_currency,
-        ).first()
-
-        rate = rate_obj.rate if rate_obj else Decimal(1)
+        rate = get_rate_as_of(
+            self.user.pk,
+            wallet.currency.code if wallet.currency else None,
+            self.user.default_currency,
+            self.cleaned_data.get("date") or timezone.localdate(),
+        )
 
         if tagged_friends and not is_shared:
             raise ValidationError(
@@ -238,28 +243,26 @@ class TransactionForm(ModelForm):
                 "Please change wallet!",
             )
 
-        self.cleaned_data["rate"] = rate
         return super().clean()
 
     def save(self, *args, **kwargs):
-        """Save the transaction creation form.
+        """Save the transaction form.
 
-        Set the transaction's owner to the current user.
+        Set the transaction's owner to the current user. Signals apply the
+        transaction to wallet's balance.
 
         """
         self.instance.user = self.user
-        amount = self.cleaned_data["amount"]
-        category = self.cleaned_data["category"]
-        wallet = self.cleaned_data["wallet"]
-        rate = self.cleaned_data["rate"]
         friends = self.cleaned_data["tagged_friends"]
         transaction = super().save(*args, **kwargs)
 
-        if category.is_income:
-            wallet.balance += amount / rate
-        else:
-            wallet.balance -= amount / rate
-
-        send_shared_bill_notification.delay(self.user, friends, transaction)
-        wallet.save()
+        if friends:
+            friend_ids = [friend.pk for friend in friends]
+            # Worker reads the transaction, so it is sent after commit
+            db_transaction.on_commit(
+                lambda: send_shared_bill_notification.delay(
+                    transaction.pk,
+                    friend_ids,
+                ),
+            )
         return transaction
@@ -0,0 +1,74 @@
+import statistics
+import time
+from collections.abc import Callable
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.paginator import Paginator
+
+from libs.pagination import KeysetPaginator
+
+from apps.transactions.models import Transaction
+
+KEYSET_ORDERING = ("-date", "-id")
+
+
+class Command(BaseCommand):
+    """Compare offset and keyset pagination latency of user's transactions.
+
+    Pages are loaded the way transaction lists do it: offset pagination
+    counts transactions and skips previous pages, keyset pagination starts
+    right after the previous page's last transaction.
+
+    """
+
+    help = "Compare offset and keyset pagination of user's transactions."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("user_id", type=int)
+        parser.add_argument("--page-size", type=int, default=25)
+        parser.add_argument("--page", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options) -> None:
+        queryset = Transaction.objects.filter(user_id=options["user_id"])
+        page_size = options["page_size"]
+        deep_page = options["page"]
+        position = (deep_page - 1) * page_size - 1
+        ordered_queryset = queryset.order_by(*KEYSET_ORDERING)
+        previous_last = ordered_queryset[position:position + 1].first()
+        if previous_last is None:
+            raise CommandError(
+                f"User has less than {position + 1} transactions.",
+            )
+
+        keyset_paginator = KeysetPaginator(
+            queryset,
+            page_size,
+            KEYSET_ORDERING,
+        )
+        cursor = keyset_paginator.encode_cursor(previous_last)
+        benchmarks = {
+            "offset, page 1": lambda: list(
+                Paginator(ordered_queryset, page_size).page(1),
+            ),
+            f"offset, page {deep_page}": lambda: list(
+                Paginator(ordered_queryset, page_size).page(deep_page),
+            ),
+            "keyset, page 1": lambda: list(keyset_paginator.get_page()),
+            f"keyset, page {deep_page}": lambda: list(
+                keyset_paginator.get_page(cursor),
+            ),
+        }
+        for name, load_page in benchmarks.items():
+            self.stdout.write(
+                f"{name}: {self.measure(load_page, options['repeat']):.2f} ms",
+            )
+
+    def measure(self, load_page: Callable, repeat: int) -> float:
+        """Return median time of loading a page in milliseconds."""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            load_page()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
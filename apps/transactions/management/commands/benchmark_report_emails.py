@@ -0,0 +1,55 @@
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.transactions.models import Category, Transaction
+from apps.users.notifications import TransactionReportEmailNotification
+
+
+class Command(BaseCommand):
+    """Measure rendering of weekly transaction report emails.
+
+    Reports are rendered with the plain text template and with the plain
+    text derived from the HTML by the sanitizer, as notifications without
+    a plain text template do. Nothing is saved or sent.
+
+    """
+
+    help = "Measure rendering of weekly transaction report emails."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--emails", type=int, default=1000)
+        parser.add_argument("--transactions", type=int, default=20)
+
+    def handle(self, *args, **options) -> None:
+        category = Category(name="Food & Beverage")
+        transactions = [
+            Transaction(
+                category=category,
+                amount=Decimal(index),
+                date=timezone.localdate() - timezone.timedelta(days=index % 7),
+            )
+            for index in range(1, options["transactions"] + 1)
+        ]
+
+        notification_class = TransactionReportEmailNotification
+        plain_templates = {
+            "sanitized html": "",
+            "plain template": notification_class.plain_template,
+        }
+        for name, plain_template in plain_templates.items():
+            start = time.perf_counter()
+            for index in range(options["emails"]):
+                notification = notification_class(
+                    recipient_list=[f"user{index}@example.com"],
+                    username=f"user{index}",
+                    transactions=transactions,
+                )
+                notification.plain_template = plain_template
+                notification.prepare_mail_text()
+            self.stdout.write(
+                f"{name}: {time.perf_counter() - start:.2f} s "
+                f"for {options['emails']} emails",
+            )
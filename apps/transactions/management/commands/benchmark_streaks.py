@@ -0,0 +1,88 @@
+import datetime as dt
+import statistics
+import time
+from collections.abc import Callable
+from functools import reduce
+
+from django.core.management.base import BaseCommand
+from django.db.models import QuerySet
+
+from apps.transactions.models import Transaction
+from apps.transactions.services import get_activity_analytics
+
+
+def count_streak(dates: QuerySet) -> int:
+    """Count number of consecutive days users create transaction(s).
+
+    Check in all user's transactions to get the longest transaction streak
+    that user have made. It's the Python implementation replaced by
+    `get_activity_analytics`, kept only to compare them.
+
+    Example:
+        [5, 6, 7, 10, 11] should return 3.
+        [1, 3, 5] should return 1.
+
+    """
+    if not dates:
+        return 0
+
+    streak_count = 1
+    current_streak = 1
+
+    def count_consecutive(
+        previous: dict,
+        current: dict,
+    ) -> dt.date:
+        """Reduce function to check if 2 dates are consecutive."""
+        nonlocal streak_count, current_streak
+        if previous["date"] == current["date"] - dt.timedelta(days=1):
+            current_streak += 1
+        else:
+            streak_count = max(streak_count, current_streak)
+            current_streak = 1
+        return current
+
+    reduce(count_consecutive, dates)
+    return max(streak_count, current_streak)
+
+
+class Command(BaseCommand):
+    """Compare `count_streak` with SQL activity analytics of a user.
+
+    `count_streak` needs all user's distinct transaction dates loaded,
+    activity analytics compute streaks and active days per month in the
+    database. Both are measured including their queries.
+
+    """
+
+    help = "Compare count_streak with SQL activity analytics of a user."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("user_id", type=int)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options) -> None:
+        user_id = options["user_id"]
+        benchmarks = {
+            "count_streak": lambda: count_streak(
+                list(
+                    Transaction.objects.filter(
+                        user_id=user_id,
+                    ).order_by("date").values("date").distinct(),
+                ),
+            ),
+            "activity analytics": lambda: get_activity_analytics(user_id),
+        }
+        for name, compute in benchmarks.items():
+            self.stdout.write(
+                f"{name}: {self.measure(compute, options['repeat']):.2f} ms",
+            )
+
+    def measure(self, compute: Callable, repeat: int) -> float:
+        """Return median time of computing in milliseconds."""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            compute()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
@@ -0,0 +1,55 @@
+import csv
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.transactions.constants import TRANSACTION_IMPORT_FORMATS
+from apps.transactions.models import Wallet
+from apps.transactions.services import import_transactions, read_transactions
+
+
+class Command(BaseCommand):
+    """Import transactions from a CSV or OFX file into a user's wallet."""
+
+    help = "Import transactions from a CSV or OFX file into a wallet."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("wallet_id", type=int)
+        parser.add_argument("path")
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=TRANSACTION_IMPORT_FORMATS,
+            help="File format, detected by file's extension by default.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        wallet = Wallet.objects.select_related(
+            "user",
+            "currency",
+        ).filter(pk=options["wallet_id"]).first()
+        if not wallet:
+            raise CommandError(f"Wallet {options['wallet_id']} not found.")
+
+        file_format = options["file_format"] or os.path.splitext(
+            options["path"],
+        )[1].lstrip(".").lower()
+        if file_format not in TRANSACTION_IMPORT_FORMATS:
+            raise CommandError(f"Unsupported file format: {file_format}.")
+
+        try:
+            with open(options["path"], "rb") as file:
+                result = import_transactions(
+                    user=wallet.user,
+                    wallet=wallet,
+                    rows=read_transactions(file, file_format),
+                )
+        except (OSError, csv.Error, UnicodeDecodeError) as error:
+            raise CommandError(str(error)) from error
+
+        for error in result["errors"]:
+            self.stderr.write(f"Row {error['row']}: {error['errors']}")
+        self.stdout.write(
+            f"Imported {result['created_count']} transactions, "
+            f"skipped {result['errors_count']} invalid rows.",
+        )
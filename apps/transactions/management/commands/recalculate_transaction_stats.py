@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from apps.transactions.services import recalculate_transaction_stats
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    """Recalculate transaction count and streak of users.
+
+    Transaction stats are updated along with every transaction, this command
+    backfills them for existing data or fixes them after manual changes.
+
+    """
+
+    help = "Recalculate transaction count and streak of users."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "user_ids",
+            nargs="*",
+            type=int,
+            help="Ids of users to recalculate, all users by default.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        users = User.objects.order_by("pk")
+        if options["user_ids"]:
+            users = users.filter(pk__in=options["user_ids"])
+
+        count = 0
+        for user_id in users.values_list("pk", flat=True).iterator():
+            recalculate_transaction_stats(user_id)
+            count += 1
+        self.stdout.write(f"Recalculated transaction stats of {count} users.")
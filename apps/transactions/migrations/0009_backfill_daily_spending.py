@@ -0,0 +1,47 @@
+from django.db import migrations
+from django.db.models import Count, Sum
+
+
+def backfill_daily_spending(apps, schema_editor) -> None:
+    """Build daily spending rollups from existing transactions."""
+    DailySpending = apps.get_model("transactions", "DailySpending")
+    Transaction = apps.get_model("transactions", "Transaction")
+    rollups = Transaction.objects.values(
+        "user", "date", "category",
+    ).annotate(
+        total_amount=Sum("amount"),
+        total_count=Count("id"),
+    ).order_by()
+
+    DailySpending.objects.bulk_create(
+        [
+            DailySpending(
+                user_id=rollup["user"],
+                date=rollup["date"],
+                category_id=rollup["category"],
+                amount=rollup["total_amount"],
+                count=rollup["total_count"],
+            )
+            for rollup in rollups.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+def delete_daily_spending(apps, schema_editor) -> None:
+    """Delete all daily spending rollups when revert migration."""
+    DailySpending = apps.get_model("transactions", "DailySpending")
+    DailySpending.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('transactions', '0008_dailyspending'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_daily_spending,
+            reverse_code=delete_daily_spending,
+        ),
+    ]
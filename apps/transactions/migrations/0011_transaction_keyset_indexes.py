@@ -0,0 +1,35 @@
+# Generated by Django 4.2 on 2026-10-18 12:30
+
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build indexes without locking writes on the transactions table
+    atomic = False
+
+    dependencies = [
+        ('transactions', '0010_transaction_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(fields=['user', '-date', '-id'], name='transaction_user_date_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'wallet', '-date', '-id'], name='transaction_user_wallet_id_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='transaction',
+            name='transaction_user_date_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='transaction',
+            name='transaction_user_wallet_idx',
+        ),
+    ]
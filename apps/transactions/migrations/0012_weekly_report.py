@@ -0,0 +1,39 @@
+# Generated by Django 4.2 on 2026-10-18 12:40
+
+from django.db import migrations, models
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0011_transaction_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WeeklyReport',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('start_date', models.DateField(verbose_name='Start date')),
+                ('end_date', models.DateField(verbose_name='End date')),
+                ('transactions_count', models.IntegerField(default=0, verbose_name='Transactions count')),
+                ('categories_count', models.IntegerField(default=0, verbose_name='Categories count')),
+                ('active_users_count', models.IntegerField(default=0, verbose_name='Active users count')),
+                ('new_users_count', models.IntegerField(default=0, verbose_name='New users count')),
+                ('new_usernames', models.JSONField(default=list, verbose_name='New usernames')),
+                ('volume_by_currency', models.JSONField(default=dict, verbose_name='Volume by currency')),
+                ('daily_stats', models.JSONField(default=list, verbose_name='Daily stats')),
+            ],
+            options={
+                'verbose_name': 'Weekly report',
+                'verbose_name_plural': 'Weekly reports',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='weeklyreport',
+            constraint=models.UniqueConstraint(fields=('start_date', 'end_date'), name='unique_weekly_report_period'),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.2 on 2026-10-18 12:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0012_weekly_report'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyStatistics',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('month', models.DateField(verbose_name='Month')),
+                ('is_income', models.BooleanField(verbose_name='Income')),
+                ('amount', models.DecimalField(decimal_places=3, max_digits=20, verbose_name='Amount')),
+                ('count', models.IntegerField(verbose_name='Count')),
+            ],
+            options={
+                'verbose_name': 'Monthly statistics',
+                'verbose_name_plural': 'Monthly statistics',
+                'db_table': 'transactions_monthly_statistics',
+                'managed': False,
+            },
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE MATERIALIZED VIEW transactions_monthly_statistics AS
+                SELECT
+                    row_number() OVER () AS id,
+                    transaction.user_id,
+                    date_trunc('month', transaction.date)::date AS month,
+                    transaction.category_id,
+                    transaction.wallet_id,
+                    category.is_income,
+                    sum(transaction.amount) AS amount,
+                    count(*) AS count
+                FROM transactions_transaction AS transaction
+                JOIN transactions_category AS category
+                    ON category.id = transaction.category_id
+                GROUP BY
+                    transaction.user_id,
+                    date_trunc('month', transaction.date),
+                    transaction.category_id,
+                    transaction.wallet_id,
+                    category.is_income;
+
+                CREATE UNIQUE INDEX monthly_statistics_unique_idx
+                ON transactions_monthly_statistics (
+                    user_id, month, category_id, wallet_id
+                );
+            """,
+            reverse_sql="""
+                DROP MATERIALIZED VIEW transactions_monthly_statistics;
+            """,
+        ),
+    ]
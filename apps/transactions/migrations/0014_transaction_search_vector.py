@@ -0,0 +1,79 @@
+# Generated by Django 4.2 on 2026-10-18 12:50
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0013_monthly_statistics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Search vector'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='transaction_search_vector_idx'),
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE FUNCTION transactions_transaction_search_vector()
+                RETURNS trigger AS $$
+                BEGIN
+                    NEW.search_vector :=
+                        setweight(
+                            to_tsvector('simple', coalesce(NEW.note, '')),
+                            'A'
+                        )
+                        || setweight(
+                            to_tsvector('simple', coalesce((
+                                SELECT name FROM transactions_category
+                                WHERE id = NEW.category_id
+                            ), '')),
+                            'B'
+                        );
+                    RETURN NEW;
+                END
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER transaction_search_vector_trigger
+                BEFORE INSERT OR UPDATE OF note, category_id
+                ON transactions_transaction
+                FOR EACH ROW
+                EXECUTE FUNCTION transactions_transaction_search_vector();
+
+                -- Setting category_id fires the trigger above for each row
+                CREATE FUNCTION transactions_category_search_vector()
+                RETURNS trigger AS $$
+                BEGIN
+                    UPDATE transactions_transaction
+                    SET category_id = category_id
+                    WHERE category_id = NEW.id;
+                    RETURN NULL;
+                END
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER category_search_vector_trigger
+                AFTER UPDATE OF name ON transactions_category
+                FOR EACH ROW
+                WHEN (OLD.name IS DISTINCT FROM NEW.name)
+                EXECUTE FUNCTION transactions_category_search_vector();
+
+                UPDATE transactions_transaction SET note = note;
+            """,
+            reverse_sql="""
+                DROP TRIGGER category_search_vector_trigger
+                ON transactions_category;
+                DROP FUNCTION transactions_category_search_vector();
+                DROP TRIGGER transaction_search_vector_trigger
+                ON transactions_transaction;
+                DROP FUNCTION transactions_transaction_search_vector();
+            """,
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2 on 2026-10-18 13:00
+
+from django.db import migrations, models
+
+
+def set_current_applied_rates(apps, schema_editor) -> None:
+    """Set applied rates of transactions to rates their balance used.
+
+    Balance changes were converted with the current rate from wallet's
+    currency to user's default currency, pairs without a rate used 1.
+
+    """
+    ExchangeRate = apps.get_model("rates", "ExchangeRate")
+    Transaction = apps.get_model("transactions", "Transaction")
+    for rate in ExchangeRate.objects.select_related(
+        "destination_currency",
+    ).iterator():
+        Transaction.objects.filter(
+            user_id=rate.user_id,
+            user__default_currency=rate.destination_currency.code,
+            wallet__currency_id=rate.source_currency_id,
+        ).update(applied_rate=rate.rate)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rates', '0006_exchange_rate_history'),
+        ('transactions', '0014_transaction_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='applied_rate',
+            field=models.DecimalField(decimal_places=6, default=1, max_digits=14, verbose_name='Applied exchange rate'),
+        ),
+        migrations.RunPython(
+            set_current_applied_rates,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -1,5 +1,8 @@
 from .bank import Bank
 from .category import Category
+from .daily_spending import DailySpending
+from .monthly_statistics import MonthlyStatistics
 from .sharedbill import SharedBill
 from .transaction import Transaction
 from .wallet import Wallet
+from .weekly_report import WeeklyReport
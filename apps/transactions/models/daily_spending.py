@@ -0,0 +1,58 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import BaseModel
+from apps.users.models import User
+
+
+class DailySpending(BaseModel):
+    """Create model for DailySpending, a daily rollup of Transaction.
+
+    Rows are maintained on every transaction create/update/delete so the home
+    dashboard can read period totals without scanning raw transactions.
+
+    Attrs:
+        user: user's id, the owner of the summed transactions
+        date: the day of the summed transactions
+        category: category's id of the summed transactions
+        amount: sum of transaction amounts of this user/day/category
+        count: number of transactions of this user/day/category
+
+    """
+
+    user = models.ForeignKey(
+        to=User,
+        verbose_name=_("User"),
+        on_delete=models.CASCADE,
+    )
+    date = models.DateField(
+        verbose_name=_("Date"),
+    )
+    category = models.ForeignKey(
+        to="transactions.Category",
+        verbose_name=_("Category"),
+        on_delete=models.CASCADE,
+    )
+    amount = models.DecimalField(
+        verbose_name=_("Amount"),
+        default=0,
+        max_digits=20,
+        decimal_places=3,
+    )
+    count = models.IntegerField(
+        verbose_name=_("Count"),
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = _("Daily spending")
+        verbose_name_plural = _("Daily spendings")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "date", "category"],
+                name="unique_daily_spending",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user}: {self.category} - {self.amount} ({self.date})"
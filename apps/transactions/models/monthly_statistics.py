@@ -0,0 +1,72 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.users.models import User
+
+
+class MonthlyStatistics(models.Model):
+    """Model of `transactions_monthly_statistics` materialized view.
+
+    The view sums transactions per user, month, category and wallet, it is
+    refreshed periodically by `refresh_monthly_statistics` task, so the
+    latest transactions may be missing. Amounts are in user's default
+    currency as amounts of transactions are.
+
+    Attrs:
+        user: user's id, the owner of the summed transactions
+        month: the first day of the month of the summed transactions
+        category: category's id of the summed transactions
+        wallet: wallet's id of the summed transactions
+        is_income: whether the category is an income category
+        amount: sum of transaction amounts
+        count: number of transactions
+
+    """
+
+    id = models.BigIntegerField(
+        primary_key=True,
+    )
+    user = models.ForeignKey(
+        to=User,
+        verbose_name=_("User"),
+        on_delete=models.DO_NOTHING,
+        related_name="+",
+    )
+    month = models.DateField(
+        verbose_name=_("Month"),
+    )
+    category = models.ForeignKey(
+        to="transactions.Category",
+        verbose_name=_("Category"),
+        on_delete=models.DO_NOTHING,
+        related_name="+",
+    )
+    wallet = models.ForeignKey(
+        to="transactions.Wallet",
+        verbose_name=_("Wallet"),
+        on_delete=models.DO_NOTHING,
+        related_name="+",
+    )
+    is_income = models.BooleanField(
+        verbose_name=_("Income"),
+    )
+    amount = models.DecimalField(
+        verbose_name=_("Amount"),
+        max_digits=20,
+        decimal_places=3,
+    )
+    count = models.IntegerField(
+        verbose_name=_("Count"),
+    )
+
+    class Meta:
+        managed = False
+        db_table = "transactions_monthly_statistics"
+        verbose_name = _("Monthly statistics")
+        verbose_name_plural = _("Monthly statistics")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.user_id}: {self.category_id} - {self.amount} "
+            f"({self.month})"
+        )
@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils import timezone
@@ -27,6 +29,11 @@ class Transaction(BaseModel):
         date: the date user choose to make this transaction
         note: additional information/note of this transaction
         is_shared: indicate whether this is a shared bill transactions
+        applied_rate: rate from wallet's currency to user's default currency
+        as of the transaction's date, the amount is divided by it to get
+        the change of wallet's balance
+        search_vector: full-text search document of note and category name,
+        maintained by database triggers
 
     """
 
@@ -34,6 +41,8 @@ class Transaction(BaseModel):
         to=User,
         verbose_name=_("User"),
         on_delete=models.CASCADE,
+        # Covered by the composite indexes below, which all start with user
+        db_index=False,
     )
     amount = models.DecimalField(
         verbose_name=_("Amount"),
@@ -73,10 +82,40 @@ class Transaction(BaseModel):
         null=True,
         blank=True,
     )
+    applied_rate = models.DecimalField(
+        verbose_name=_("Applied exchange rate"),
+        decimal_places=6,
+        max_digits=14,
+        default=1,
+    )
+    search_vector = SearchVectorField(
+        verbose_name=_("Search vector"),
+        null=True,
+        editable=False,
+    )
 
     class Meta:
         verbose_name = _("Transaction")
         verbose_name_plural = _("Transactions")
+        indexes = [
+            # Ids make the order strict for keyset pagination
+            models.Index(
+                fields=["user", "-date", "-id"],
+                name="transaction_user_date_id_idx",
+            ),
+            models.Index(
+                fields=["user", "wallet", "-date", "-id"],
+                name="transaction_user_wallet_id_idx",
+            ),
+            models.Index(
+                fields=["user", "category", "-date"],
+                name="transaction_user_category_idx",
+            ),
+            GinIndex(
+                fields=["search_vector"],
+                name="transaction_search_vector_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user}: {self.category} - {self.amount} ({self.date})"
@@ -55,6 +55,6 @@ class Wallet(BaseModel):
         return self.name
 
     def set_balance(self, new_balance: Decimal) -> None:
-        """Set balance for Wallet model and save."""
+        """Set balance for Wallet model and save only the balance."""
         self.balance = new_balance
-        self.save()
+        self.save(update_fields=["balance", "modified"])
@@ -0,0 +1,73 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import BaseModel
+
+
+class WeeklyReport(BaseModel):
+    """Create model for WeeklyReport, a snapshot of admin weekly KPIs.
+
+    Reports are computed once by the weekly admin report task, so the
+    history is browsed in admin without recomputation.
+
+    Attrs:
+        start_date: the first day of the reported period
+        end_date: the last day of the reported period
+        transactions_count: number of transactions made in the period
+        categories_count: number of distinct categories used in the period
+        active_users_count: number of users who made transactions
+        new_users_count: number of users registered in the period
+        new_usernames: usernames of users registered in the period
+        volume_by_currency: transactions amount by users' default currency
+        daily_stats: transactions count, active users count and volume by
+            currency per each day of the period
+
+    """
+
+    start_date = models.DateField(
+        verbose_name=_("Start date"),
+    )
+    end_date = models.DateField(
+        verbose_name=_("End date"),
+    )
+    transactions_count = models.IntegerField(
+        verbose_name=_("Transactions count"),
+        default=0,
+    )
+    categories_count = models.IntegerField(
+        verbose_name=_("Categories count"),
+        default=0,
+    )
+    active_users_count = models.IntegerField(
+        verbose_name=_("Active users count"),
+        default=0,
+    )
+    new_users_count = models.IntegerField(
+        verbose_name=_("New users count"),
+        default=0,
+    )
+    new_usernames = models.JSONField(
+        verbose_name=_("New usernames"),
+        default=list,
+    )
+    volume_by_currency = models.JSONField(
+        verbose_name=_("Volume by currency"),
+        default=dict,
+    )
+    daily_stats = models.JSONField(
+        verbose_name=_("Daily stats"),
+        default=list,
+    )
+
+    class Meta:
+        verbose_name = _("Weekly report")
+        verbose_name_plural = _("Weekly reports")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["start_date", "end_date"],
+                name="unique_weekly_report_period",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.start_date} - {self.end_date}"
@@ -1,13 +1,47 @@
+from .annotate_transactions_summary import annotate_transactions_summary
 from .category_create_check import can_create_more_category
-from .count_streak import count_streak
+from .export_transactions import export_transactions
+from .generate_weekly_report import (
+    generate_weekly_report,
+    get_weekly_report_stats,
+)
+from .get_activity_analytics import get_activity_analytics
 from .get_period import get_period
+from .get_period_spending_stats import get_period_spending_stats
 from .get_recent_transactions import get_recent_transactions
-from .get_top_spending import get_top_spending
-from .get_total_spending import get_total_spending
 from .get_transactions_by_period import get_transactions_by_period
 from .get_user_excluding_currencies import get_user_excluding_currencies
 from .get_user_total_balance import (
     get_user_total_balance,
     get_user_total_balance_by_currencies,
 )
+from .home_page_cache import (
+    get_cached_home_page_data,
+    get_home_page_etag,
+    get_home_page_modified,
+    invalidate_home_page,
+)
+from .import_transactions import (
+    import_transactions,
+    read_csv_transactions,
+    read_ofx_transactions,
+    read_transactions,
+)
+from .monthly_statistics import (
+    get_monthly_statistics,
+    refresh_monthly_statistics,
+)
+from .update_daily_spending import update_daily_spending
+from .update_transaction_stats import (
+    add_transaction_to_stats,
+    recalculate_transaction_stats,
+)
+from .update_wallet_balance import (
+    add_transaction_to_balance,
+    get_transaction_balance_delta,
+    get_transaction_rate,
+    remove_category_from_balances,
+    remove_transaction_from_balance,
+    update_wallet_balance,
+)
 from .wallet_create_check import can_create_more_wallets
@@ -0,0 +1,32 @@
+from decimal import Decimal
+
+from django.db.models import Count, FilteredRelation, Max, Q, QuerySet, Sum
+from django.db.models.functions import Coalesce
+
+from apps.users.models import User
+
+
+def annotate_transactions_summary(queryset: QuerySet, user: User) -> QuerySet:
+    """Annotate wallets or categories with summary of user's transactions.
+
+    Adds `transactions_count`, `transactions_amount` (in user's default
+    currency) and `last_transaction_date` computed by the database, so the
+    transactions themselves aren't loaded. Only user's transactions are
+    joined, so other users' transactions of default categories are not
+    scanned.
+
+    """
+    queryset = queryset.annotate(
+        user_transaction=FilteredRelation(
+            "transaction",
+            condition=Q(transaction__user=user),
+        ),
+    )
+    return queryset.annotate(
+        transactions_count=Count("user_transaction"),
+        transactions_amount=Coalesce(
+            Sum("user_transaction__amount"),
+            Decimal(0),
+        ),
+        last_transaction_date=Max("user_transaction__date"),
+    )
@@ -0,0 +1,51 @@
+import csv
+import json
+from collections.abc import Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+
+from apps.transactions.constants import TRANSACTION_EXPORT
+
+
+class Echo:
+    """File-like object which returns written values instead of storing."""
+
+    def write(self, value: str) -> str:
+        """Return the written value."""
+        return value
+
+
+def _iterate_rows(queryset: QuerySet) -> Iterator[tuple]:
+    """Iterate over exported values using a server-side cursor."""
+    return queryset.values_list(
+        *TRANSACTION_EXPORT["fields"].values(),
+    ).iterator(chunk_size=TRANSACTION_EXPORT["chunk_size"])
+
+
+def export_transactions_csv(queryset: QuerySet) -> Iterator[str]:
+    """Stream transactions as CSV lines.
+
+    Columns match the ones expected by the transaction import.
+
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(TRANSACTION_EXPORT["fields"].keys())
+    for row in _iterate_rows(queryset):
+        yield writer.writerow(row)
+
+
+def export_transactions_jsonl(queryset: QuerySet) -> Iterator[str]:
+    """Stream transactions as JSON Lines, a JSON object per line."""
+    fields = tuple(TRANSACTION_EXPORT["fields"].keys())
+    for row in _iterate_rows(queryset):
+        yield json.dumps(dict(zip(fields, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+def export_transactions(queryset: QuerySet, file_format: str) -> Iterator[str]:
+    """Stream transactions in one of supported formats."""
+    exporters = {
+        "csv": export_transactions_csv,
+        "jsonl": export_transactions_jsonl,
+    }
+    return exporters[file_format](queryset)
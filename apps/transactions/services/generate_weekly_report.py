@@ -0,0 +1,98 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Count, Sum
+
+from apps.transactions.models import Transaction, WeeklyReport
+from apps.users.models import User
+
+
+def get_weekly_report_stats(
+    start_date: date,
+    end_date: date,
+) -> dict[str, Any]:
+    """Compute admin KPIs of transactions and users for the period.
+
+    Transactions are aggregated by one query grouped by date and users'
+    default currency, which also collects distinct users and categories of
+    each group, so weekly distinct counts are merged in Python. New users
+    are read by another query.
+
+    """
+    groups = Transaction.objects.filter(
+        date__range=(start_date, end_date),
+    ).values("date", "user__default_currency").annotate(
+        count=Count("id"),
+        amount=Sum("amount"),
+        user_ids=ArrayAgg("user_id", distinct=True),
+        category_ids=ArrayAgg("category_id", distinct=True),
+    ).order_by("date")
+
+    user_ids = set()
+    category_ids = set()
+    volume_by_currency = defaultdict(Decimal)
+    daily_stats = {}
+    for group in groups:
+        user_ids.update(group["user_ids"])
+        category_ids.update(group["category_ids"])
+        currency = group["user__default_currency"]
+        volume_by_currency[currency] += group["amount"]
+
+        day_stats = daily_stats.setdefault(
+            group["date"],
+            {"count": 0, "user_ids": set(), "volume": defaultdict(Decimal)},
+        )
+        day_stats["count"] += group["count"]
+        day_stats["user_ids"].update(group["user_ids"])
+        day_stats["volume"][currency] += group["amount"]
+
+    new_usernames = list(
+        User.objects.filter(
+            created__date__range=(start_date, end_date),
+        ).order_by("created").values_list("username", flat=True),
+    )
+    return {
+        "transactions_count": sum(
+            day_stats["count"] for day_stats in daily_stats.values()
+        ),
+        "categories_count": len(category_ids),
+        "active_users_count": len(user_ids),
+        "new_users_count": len(new_usernames),
+        "new_usernames": new_usernames,
+        "volume_by_currency": _format_volume(volume_by_currency),
+        "daily_stats": [
+            {
+                "date": day.isoformat(),
+                "transactions_count": day_stats["count"],
+                "active_users_count": len(day_stats["user_ids"]),
+                "volume_by_currency": _format_volume(day_stats["volume"]),
+            }
+            for day, day_stats in daily_stats.items()
+        ],
+    }
+
+
+def _format_volume(volume: dict[str, Decimal]) -> dict[str, str]:
+    """Convert amounts by currency to JSON serializable strings."""
+    return {
+        currency: str(amount)
+        for currency, amount in sorted(volume.items())
+    }
+
+
+def generate_weekly_report(start_date: date, end_date: date) -> WeeklyReport:
+    """Compute admin KPIs for the period and store them as a snapshot.
+
+    The snapshot of the same period is replaced, so the report can be
+    regenerated after a failure.
+
+    """
+    report, _ = WeeklyReport.objects.update_or_create(
+        start_date=start_date,
+        end_date=end_date,
+        defaults=get_weekly_report_stats(start_date, end_date),
+    )
+    return report
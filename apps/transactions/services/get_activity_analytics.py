@@ -0,0 +1,78 @@
+from datetime import date, timedelta
+from typing import Any
+
+from django.db import connection
+from django.utils import timezone
+
+from apps.transactions.models import Transaction
+
+# Consecutive days minus their row numbers are equal, so each island of
+# consecutive days is one group of the `islands` CTE ("gaps and islands")
+ACTIVITY_ANALYTICS_SQL = f"""
+    WITH days AS (
+        SELECT DISTINCT date
+        FROM {Transaction._meta.db_table}
+        WHERE user_id = %(user_id)s
+    ), islands AS (
+        SELECT date, date - (row_number() OVER (ORDER BY date))::integer
+            AS island
+        FROM days
+    )
+    SELECT 'streak', min(date), max(date), count(*)
+    FROM islands
+    GROUP BY island
+    UNION ALL
+    SELECT 'month', date_trunc('month', date)::date, NULL, count(*)
+    FROM days
+    GROUP BY date_trunc('month', date)
+"""
+
+
+def get_activity_analytics(
+    user_id: int,
+    today: date | None = None,
+) -> dict[str, Any]:
+    """Get streaks and active days of user's transactions.
+
+    Streaks of consecutive days and numbers of active days per month are
+    computed by the database in one query, so transaction dates aren't
+    loaded.
+
+    Returns:
+        dict: `current_streak` (streak which ends today or yesterday),
+        `longest_streak`, `last_streak_start`, `last_active_date` and
+        `active_days_by_month` (first day of month to number of days).
+
+    """
+    today = today or timezone.localdate()
+    with connection.cursor() as cursor:
+        cursor.execute(ACTIVITY_ANALYTICS_SQL, {"user_id": user_id})
+        rows = cursor.fetchall()
+
+    streaks = []
+    active_days_by_month = {}
+    for kind, start_date, end_date, days_count in rows:
+        if kind == "streak":
+            streaks.append((end_date, start_date, days_count))
+        else:
+            active_days_by_month[start_date] = days_count
+
+    analytics = {
+        "current_streak": 0,
+        "longest_streak": 0,
+        "last_streak_start": None,
+        "last_active_date": None,
+        "active_days_by_month": dict(sorted(active_days_by_month.items())),
+    }
+    if not streaks:
+        return analytics
+
+    last_active_date, last_streak_start, last_streak = max(streaks)
+    analytics.update(
+        longest_streak=max(days_count for *_, days_count in streaks),
+        last_streak_start=last_streak_start,
+        last_active_date=last_active_date,
+    )
+    if last_active_date >= today - timedelta(days=1):
+        analytics["current_streak"] = last_streak
+    return analytics
@@ -16,16 +16,11 @@ def get_period(now: date, tab: str) -> tuple[date, date]:
         end day of that period (week/month).
 
     """
-    previous_month = {
-        1: 12,
-        **{curr: curr - 1 for curr in range(2, 13)},
-    }
-
     if tab == "month":
         begin_period = now.replace(day=1)
-        begin_prev_period = begin_period.replace(
-            month=previous_month[now.month],
-        )
+        # The day before the period is in the previous month, of the
+        # previous year in January
+        begin_prev_period = (begin_period - timedelta(days=1)).replace(day=1)
     else:
         begin_period = now - timedelta(days=now.weekday())
         begin_prev_period = begin_period - timedelta(days=7)
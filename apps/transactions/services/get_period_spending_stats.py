@@ -0,0 +1,84 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from django.db.models import Q, Sum
+
+from apps.transactions.models import DailySpending
+from apps.users.models import User
+
+from ..constants import HOME_PAGE_STATS
+
+
+def get_period_spending_stats(
+    user: User,
+    begin_prev_period: date,
+    begin_period: date,
+    end: date,
+) -> dict[str, Any]:
+    """Get spending statistics of a period compared to the previous one.
+
+    Current period total, previous period total and spending per category are
+    computed in one conditional-aggregation query over user's daily spending
+    rollups, the rest is derived in memory.
+
+    Returns:
+        dict: total_period, total_prev_period, top_spending (the
+        HOME_PAGE_STATS["num_top_spending"] biggest categories of the current
+        period) and stats (percentage of change compared to previous period).
+
+    """
+    categories = list(
+        DailySpending.objects.filter(
+            user=user,
+            date__gte=begin_prev_period,
+            date__lte=end,
+        ).exclude(
+            category__is_income=True,
+        ).values("category__name").annotate(
+            total_category=Sum(
+                "amount",
+                filter=Q(date__gte=begin_period),
+                default=Decimal(0),
+            ),
+            total_prev_category=Sum(
+                "amount",
+                filter=Q(date__lt=begin_period),
+                default=Decimal(0),
+            ),
+        ).order_by("-total_category"),
+    )
+
+    total_period = round(
+        sum(category["total_category"] for category in categories),
+        HOME_PAGE_STATS["max_floating_points"],
+    )
+    total_prev_period = round(
+        sum(category["total_prev_category"] for category in categories),
+        HOME_PAGE_STATS["max_floating_points"],
+    )
+    top_spending = [
+        {
+            "category__name": category["category__name"],
+            "total_category": category["total_category"],
+            "percentage": round(
+                category["total_category"] / total_period * 100,
+            ),
+        }
+        for category in categories[:HOME_PAGE_STATS["num_top_spending"]]
+        if category["total_category"]
+    ]
+
+    if total_prev_period == 0:
+        stats = 100
+    else:
+        stats = round(
+            (total_period - total_prev_period) / total_prev_period * 100,
+        )
+
+    return {
+        "total_period": Decimal(total_period),
+        "total_prev_period": Decimal(total_prev_period),
+        "top_spending": top_spending,
+        "stats": stats,
+    }
@@ -8,4 +8,6 @@ def get_recent_transactions(user: User, amount: int) -> QuerySet:
     """Get list of user's recent transactions with given amount."""
     return Transaction.objects.filter(user=user).order_by(
         "-date",
-    )[:amount].select_related("category")
+    )[:amount].select_related("category", "user").prefetch_related(
+        "user__friends",
+    )
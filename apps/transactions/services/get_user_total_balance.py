@@ -1,22 +1,26 @@
 from decimal import Decimal
 
-from django.db.models import (
-    DecimalField,
-    ExpressionWrapper,
-    F,
-    OuterRef,
-    Subquery,
-    Sum,
-)
-from django.db.models.functions import Coalesce
-
-from apps.rates.models import Currency, ExchangeRate
+from django.db.models import Sum
+
+from apps.rates.services import convert_amounts, get_user_rates
 from apps.transactions.models import Wallet
 from apps.users.models import User
 
 from ..constants import HOME_PAGE_STATS
 
 
+def get_user_wallet_balances(user: User) -> dict[str | None, Decimal]:
+    """Get user's wallet balances summed per wallet currency code."""
+    return dict(
+        Wallet.objects.filter(user=user).values(
+            "currency__code",
+        ).annotate(total=Sum("balance")).order_by().values_list(
+            "currency__code",
+            "total",
+        ),
+    )
+
+
 def get_user_total_balance(
     user: User,
     selected_currency: str,
@@ -27,33 +31,27 @@ def get_user_total_balance(
     with the default currency.
 
     """
-    wallets = Wallet.objects.filter(user=user)
-    wallets_rate = Subquery(
-        ExchangeRate.objects.filter(
-            user=user,
-            source_currency=OuterRef("currency"),
-            destination_currency__code=selected_currency,
-        ).values_list("rate")[:1],
+    total_balance = convert_amounts(
+        get_user_wallet_balances(user),
+        get_user_rates(user),
+        selected_currency,
     )
-    total_balance = wallets.annotate(
-        rate_balance=ExpressionWrapper(
-            F("balance") * Coalesce(wallets_rate, 1),
-            output_field=DecimalField(),
-        ),
-    ).aggregate(total=Sum("rate_balance"))["total"]
-
-    if not total_balance:
-        return Decimal(0)
     return round(total_balance, HOME_PAGE_STATS["max_floating_points"])
 
 
 def get_user_total_balance_by_currencies(user: User) -> dict[str, Decimal]:
-    """Return user's total balance in all types of currencies."""
-    user_rates = ExchangeRate.objects.filter(user=user)
-    user_currencies = Currency.objects.filter(
-        pk__in=user_rates.values_list("source_currency"),
-    )
+    """Return user's total balance in all types of currencies.
+
+    Wallet balances per currency and user's rate matrix are loaded once, then
+    totals in every currency user has a rate for are converted in memory.
+
+    """
+    balances = get_user_wallet_balances(user)
+    rates = get_user_rates(user)
     return {
-        currency.code: get_user_total_balance(user, currency.code)
-        for currency in user_currencies
+        currency: round(
+            convert_amounts(balances, rates, currency),
+            HOME_PAGE_STATS["max_floating_points"],
+        )
+        for currency in {source for source, _ in rates}
     }
@@ -0,0 +1,81 @@
+from collections.abc import Callable
+from datetime import datetime, time
+from typing import Any
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from ..constants import HOME_PAGE_CACHE
+
+
+def get_home_page_modified(user_id: int) -> datetime:
+    """Return when data of user's home page was changed last time.
+
+    The time is the version of user's cached home page data. A user without
+    a stored version gets the current time, so their data is computed once
+    and cached until the next invalidation. Home page periods start at
+    midnight, so the data is also considered modified at the start of a day.
+
+    """
+    cache_key = HOME_PAGE_CACHE["version_key"].format(user_id=user_id)
+    cache.add(cache_key, timezone.now(), HOME_PAGE_CACHE["timeout"])
+    modified = cache.get(cache_key) or timezone.now()
+    start_of_day = timezone.make_aware(
+        datetime.combine(timezone.localdate(), time.min),
+    )
+    return max(modified, start_of_day)
+
+
+def get_home_page_etag(user_id: int, view: str, tab: str) -> str:
+    """Return ETag of user's home page data rendered by a view."""
+    modified = get_home_page_modified(user_id)
+    return f"{view}-{user_id}-{tab}-{modified.timestamp()}"
+
+
+def get_cached_home_page_data(
+    user_id: int,
+    view: str,
+    tab: str,
+    compute: Callable[[], dict[str, Any]],
+) -> dict[str, Any]:
+    """Return user's home page data of a view from cache.
+
+    Data is computed and cached when it is missing. The cache key includes
+    the current day and the version from `get_home_page_modified`, so
+    invalidation only has to replace the version. Unknown tabs are not
+    cached.
+
+    """
+    if tab not in HOME_PAGE_CACHE["tabs"]:
+        return compute()
+
+    cache_key = HOME_PAGE_CACHE["data_key"].format(
+        user_id=user_id,
+        view=view,
+        tab=tab,
+        day=timezone.localdate().isoformat(),
+        version=get_home_page_modified(user_id).timestamp(),
+    )
+    data = cache.get(cache_key)
+    if data is None:
+        data = compute()
+        cache.set(cache_key, data, HOME_PAGE_CACHE["timeout"])
+    return data
+
+
+def invalidate_home_page(user_id: int) -> None:
+    """Replace the version of user's cached home page data.
+
+    The version is replaced right away and once again after the transaction
+    is committed, so data cached by a concurrent request before the commit
+    is not used.
+
+    """
+    cache_key = HOME_PAGE_CACHE["version_key"].format(user_id=user_id)
+
+    def replace_version() -> None:
+        cache.set(cache_key, timezone.now(), HOME_PAGE_CACHE["timeout"])
+
+    replace_version()
+    transaction.on_commit(replace_version)
@@ -0,0 +1,228 @@
+import codecs
+import csv
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from decimal import Decimal
+from itertools import islice
+from typing import IO, Any
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
+
+from apps.rates.services import (
+    RateHistory,
+    get_historical_rate,
+    get_user_rate_history,
+)
+from apps.transactions.constants import TRANSACTION_IMPORT
+from apps.transactions.models import Category, Transaction, Wallet
+from apps.users.models import User
+
+from .home_page_cache import invalidate_home_page
+from .update_daily_spending import update_daily_spending
+from .update_transaction_stats import recalculate_transaction_stats
+from .update_wallet_balance import (
+    get_transaction_balance_delta,
+    update_wallet_balance,
+)
+
+OFX_TAG_REGEX = re.compile(r"<(/?[A-Z0-9.]+)>([^<\r\n]*)", re.IGNORECASE)
+
+
+def read_csv_transactions(file: IO[bytes]) -> Iterator[dict[str, Any]]:
+    """Read transaction rows from a CSV file line by line.
+
+    The file must have a header with `date` (YYYY-MM-DD), `amount`,
+    `category` (category name) and optional `note` columns.
+
+    """
+    yield from csv.DictReader(codecs.iterdecode(file, "utf-8-sig"))
+
+
+def read_ofx_transactions(file: IO[bytes]) -> Iterator[dict[str, Any]]:
+    """Read transaction rows from an OFX bank statement line by line.
+
+    Both SGML (OFX 1.x) and XML (OFX 2.x) statements are supported. Rows have
+    no category, it is chosen by the sign of the amount.
+
+    """
+    row = None
+    for line in codecs.iterdecode(file, "utf-8-sig"):
+        for tag, value in OFX_TAG_REGEX.findall(line):
+            tag = tag.upper()
+            if tag == "STMTTRN":
+                row = {}
+            elif tag == "/STMTTRN" and row is not None:
+                yield _parse_ofx_row(row)
+                row = None
+            elif row is not None and not tag.startswith("/"):
+                row[tag] = value.strip()
+
+
+def _parse_ofx_row(row: dict[str, str]) -> dict[str, Any]:
+    """Convert an OFX statement transaction to a transaction row."""
+    amount = row.get("TRNAMT", "")
+    is_income = not amount.startswith("-")
+    category = TRANSACTION_IMPORT[
+        "income_category" if is_income else "expense_category"
+    ]
+    posted_date = row.get("DTPOSTED", "")[:8]
+    try:
+        date = datetime.strptime(posted_date, "%Y%m%d").date()
+    except ValueError:
+        date = None
+    return {
+        "date": date,
+        "amount": amount.lstrip("+-"),
+        "category": category,
+        "note": row.get("MEMO") or row.get("NAME", ""),
+    }
+
+
+def read_transactions(
+    file: IO[bytes],
+    file_format: str,
+) -> Iterator[dict[str, Any]]:
+    """Read transaction rows from a file of one of supported formats."""
+    readers = {
+        "csv": read_csv_transactions,
+        "ofx": read_ofx_transactions,
+    }
+    return readers[file_format](file)
+
+
+def _build_transaction(
+    row: dict[str, Any],
+    user: User,
+    wallet: Wallet,
+    categories: dict[str, Category],
+    rate_history: RateHistory,
+) -> Transaction:
+    """Validate an imported row and build an unsaved transaction.
+
+    The transaction gets the rate effective on its date, like saved ones
+    get it on `pre_save`, which `bulk_create` doesn't send.
+
+    Raises:
+        ValidationError: if any value of the row is invalid.
+
+    """
+    errors = {}
+    values = {}
+    for field in ("amount", "date"):
+        try:
+            values[field] = Transaction._meta.get_field(field).clean(
+                row.get(field),
+                None,
+            )
+        except ValidationError as error:
+            errors[field] = error.messages
+    category = categories.get((row.get("category") or "").strip().lower())
+    if not category:
+        errors["category"] = ["Category does not exist."]
+
+    if errors:
+        raise ValidationError(errors)
+    wallet_currency = wallet.currency
+    return Transaction(
+        user=user,
+        wallet=wallet,
+        category=category,
+        amount=values["amount"],
+        date=values["date"],
+        note=row.get("note") or "",
+        applied_rate=get_historical_rate(
+            rate_history,
+            wallet_currency.code if wallet_currency else None,
+            user.default_currency,
+            values["date"],
+        ),
+    )
+
+
+@transaction.atomic
+def import_transactions(
+    user: User,
+    wallet: Wallet,
+    rows: Iterable[dict[str, Any]],
+) -> dict[str, Any]:
+    """Import transaction rows into user's wallet.
+
+    Rows are validated and inserted in chunks, invalid rows are skipped and
+    reported. Wallet's balance, daily spending rollup, user's transaction
+    stats and cached home page are updated once for all imported
+    transactions.
+
+    Returns:
+        dict: number of created transactions, number of invalid rows and
+        errors of the first `max_reported_errors` invalid rows.
+
+    """
+    # User's categories go last to take precedence over default ones
+    categories = {
+        category.name.lower(): category
+        for category in Category.objects.filter(
+            Q(user=user) | Q(user__isnull=True),
+        ).order_by("-user")
+    }
+    rate_history = get_user_rate_history(user)
+    result = {"created_count": 0, "errors_count": 0, "errors": []}
+    balance_delta = Decimal(0)
+    daily_spendings = defaultdict(lambda: [Decimal(0), 0])
+
+    numbered_rows = enumerate(rows, start=1)
+    while chunk := list(
+        islice(numbered_rows, TRANSACTION_IMPORT["chunk_size"]),
+    ):
+        transactions = []
+        for row_number, row in chunk:
+            try:
+                transactions.append(
+                    _build_transaction(
+                        row,
+                        user,
+                        wallet,
+                        categories,
+                        rate_history,
+                    ),
+                )
+            except ValidationError as error:
+                result["errors_count"] += 1
+                if (
+                    len(result["errors"])
+                    < TRANSACTION_IMPORT["max_reported_errors"]
+                ):
+                    result["errors"].append(
+                        {"row": row_number, "errors": error.message_dict},
+                    )
+
+        Transaction.objects.bulk_create(transactions)
+        result["created_count"] += len(transactions)
+        for imported in transactions:
+            balance_delta += get_transaction_balance_delta(imported)
+            daily_spending = daily_spendings[
+                (imported.date, imported.category_id)
+            ]
+            daily_spending[0] += imported.amount
+            daily_spending[1] += 1
+
+    if not result["created_count"]:
+        return result
+
+    update_wallet_balance(wallet.pk, balance_delta)
+    for (spending_date, category_id), (amount, count) in (
+        daily_spendings.items()
+    ):
+        update_daily_spending(
+            user_id=user.pk,
+            spending_date=spending_date,
+            category_id=category_id,
+            amount=amount,
+            count=count,
+        )
+    recalculate_transaction_stats(user.pk)
+    invalidate_home_page(user.pk)
+    return result
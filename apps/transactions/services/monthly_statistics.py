@@ -0,0 +1,49 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.db.models import Q, QuerySet, Sum
+from django.db.models.functions import Coalesce
+
+from apps.transactions.models import MonthlyStatistics
+from apps.users.models import User
+
+
+def refresh_monthly_statistics() -> None:
+    """Recalculate monthly statistics materialized view.
+
+    The view is refreshed concurrently, so statistics stay readable while
+    they are recalculated.
+
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY "
+            f"{MonthlyStatistics._meta.db_table}",
+        )
+
+
+def get_monthly_statistics(
+    user: User,
+    start_month: date,
+    end_month: date,
+    group_by: str | None = None,
+) -> QuerySet:
+    """Get user's income and expense per month in the range of months.
+
+    Statistics are read from the monthly statistics view, so they are
+    grouped by month and optionally by `category` or `wallet`.
+
+    """
+    fields = ["month", group_by] if group_by else ["month"]
+    return MonthlyStatistics.objects.filter(
+        user=user,
+        month__range=(start_month, end_month),
+    ).values(*fields).annotate(
+        income=Coalesce(Sum("amount", filter=Q(is_income=True)), Decimal(0)),
+        expense=Coalesce(
+            Sum("amount", filter=Q(is_income=False)),
+            Decimal(0),
+        ),
+        transactions_count=Sum("count"),
+    ).order_by(*fields)
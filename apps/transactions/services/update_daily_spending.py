@@ -0,0 +1,39 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db.models import F
+
+from apps.transactions.models import DailySpending
+
+
+def update_daily_spending(
+    user_id: int,
+    spending_date: date,
+    category_id: int,
+    amount: Decimal,
+    count: int,
+) -> None:
+    """Add amount and count deltas to a user's daily spending rollup.
+
+    The rollup row is created with zero values if it does not exist yet, then
+    incremented with a database-side expression so concurrent writes do not
+    lose updates. Rows without transactions left are removed.
+
+    """
+    lookup = {
+        "user_id": user_id,
+        "date": spending_date,
+        "category_id": category_id,
+    }
+    if count > 0:
+        DailySpending.objects.bulk_create(
+            [DailySpending(**lookup)],
+            ignore_conflicts=True,
+        )
+    DailySpending.objects.filter(**lookup).update(
+        amount=F("amount") + amount,
+        count=F("count") + count,
+    )
+
+    if count < 0:
+        DailySpending.objects.filter(**lookup, count__lte=0).delete()
@@ -0,0 +1,86 @@
+from datetime import date, timedelta
+
+from django.db import transaction
+
+from apps.transactions.constants import PREMIUM_USER
+from apps.transactions.models import Transaction
+from apps.users.models import User
+
+from .get_activity_analytics import get_activity_analytics
+
+TRANSACTION_STATS_FIELDS = (
+    "is_premium",
+    "transaction_count",
+    "transaction_streak",
+    "last_transaction_date",
+    "streak_start_date",
+)
+
+
+def _update_premium_status(user: User) -> None:
+    """Upgrade user to premium once their stats pass the thresholds."""
+    if (
+        user.transaction_count >= PREMIUM_USER["transaction_count"] and
+        user.transaction_streak >= PREMIUM_USER["transaction_streak"]
+    ):
+        user.is_premium = True
+
+
+def _get_locked_user(user_id: int) -> User | None:
+    """Get user with only transaction stats and lock their row."""
+    return User.objects.select_for_update(no_key=True).only(
+        *TRANSACTION_STATS_FIELDS,
+    ).filter(pk=user_id).first()
+
+
+@transaction.atomic
+def add_transaction_to_stats(user_id: int, transaction_date: date) -> None:
+    """Add a created transaction to the user's transaction stats.
+
+    Transactions made on or after the current streak are counted without
+    reading other transactions. A backdated transaction may join older
+    streaks, so the stats are recalculated in that case.
+
+    """
+    user = _get_locked_user(user_id)
+    if user is None:
+        return
+
+    last_date = user.last_transaction_date
+    if last_date is None or transaction_date > last_date + timedelta(days=1):
+        user.streak_start_date = transaction_date
+    elif transaction_date < user.streak_start_date:
+        recalculate_transaction_stats(user_id)
+        return
+    if last_date is None or transaction_date > last_date:
+        user.last_transaction_date = transaction_date
+    user.transaction_count += 1
+    user.transaction_streak = max(
+        user.transaction_streak,
+        (user.last_transaction_date - user.streak_start_date).days + 1,
+    )
+    _update_premium_status(user)
+    user.save(update_fields=TRANSACTION_STATS_FIELDS)
+
+
+@transaction.atomic
+def recalculate_transaction_stats(user_id: int) -> None:
+    """Recalculate the user's transaction stats from all their transactions.
+
+    Used after transactions are deleted or moved and for backfilling. Premium
+    status is never revoked.
+
+    """
+    user = _get_locked_user(user_id)
+    if user is None:
+        return
+
+    analytics = get_activity_analytics(user_id)
+    user.transaction_count = Transaction.objects.filter(
+        user_id=user_id,
+    ).count()
+    user.transaction_streak = analytics["longest_streak"]
+    user.last_transaction_date = analytics["last_active_date"]
+    user.streak_start_date = analytics["last_streak_start"]
+    _update_premium_status(user)
+    user.save(update_fields=TRANSACTION_STATS_FIELDS)
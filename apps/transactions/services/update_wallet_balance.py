@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+from django.db.models import F, Sum
+
+from apps.rates.services import get_rate_as_of
+from apps.transactions.models import Category, Transaction, Wallet
+
+
+def get_transaction_rate(transaction: Transaction) -> Decimal:
+    """Get rate from wallet's currency to user's default currency.
+
+    The rate is the one effective on the transaction's date.
+
+    """
+    wallet_currency = transaction.wallet.currency
+    return get_rate_as_of(
+        transaction.user_id,
+        wallet_currency.code if wallet_currency else None,
+        transaction.user.default_currency,
+        transaction.date,
+    )
+
+
+def get_transaction_balance_delta(transaction: Transaction) -> Decimal:
+    """Get the change a transaction makes to its wallet's balance.
+
+    Transaction amount is in user's default currency, so it is converted to
+    wallet's currency with the rate applied to the transaction. The same
+    rate reverts the transaction, even if user's rates have changed since.
+    Expenses reduce the balance, incomes increase it.
+
+    """
+    delta = transaction.amount / transaction.applied_rate
+    return delta if transaction.category.is_income else -delta
+
+
+def update_wallet_balance(wallet_id: int, delta: Decimal) -> None:
+    """Add delta to wallet's balance.
+
+    The balance is changed with a database-side expression, so concurrent
+    updates of the same wallet are not lost.
+
+    """
+    Wallet.objects.filter(pk=wallet_id).update(balance=F("balance") + delta)
+
+
+def add_transaction_to_balance(transaction: Transaction) -> None:
+    """Apply a created or updated transaction to its wallet's balance."""
+    update_wallet_balance(
+        transaction.wallet_id,
+        get_transaction_balance_delta(transaction),
+    )
+
+
+def remove_transaction_from_balance(transaction: Transaction) -> None:
+    """Revert a deleted or outdated transaction from its wallet's balance."""
+    update_wallet_balance(
+        transaction.wallet_id,
+        -get_transaction_balance_delta(transaction),
+    )
+
+
+def remove_category_from_balances(category: Category) -> None:
+    """Revert all transactions of a category from their wallets' balances.
+
+    Transactions are summed per wallet by the database, so a category with
+    many transactions is reverted with one update per wallet.
+
+    """
+    for wallet_id, total in Transaction.objects.filter(
+        category=category,
+    ).values("wallet_id").annotate(
+        total=Sum(F("amount") / F("applied_rate")),
+    ).values_list("wallet_id", "total"):
+        update_wallet_balance(
+            wallet_id,
+            -total if category.is_income else total,
+        )
@@ -0,0 +1,287 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from apps.rates.models import ExchangeRate
+from apps.users.models import Friendship, User
+
+from .models import Category, Transaction, Wallet
+from .services import (
+    add_transaction_to_balance,
+    add_transaction_to_stats,
+    get_transaction_balance_delta,
+    get_transaction_rate,
+    invalidate_home_page,
+    recalculate_transaction_stats,
+    remove_category_from_balances,
+    remove_transaction_from_balance,
+    update_daily_spending,
+    update_wallet_balance,
+)
+
+ROLLUP_FIELDS = ("user_id", "date", "category_id", "amount")
+BALANCE_FIELDS = ("wallet_id", "amount", "applied_rate", "category__is_income")
+
+
+def get_origin_model(origin) -> type[Model] | None:
+    """Get model of the instance or queryset a deletion started from."""
+    if isinstance(origin, Model):
+        return type(origin)
+    return getattr(origin, "model", None)
+
+
+@receiver(pre_save, sender=Transaction)
+def set_transaction_applied_rate(
+    sender,
+    instance: Transaction,
+    **kwargs,
+) -> None:
+    """Apply the rate effective on the transaction's date to it."""
+    instance.applied_rate = get_transaction_rate(instance)
+
+
+@receiver(pre_save, sender=Transaction)
+def remember_previous_state(
+    sender,
+    instance: Transaction,
+    **kwargs,
+) -> None:
+    """Store the persisted rollup and balance state of a transaction.
+
+    Both are read in one query before an update, so the saved transaction
+    can be moved in daily spending rollups and wallets' balances.
+
+    """
+    instance.previous_rollup_state = None
+    instance.previous_balance_state = None
+    if instance.pk is None:
+        return
+
+    state = sender.objects.filter(
+        pk=instance.pk,
+    ).values(*ROLLUP_FIELDS, *BALANCE_FIELDS).first()
+    if state is None:
+        return
+
+    instance.previous_rollup_state = {
+        field: state[field] for field in ROLLUP_FIELDS
+    }
+    delta = state["amount"] / state["applied_rate"]
+    instance.previous_balance_state = (
+        state["wallet_id"],
+        delta if state["category__is_income"] else -delta,
+    )
+
+
+@receiver(post_save, sender=Transaction)
+def add_transaction_to_daily_spending(
+    sender,
+    instance: Transaction,
+    created: bool,
+    **kwargs,
+) -> None:
+    """Keep the daily spending rollup in sync with a saved transaction."""
+    previous_state = getattr(instance, "previous_rollup_state", None)
+    current_state = {
+        field: getattr(instance, field) for field in ROLLUP_FIELDS
+    }
+
+    if not created and previous_state == current_state:
+        return
+
+    if previous_state:
+        update_daily_spending(
+            user_id=previous_state["user_id"],
+            spending_date=previous_state["date"],
+            category_id=previous_state["category_id"],
+            amount=-previous_state["amount"],
+            count=-1,
+        )
+    update_daily_spending(
+        user_id=instance.user_id,
+        spending_date=instance.date,
+        category_id=instance.category_id,
+        amount=instance.amount,
+        count=1,
+    )
+
+
+@receiver(post_delete, sender=Transaction)
+def remove_transaction_from_daily_spending(
+    sender,
+    instance: Transaction,
+    **kwargs,
+) -> None:
+    """Subtract a deleted transaction from the daily spending rollup."""
+    update_daily_spending(
+        user_id=instance.user_id,
+        spending_date=instance.date,
+        category_id=instance.category_id,
+        amount=-instance.amount,
+        count=-1,
+    )
+
+
+@receiver(post_save, sender=Transaction)
+def apply_transaction_to_balance(
+    sender,
+    instance: Transaction,
+    **kwargs,
+) -> None:
+    """Move a saved transaction in its wallets' balances.
+
+    The previous state is reverted and the current one is applied, unless
+    the change doesn't affect balances.
+
+    """
+    previous_state = getattr(instance, "previous_balance_state", None)
+    if previous_state is None:
+        add_transaction_to_balance(instance)
+        return
+
+    current_state = (
+        instance.wallet_id,
+        get_transaction_balance_delta(instance),
+    )
+    if previous_state == current_state:
+        return
+    update_wallet_balance(previous_state[0], -previous_state[1])
+    update_wallet_balance(*current_state)
+
+
+@receiver(post_delete, sender=Transaction)
+def revert_transaction_from_balance(
+    sender,
+    instance: Transaction,
+    origin=None,
+    **kwargs,
+) -> None:
+    """Revert a deleted transaction from its wallet's balance.
+
+    Skipped when the wallet is deleted as well. Transactions deleted with a
+    category are reverted per wallet before the deletion.
+
+    """
+    if get_origin_model(origin) in (User, Wallet, Category):
+        return
+    remove_transaction_from_balance(instance)
+
+
+@receiver(pre_delete, sender=Category)
+def revert_category_from_balances(
+    sender,
+    instance: Category,
+    origin=None,
+    **kwargs,
+) -> None:
+    """Revert transactions of a category being deleted from balances.
+
+    Skipped when the category is deleted with its user and their wallets.
+
+    """
+    if get_origin_model(origin) is User:
+        return
+    remove_category_from_balances(instance)
+
+
+@receiver(post_save, sender=Transaction)
+def update_user_transaction_stats(
+    sender,
+    instance: Transaction,
+    created: bool,
+    **kwargs,
+) -> None:
+    """Keep user's transaction count and streak in sync with transactions."""
+    if created:
+        add_transaction_to_stats(instance.user_id, instance.date)
+        return
+
+    previous_state = getattr(instance, "previous_rollup_state", None)
+    if not previous_state or (
+        previous_state["user_id"] == instance.user_id and
+        previous_state["date"] == instance.date
+    ):
+        return
+
+    recalculate_transaction_stats(instance.user_id)
+    if previous_state["user_id"] != instance.user_id:
+        recalculate_transaction_stats(previous_state["user_id"])
+
+
+@receiver(post_delete, sender=Transaction)
+def remove_transaction_from_user_stats(
+    sender,
+    instance: Transaction,
+    origin=None,
+    **kwargs,
+) -> None:
+    """Recalculate user's transaction stats after a transaction is deleted.
+
+    Skipped when the user is deleted with all their transactions. When many
+    transactions are deleted at once (with a wallet, a category or a
+    queryset), stats of each affected user are recalculated once, after
+    the deletion is committed.
+
+    """
+    if isinstance(origin, User):
+        return
+    if origin is None or isinstance(origin, Transaction):
+        recalculate_transaction_stats(instance.user_id)
+        return
+
+    # Users scheduled for recalculation are remembered on the deletion's
+    # origin, which is shared by all transactions it deletes
+    scheduled_user_ids = origin.__dict__.setdefault(
+        "scheduled_stats_user_ids",
+        set(),
+    )
+    if instance.user_id in scheduled_user_ids:
+        return
+    scheduled_user_ids.add(instance.user_id)
+    transaction.on_commit(
+        partial(recalculate_transaction_stats, instance.user_id),
+    )
+
+
+@receiver(post_save, sender=Transaction)
+@receiver(post_delete, sender=Transaction)
+@receiver(post_save, sender=Wallet)
+@receiver(post_delete, sender=Wallet)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=ExchangeRate)
+@receiver(post_delete, sender=ExchangeRate)
+def invalidate_owner_home_page(sender, instance, **kwargs) -> None:
+    """Drop cached home page of the owner of a changed object.
+
+    Default categories have no owner, they are changed by admins only.
+
+    """
+    if instance.user_id is not None:
+        invalidate_home_page(instance.user_id)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_home_page(sender, instance: User, **kwargs) -> None:
+    """Drop cached home page of a user after their profile is changed."""
+    invalidate_home_page(instance.pk)
+
+
+@receiver(post_save, sender=Friendship)
+@receiver(post_delete, sender=Friendship)
+def invalidate_friends_home_page(
+    sender,
+    instance: Friendship,
+    **kwargs,
+) -> None:
+    """Drop cached home pages of users whose friends are changed."""
+    invalidate_home_page(instance.from_user_id)
+    invalidate_home_page(instance.to_user_id)
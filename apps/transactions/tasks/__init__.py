@@ -1,3 +1,5 @@
 from .generate_admin_weekly_report import generate_admin_weekly_report
 from .generate_transaction_report import generate_transaction_report
+from .refresh_monthly_statistics import refresh_monthly_statistics
 from .send_shared_bill_notification import send_shared_bill_notification
+from .send_transaction_reports import send_transaction_reports
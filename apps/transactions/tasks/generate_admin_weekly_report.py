@@ -4,7 +4,7 @@ from django.utils import timezone
 from config.celery import app
 from libs.notifications.email import DefaultEmailNotification
 
-from apps.transactions.models import Transaction
+from apps.transactions.services import generate_weekly_report
 from apps.users.models import User
 
 
@@ -15,31 +15,27 @@ def generate_admin_weekly_report() -> None:
     The weekly report includes:
         - Total number of transactions made by users.
         - Total number of categories used by users.
-        - Total number of new users.
+        - Number of active users and list of new users.
+        - Total volume by currency and per-day breakdowns.
 
-    """
-    end_date = timezone.now()
-    start_date = end_date - timezone.timedelta(days=7)
-
-    new_users = User.objects.filter(
-        created__range=[start_date, end_date],
-    ).values_list("username", flat=True)
-    transactions = Transaction.objects.filter(
-        created__range=(start_date, end_date),
-    ).select_related("category")
+    The report covers the last 7 days before today, it is stored as a
+    `WeeklyReport` snapshot, which is available in admin.
 
-    total_transactions = transactions.count()
-    total_category_used = transactions.values("category").distinct().count()
+    """
+    end_date = timezone.localdate() - timezone.timedelta(days=1)
+    start_date = end_date - timezone.timedelta(days=6)
+    report = generate_weekly_report(start_date, end_date)
 
     report_email = DefaultEmailNotification(
         subject="Admin Weekly Report",
         from_email=settings.SERVER_EMAIL,
-        recipient_list=User.objects.filter(
-            is_staff=True,
-        ).values_list("email", flat=True),
+        recipient_list=list(
+            User.objects.filter(
+                is_staff=True,
+            ).values_list("email", flat=True),
+        ),
         template="transactions/emails/admin_weekly_report.html",
-        new_users=new_users,
-        total_transactions=total_transactions,
-        total_category_used=total_category_used,
+        plain_template="transactions/emails/admin_weekly_report.txt",
+        report=report,
     )
     report_email.send()
@@ -1,12 +1,20 @@
-from django.conf import settings
+from itertools import islice
+
+from django.core.cache import cache
 from django.utils import timezone
 
+from celery import group
+
 from config.celery import app
-from libs.notifications.email import DefaultEmailNotification
 
-from apps.transactions.models import Transaction
+from apps.transactions.constants import TRANSACTION_REPORT
 from apps.users.models import User
 
+from .send_transaction_reports import (
+    get_report_cache_key,
+    send_transaction_reports,
+)
+
 
 @app.task
 def generate_transaction_report() -> None:
@@ -15,22 +23,39 @@ def generate_transaction_report() -> None:
     At the end of every week, generate a report about transactions of the week
     and send it to the user's email.
 
-    """
-    end_date = timezone.now()
-    start_date = end_date - timezone.timedelta(days=7)
+    Users are split into batches of `batch_size`, which are sent by a group
+    of `send_transaction_reports` subtasks in parallel. Progress of the
+    report is counted in cache under keys of the week's end date.
 
-    for user in User.objects.all():
-        transactions = Transaction.objects.filter(
-            user=user,
-            date__range=(start_date, end_date),
-        )
-
-        report_email = DefaultEmailNotification(
-            subject="Transaction Report",
-            from_email=settings.SERVER_EMAIL,
-            recipient_list=[user.email],
-            template="transactions/emails/weekly_report.html",
-            username=user.username,
-            transactions=transactions,
+    """
+    end_date = timezone.localdate()
+    start_date = end_date - timezone.timedelta(
+        days=TRANSACTION_REPORT["period_days"],
+    )
+
+    user_ids = User.objects.order_by("pk").values_list(
+        "pk",
+        flat=True,
+    ).iterator()
+    batches = []
+    while batch := list(islice(user_ids, TRANSACTION_REPORT["batch_size"])):
+        batches.append(batch)
+
+    report_date = end_date.isoformat()
+    cache.set_many(
+        {
+            get_report_cache_key(report_date, "users_count"): sum(
+                len(batch) for batch in batches
+            ),
+            get_report_cache_key(report_date, "batches_count"): len(batches),
+        },
+        TRANSACTION_REPORT["cache_timeout"],
+    )
+    group(
+        send_transaction_reports.s(
+            batch,
+            start_date.isoformat(),
+            report_date,
         )
-        report_email.send()
+        for batch in batches
+    ).apply_async()
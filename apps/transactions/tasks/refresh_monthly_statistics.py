@@ -0,0 +1,9 @@
+from config.celery import app
+
+from apps.transactions import services
+
+
+@app.task
+def refresh_monthly_statistics() -> None:
+    """Recalculate monthly statistics of all users' transactions."""
+    services.refresh_monthly_statistics()
@@ -1,7 +1,7 @@
-from django.db.models import QuerySet
-
 from celery import shared_task
 
+from libs.notifications.email import send_email_notifications
+
 from apps.transactions.models import Transaction
 from apps.users.models import User
 from apps.users.notifications import SharedBillEmailNotification
@@ -9,18 +9,30 @@ from apps.users.notifications import SharedBillEmailNotification
 
 @shared_task
 def send_shared_bill_notification(
-    user: User,
-    friends: QuerySet,
-    transaction: Transaction,
+    transaction_id: int,
+    friend_ids: list[int],
 ) -> None:
     """Send a mail notification about a shared bill transaction to users."""
-    subject = f"You were tagged in a transaction by {user.username}!"
+    transaction = Transaction.objects.select_related(
+        "user",
+        "category",
+    ).filter(pk=transaction_id).first()
+    if transaction is None:
+        return
 
-    for friend in friends:
-        email = SharedBillEmailNotification(
-            subject=subject,
-            recipient_list=[friend.email],
-            transaction=transaction,
-            username=friend.username,
-        )
-        email.send()
+    username = transaction.user.username
+    subject = f"You were tagged in a transaction by {username}!"
+    send_email_notifications(
+        [
+            SharedBillEmailNotification(
+                subject=subject,
+                recipient_list=[friend.email],
+                transaction=transaction,
+                username=friend.username,
+            )
+            for friend in User.objects.filter(pk__in=friend_ids).only(
+                "username",
+                "email",
+            )
+        ],
+    )
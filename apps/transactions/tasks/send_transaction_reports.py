@@ -0,0 +1,134 @@
+from collections import defaultdict
+from datetime import date
+from smtplib import SMTPException
+
+from django.core.cache import cache
+
+from celery.utils.log import get_task_logger
+
+from config.celery import app
+from libs.notifications.email import send_email_notifications
+
+from apps.transactions.constants import TRANSACTION_REPORT
+from apps.transactions.models import Transaction
+from apps.users.models import User
+from apps.users.notifications import TransactionReportEmailNotification
+
+logger = get_task_logger(__name__)
+
+REPORT_PROGRESS_COUNTERS = (
+    "users_count",
+    "batches_count",
+    "done_batches_count",
+    "sent_count",
+)
+
+
+def get_report_cache_key(report_date: str, name: str) -> str:
+    """Return cache key of a weekly report's progress value or sent mark."""
+    return f"transactions:weekly_report:{report_date}:{name}"
+
+
+def get_transaction_report_progress(report_date: str) -> dict[str, int]:
+    """Return progress counters of a weekly report ending on the date."""
+    values = cache.get_many(
+        [
+            get_report_cache_key(report_date, name)
+            for name in REPORT_PROGRESS_COUNTERS
+        ],
+    )
+    return {
+        name: values.get(get_report_cache_key(report_date, name), 0)
+        for name in REPORT_PROGRESS_COUNTERS
+    }
+
+
+def increment_report_progress(
+    report_date: str,
+    name: str,
+    delta: int = 1,
+) -> int:
+    """Increment a progress counter of a weekly report."""
+    key = get_report_cache_key(report_date, name)
+    cache.add(key, 0, TRANSACTION_REPORT["cache_timeout"])
+    return cache.incr(key, delta)
+
+
+@app.task(
+    autoretry_for=(SMTPException,),
+    max_retries=TRANSACTION_REPORT["max_retries"],
+    retry_backoff=True,
+)
+def send_transaction_reports(
+    user_ids: list[int],
+    start_date: str,
+    end_date: str,
+) -> int:
+    """Send weekly transaction reports to a batch of users.
+
+    Transactions of all users of the batch are loaded in one query and the
+    reports are sent through one connection. Each user is marked as sent in
+    cache before sending, so a retried batch skips users who already got the
+    report. The mark is removed if sending fails and the batch is retried to
+    send the failed reports again.
+
+    Returns:
+        int: number of sent reports.
+
+    """
+    users = User.objects.filter(pk__in=user_ids).only("username", "email")
+    transactions = defaultdict(list)
+    for transaction in Transaction.objects.filter(
+        user_id__in=user_ids,
+        date__range=(
+            date.fromisoformat(start_date),
+            date.fromisoformat(end_date),
+        ),
+    ).select_related("category").order_by("date", "id"):
+        transactions[transaction.user_id].append(transaction)
+
+    sent_keys = []
+    notifications = []
+    for user in users:
+        sent_key = get_report_cache_key(end_date, f"sent:{user.pk}")
+        if not cache.add(sent_key, True, TRANSACTION_REPORT["cache_timeout"]):
+            continue
+        sent_keys.append(sent_key)
+        notifications.append(
+            TransactionReportEmailNotification(
+                recipient_list=[user.email],
+                username=user.username,
+                transactions=transactions[user.pk],
+            ),
+        )
+
+    try:
+        results = send_email_notifications(notifications)
+    except Exception:
+        cache.delete_many(sent_keys)
+        raise
+
+    failed_keys = [
+        sent_key
+        for sent_key, is_sent in zip(sent_keys, results)
+        if not is_sent
+    ]
+    sent_count = len(results) - len(failed_keys)
+    if sent_count:
+        increment_report_progress(end_date, "sent_count", sent_count)
+    if failed_keys:
+        cache.delete_many(failed_keys)
+        raise SMTPException(f"Failed to send {len(failed_keys)} reports.")
+
+    done_batches_count = increment_report_progress(
+        end_date,
+        "done_batches_count",
+    )
+    logger.info(
+        "Weekly report %s: %s of %s batches done, %s reports sent by batch.",
+        end_date,
+        done_batches_count,
+        cache.get(get_report_cache_key(end_date, "batches_count")),
+        sent_count,
+    )
+    return sent_count
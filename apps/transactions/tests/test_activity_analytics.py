@@ -0,0 +1,71 @@
+from datetime import date
+
+from apps.transactions.factories import TransactionFactory
+from apps.transactions.models import Wallet
+from apps.transactions.services import get_activity_analytics
+from apps.users.models import User
+
+TRANSACTION_DATES = (
+    date(2023, 1, 30),
+    date(2023, 1, 31),
+    date(2023, 2, 1),
+    date(2023, 2, 1),
+    date(2023, 2, 5),
+    date(2023, 2, 6),
+)
+
+
+def create_transactions(user: User, wallet: Wallet) -> None:
+    """Create user's transactions on `TRANSACTION_DATES`."""
+    for transaction_date in TRANSACTION_DATES:
+        TransactionFactory(user=user, wallet=wallet, date=transaction_date)
+
+
+def test_get_activity_analytics(
+    django_assert_num_queries,
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure streaks and active days are computed by one query."""
+    create_transactions(normal_user, wallet)
+
+    with django_assert_num_queries(1):
+        analytics = get_activity_analytics(
+            normal_user.pk,
+            today=date(2023, 2, 7),
+        )
+
+    assert analytics == {
+        "current_streak": 2,
+        "longest_streak": 3,
+        "last_streak_start": date(2023, 2, 5),
+        "last_active_date": date(2023, 2, 6),
+        "active_days_by_month": {
+            date(2023, 1, 1): 2,
+            date(2023, 2, 1): 3,
+        },
+    }
+
+
+def test_get_activity_analytics_broken_streak(
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure current streak is over if there are no transactions today."""
+    create_transactions(normal_user, wallet)
+
+    analytics = get_activity_analytics(normal_user.pk, today=date(2023, 2, 8))
+
+    assert analytics["current_streak"] == 0
+    assert analytics["longest_streak"] == 3
+
+
+def test_get_activity_analytics_without_transactions(
+    another_user: User,
+) -> None:
+    """Ensure analytics of a user without transactions are empty."""
+    analytics = get_activity_analytics(another_user.pk)
+
+    assert analytics["longest_streak"] == 0
+    assert analytics["last_active_date"] is None
+    assert analytics["active_days_by_month"] == {}
@@ -0,0 +1,166 @@
+from typing import Callable
+
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from apps.transactions.factories import (
+    CategoryFactory,
+    TransactionFactory,
+    WalletFactory,
+)
+from apps.transactions.models import Transaction, Wallet
+from apps.users.factories import FriendshipFactory, UserFactory
+from apps.users.models import User
+
+
+def add_friends(user: User, count: int) -> None:
+    """Add new friends to the user."""
+    for friend in UserFactory.create_batch(count):
+        FriendshipFactory(from_user=user, to_user=friend)
+
+
+def test_transaction_list_api_queries_count(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure transaction list api doesn't make queries per transaction."""
+
+    def add_transactions(count: int) -> None:
+        TransactionFactory.create_batch(count, user=normal_user, wallet=wallet)
+        add_friends(normal_user, count)
+
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:transaction-list"),
+        add_transactions,
+    )
+
+
+def test_transaction_detail_api_queries_count(
+    api_client: APIClient,
+    normal_user: User,
+    transaction: Transaction,
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure transaction detail api doesn't make queries per user's friend."""
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:transaction-detail", kwargs={"pk": transaction.pk}),
+        lambda count: add_friends(normal_user, count),
+    )
+
+
+def test_wallet_list_api_queries_count(
+    api_client: APIClient,
+    normal_user: User,
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure wallet list api doesn't make queries per wallet."""
+
+    def add_wallets(count: int) -> None:
+        for wallet in WalletFactory.create_batch(count, user=normal_user):
+            TransactionFactory(user=normal_user, wallet=wallet)
+
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:wallet-list"),
+        add_wallets,
+    )
+
+
+def test_wallet_detail_api_queries_count(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure wallet detail api doesn't make queries per transaction."""
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:wallet-detail", kwargs={"pk": wallet.pk}),
+        lambda count: TransactionFactory.create_batch(
+            count,
+            user=normal_user,
+            wallet=wallet,
+        ),
+    )
+
+
+def test_wallet_transactions_api_queries_count(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure wallet transactions api doesn't make queries per transaction."""
+
+    def add_transactions(count: int) -> None:
+        TransactionFactory.create_batch(count, user=normal_user, wallet=wallet)
+        add_friends(normal_user, count)
+
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:wallet-transactions", kwargs={"pk": wallet.pk}),
+        add_transactions,
+    )
+
+
+def test_category_list_api_queries_count(
+    api_client: APIClient,
+    normal_user: User,
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure category list api doesn't make queries per category."""
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:category-list"),
+        lambda count: CategoryFactory.create_batch(count, user=normal_user),
+    )
+
+
+def test_category_detail_api_queries_count(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure category detail api doesn't make queries per transaction."""
+    category = CategoryFactory(user=normal_user)
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:category-detail", kwargs={"pk": category.pk}),
+        lambda count: TransactionFactory.create_batch(
+            count,
+            user=normal_user,
+            wallet=wallet,
+            category=category,
+        ),
+    )
+
+
+def test_category_transactions_api_queries_count(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure category transactions api doesn't query per transaction."""
+    category = CategoryFactory(user=normal_user)
+
+    def add_transactions(count: int) -> None:
+        TransactionFactory.create_batch(
+            count,
+            user=normal_user,
+            wallet=wallet,
+            category=category,
+        )
+        add_friends(normal_user, count)
+
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:category-transactions", kwargs={"pk": category.pk}),
+        add_transactions,
+    )
@@ -6,6 +6,7 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from apps.transactions.factories import TransactionFactory, WalletFactory
 from apps.transactions.models import Category
 from apps.users.models import User
 
@@ -50,6 +51,43 @@ def test_user_defined_category_detail_api(
     assert response.status_code == status.HTTP_200_OK
 
 
+def test_default_category_transactions_api(
+    api_client: APIClient,
+    normal_user: User,
+    another_user: User,
+    first_default_category: Category,
+) -> None:
+    """Ensure default category shows only user's own transactions."""
+    TransactionFactory.create_batch(
+        2,
+        user=normal_user,
+        wallet=WalletFactory(user=normal_user),
+        category=first_default_category,
+    )
+    TransactionFactory(
+        user=another_user,
+        wallet=WalletFactory(user=another_user),
+        category=first_default_category,
+    )
+
+    detail_response = api_client.get(
+        reverse(
+            "v1:category-detail",
+            kwargs={"pk": first_default_category.pk},
+        ),
+    )
+    transactions_response = api_client.get(
+        reverse(
+            "v1:category-transactions",
+            kwargs={"pk": first_default_category.pk},
+        ),
+    )
+
+    assert detail_response.data["transactions_count"] == 2
+    assert transactions_response.status_code == status.HTTP_200_OK
+    assert transactions_response.data["count"] == 2
+
+
 def test_not_owned_category_detail_api(
     another_api_client: APIClient,
     user_defined_category: Category,
@@ -1,7 +1,21 @@
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 
 from rest_framework.test import APIClient
 
+from apps.rates.factories import ExchangeRateFactory
+from apps.rates.models import Currency
+from apps.transactions.factories import TransactionFactory, WalletFactory
+from apps.transactions.models import Wallet
+from apps.users.factories import UserFactory
+from apps.users.models import User
+
+# Includes the savepoint queries of the atomic request
+HOME_API_MAX_QUERIES_COUNT = 8
+
 
 def test_homepage_api(api_client: APIClient) -> None:
     """Ensure homepage api responses with status code 200 and has data."""
@@ -9,3 +23,111 @@ def test_homepage_api(api_client: APIClient) -> None:
 
     assert response.status_code == 200
     assert response.data
+
+
+def get_homepage_api_queries_count(api_client: APIClient) -> int:
+    """Return number of queries made by a homepage api request."""
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(reverse("v1:home"))
+
+    assert response.status_code == 200
+    return len(context.captured_queries)
+
+
+def test_homepage_api_queries_count(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure homepage api queries count does not grow with user's data.
+
+    Adding wallets, exchange rates and transactions in more currencies must
+    not add any query to the homepage api.
+
+    """
+    TransactionFactory(user=normal_user, wallet=wallet)
+    initial_queries_count = get_homepage_api_queries_count(api_client)
+
+    destination_currency = Currency.objects.get(
+        code=normal_user.default_currency,
+    )
+    for currency in Currency.objects.exclude(pk=destination_currency.pk):
+        ExchangeRateFactory(
+            user=normal_user,
+            source_currency=currency,
+            destination_currency=destination_currency,
+        )
+        currency_wallet = WalletFactory(user=normal_user, currency=currency)
+        TransactionFactory.create_batch(
+            3,
+            user=normal_user,
+            wallet=currency_wallet,
+            date=timezone.now().date(),
+        )
+
+    assert get_homepage_api_queries_count(api_client) == initial_queries_count
+    assert initial_queries_count <= HOME_API_MAX_QUERIES_COUNT
+
+
+def test_homepage_api_not_modified(api_client: APIClient) -> None:
+    """Ensure unchanged homepage is answered with 304 from cache only."""
+    response = api_client.get(reverse("v1:home"))
+
+    with CaptureQueriesContext(connection) as context:
+        not_modified_response = api_client.get(
+            reverse("v1:home"),
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+
+    assert not_modified_response.status_code == 304
+    assert all(
+        "SAVEPOINT" in query["sql"] for query in context.captured_queries
+    )
+
+
+def test_homepage_api_invalidated_by_transaction(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure homepage is recomputed after user's transaction is created."""
+    response = api_client.get(reverse("v1:home"))
+
+    transaction = TransactionFactory(user=normal_user, wallet=wallet)
+    modified_response = api_client.get(
+        reverse("v1:home"),
+        HTTP_IF_NONE_MATCH=response["ETag"],
+    )
+
+    assert modified_response.status_code == 200
+    assert modified_response["ETag"] != response["ETag"]
+    assert modified_response.data["recent_transactions"][0]["note"] == (
+        transaction.note
+    )
+
+
+def test_homepage_api_invalidated_by_admin_balance_change(
+    api_client: APIClient,
+    wallet: Wallet,
+) -> None:
+    """Ensure homepage is recomputed after admin increases wallet's balance."""
+    response = api_client.get(reverse("v1:home"))
+    admin_client = Client()
+    admin_client.force_login(UserFactory(is_staff=True, is_superuser=True))
+
+    admin_client.post(
+        reverse("admin:transactions_wallet_changelist"),
+        {
+            "action": "modify_balance",
+            "_selected_action": [wallet.pk],
+            "add": "Add",
+            f"balance_modify_{wallet.pk}": "10",
+        },
+    )
+    modified_response = api_client.get(
+        reverse("v1:home"),
+        HTTP_IF_NONE_MATCH=response["ETag"],
+    )
+
+    assert modified_response.status_code == 200
+    assert modified_response["ETag"] != response["ETag"]
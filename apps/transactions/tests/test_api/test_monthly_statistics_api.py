@@ -0,0 +1,96 @@
+from datetime import date
+from decimal import Decimal
+
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+import pytest
+
+from apps.transactions.factories import TransactionFactory
+from apps.transactions.models import Category, Wallet
+from apps.transactions.services import refresh_monthly_statistics
+from apps.users.models import User
+
+
+@pytest.fixture
+def monthly_transactions(normal_user: User, wallet: Wallet) -> None:
+    """Create income and expenses in two months and refresh statistics."""
+    income_category = Category.objects.filter(
+        user__isnull=True,
+        is_income=True,
+    ).first()
+    expense_category = Category.objects.filter(
+        user__isnull=True,
+        is_income=False,
+    ).first()
+    for day, category, amount in (
+        (date(2023, 1, 5), income_category, Decimal(100)),
+        (date(2023, 1, 20), expense_category, Decimal(30)),
+        (date(2023, 1, 25), expense_category, Decimal(20)),
+        (date(2023, 3, 1), expense_category, Decimal(10)),
+    ):
+        TransactionFactory(
+            user=normal_user,
+            wallet=wallet,
+            category=category,
+            amount=amount,
+            date=day,
+        )
+    refresh_monthly_statistics()
+
+
+def test_monthly_statistics_api(
+    api_client: APIClient,
+    normal_user: User,
+    monthly_transactions: None,
+) -> None:
+    """Ensure income and expense are summed per month of the range."""
+    response = api_client.get(
+        reverse("v1:monthly-statistics"),
+        {"start_month": "2023-01", "end_month": "2023-02"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["currency"] == normal_user.default_currency
+    assert response.data["results"] == [
+        {
+            "month": "2023-01",
+            "income": "100.000",
+            "expense": "50.000",
+            "transactions_count": 3,
+        },
+    ]
+
+
+def test_monthly_statistics_api_group_by_category(
+    api_client: APIClient,
+    monthly_transactions: None,
+) -> None:
+    """Ensure statistics can be grouped by category in each month."""
+    response = api_client.get(
+        reverse("v1:monthly-statistics"),
+        {
+            "start_month": "2023-01",
+            "end_month": "2023-12",
+            "group_by": "category",
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert sorted(
+        (row["month"], row["transactions_count"])
+        for row in response.data["results"]
+    ) == [("2023-01", 1), ("2023-01", 2), ("2023-03", 1)]
+    assert all("category" in row for row in response.data["results"])
+
+
+def test_monthly_statistics_api_invalid_range(api_client: APIClient) -> None:
+    """Ensure start month after end month is rejected."""
+    response = api_client.get(
+        reverse("v1:monthly-statistics"),
+        {"start_month": "2023-05", "end_month": "2023-01"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -13,7 +13,7 @@ import pytest
 from pytest_lazyfixture import lazy_fixture
 
 from apps.transactions.constants import PREMIUM_USER
-from apps.transactions.factories import TransactionFactory
+from apps.transactions.factories import TransactionFactory, WalletFactory
 from apps.transactions.models import Transaction, Wallet
 from apps.users.factories import UserFactory
 from apps.users.models import User
@@ -51,13 +51,14 @@ def invalid_data_amount(
 
 
 @pytest.fixture
-def transactions_premium_by_streak(normal_user: User, wallet: Wallet) -> None:
+def transactions_premium_by_streak(normal_user: User) -> None:
     """Create a batch of transactions for pre-premium by transaction streak.
 
     Return a batch of transactions that has PREMIUM_USER["transaction_streak"]
     - 1 transaction streak and qualified transaction count.
 
     """
+    wallet = WalletFactory(user=normal_user)
     today = timezone.now().date() - timezone.timedelta(days=1)
     num_days = PREMIUM_USER["transaction_streak"] - 1
     num_daily = int(PREMIUM_USER["transaction_count"] / num_days) + 1
@@ -72,13 +73,14 @@ def transactions_premium_by_streak(normal_user: User, wallet: Wallet) -> None:
 
 
 @pytest.fixture
-def transactions_premium_by_count(normal_user: User, wallet: Wallet) -> None:
+def transactions_premium_by_count(normal_user: User) -> None:
     """Create a batch of transactions for pre-premium by transaction count.
 
     Return a batch of transactions that has PREMIUM_USER["transaction_count]
     - 1 transaction count and qualified transaction streak.
 
     """
+    wallet = WalletFactory(user=normal_user)
     today = timezone.now().date()
     num_days = PREMIUM_USER["transaction_streak"] - 1
     num_transactions = (
@@ -151,6 +153,33 @@ def test_transaction_list_api(api_client: APIClient) -> None:
     assert response.data
 
 
+def test_transaction_list_api_keyset_pagination(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure keyset pagination returns all transactions without counting."""
+    TransactionFactory.create_batch(5, user=normal_user, wallet=wallet)
+    url = reverse("v1:transaction-list")
+    response = api_client.get(url, {"pagination": "keyset", "limit": 2})
+
+    results = []
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+        results += [item["note"] for item in response.data["results"]]
+        if not response.data["next"]:
+            break
+        response = api_client.get(response.data["next"])
+
+    assert results == list(
+        Transaction.objects.filter(user=normal_user).order_by(
+            "-date",
+            "-id",
+        ).values_list("note", flat=True),
+    )
+
+
 def test_transaction_list_api_unauthorized() -> None:
     """Raise 401 error for unauthenticated users in Transaction list API."""
     response = APIClient().get(reverse("v1:transaction-list"))
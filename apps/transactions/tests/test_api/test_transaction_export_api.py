@@ -0,0 +1,81 @@
+import csv
+import json
+from decimal import Decimal
+
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.transactions.factories import TransactionFactory
+from apps.transactions.models import Wallet
+from apps.users.models import User
+
+
+def get_export_content(api_client: APIClient, **params) -> str:
+    """Request the export api and join the streamed content."""
+    response = api_client.get(reverse("v1:transaction-export"), params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    return b"".join(response.streaming_content).decode()
+
+
+def test_transaction_export_api_csv(
+    api_client: APIClient,
+    normal_user: User,
+    another_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure transactions are exported as CSV in import's columns."""
+    transactions = TransactionFactory.create_batch(
+        3,
+        user=normal_user,
+        wallet=wallet,
+    )
+    TransactionFactory(user=another_user, wallet=wallet)
+
+    rows = list(csv.DictReader(get_export_content(api_client).splitlines()))
+
+    assert len(rows) == len(transactions)
+    assert {"date", "amount", "category", "note"} <= set(rows[0])
+    assert {row["note"] for row in rows} == {
+        transaction.note for transaction in transactions
+    }
+
+
+def test_transaction_export_api_jsonl_filtered(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure exported JSON Lines respect transaction filters."""
+    TransactionFactory(user=normal_user, wallet=wallet, amount=Decimal(5))
+    expected = TransactionFactory(
+        user=normal_user,
+        wallet=wallet,
+        amount=Decimal(50),
+    )
+
+    lines = get_export_content(
+        api_client,
+        file_format="jsonl",
+        amount_min=10,
+    ).splitlines()
+
+    assert len(lines) == 1
+    row = json.loads(lines[0])
+    assert Decimal(row["amount"]) == expected.amount
+    assert row["category"] == expected.category.name
+
+
+def test_transaction_export_api_unsupported_format(
+    api_client: APIClient,
+) -> None:
+    """Ensure unknown export formats are rejected."""
+    response = api_client.get(
+        reverse("v1:transaction-export"),
+        {"file_format": "xml"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,114 @@
+from decimal import Decimal
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+import pytest
+
+from apps.rates.models import Currency
+from apps.transactions.factories import WalletFactory
+from apps.transactions.models import DailySpending, Transaction, Wallet
+from apps.users.models import User
+
+
+@pytest.fixture
+def import_wallet(normal_user: User) -> Wallet:
+    """Create a wallet in user's default currency to import into."""
+    return WalletFactory(
+        user=normal_user,
+        currency=Currency.objects.get(code=normal_user.default_currency),
+        balance=Decimal(1000),
+    )
+
+
+def post_import_file(
+    api_client: APIClient,
+    wallet: Wallet,
+    name: str,
+    content: str,
+):
+    """Upload a transactions file to the import api."""
+    return api_client.post(
+        reverse("v1:transaction-import-transactions"),
+        {
+            "wallet": wallet.pk,
+            "file": SimpleUploadedFile(name, content.encode()),
+        },
+        format="multipart",
+    )
+
+
+def test_transaction_import_api_csv(
+    api_client: APIClient,
+    normal_user: User,
+    import_wallet: Wallet,
+) -> None:
+    """Ensure valid CSV rows are imported and invalid ones are reported."""
+    today = timezone.now().date()
+    content = (
+        "date,amount,category,note\n"
+        f"{today},100,Salary,Monthly salary\n"
+        f"{today},30,food & beverage,Lunch\n"
+        f"{today},20,Food & Beverage,Dinner\n"
+        "not a date,-5,Unknown,Broken row\n"
+    )
+
+    response = post_import_file(
+        api_client,
+        import_wallet,
+        "export.csv",
+        content,
+    )
+    import_wallet.refresh_from_db()
+    normal_user.refresh_from_db()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["created_count"] == 3
+    assert response.data["errors_count"] == 1
+    assert response.data["errors"][0]["row"] == 4
+    assert set(response.data["errors"][0]["errors"]) == {
+        "amount",
+        "date",
+        "category",
+    }
+    assert Transaction.objects.filter(wallet=import_wallet).count() == 3
+    assert import_wallet.balance == Decimal(1050)
+    assert DailySpending.objects.get(
+        user=normal_user,
+        date=today,
+        category__name="Food & Beverage",
+    ).amount == Decimal(50)
+    assert normal_user.transaction_count == 3
+
+
+def test_transaction_import_api_other_user_wallet(
+    api_client: APIClient,
+) -> None:
+    """Ensure users can't import transactions into others' wallets."""
+    response = post_import_file(
+        api_client,
+        WalletFactory(),
+        "export.csv",
+        "date,amount,category\n",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_transaction_import_api_unsupported_format(
+    api_client: APIClient,
+    import_wallet: Wallet,
+) -> None:
+    """Ensure files of unknown formats are rejected."""
+    response = post_import_file(
+        api_client,
+        import_wallet,
+        "export.xlsx",
+        "",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
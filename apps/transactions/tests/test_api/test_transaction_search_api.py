@@ -0,0 +1,140 @@
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+from apps.transactions.factories import TransactionFactory
+from apps.transactions.models import Category, Transaction, Wallet
+from apps.users.models import User
+
+
+def search_transactions(api_client: APIClient, **params) -> list[str]:
+    """Return notes of transactions found by the transaction list api."""
+    response = api_client.get(reverse("v1:transaction-list"), params)
+
+    assert response.status_code == 200
+    return [transaction["note"] for transaction in response.data["results"]]
+
+
+def test_transaction_search_api(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+    user_defined_category: Category,
+) -> None:
+    """Ensure transactions are found by note and category name prefixes."""
+    user_defined_category.name = "Groceries"
+    user_defined_category.save()
+    TransactionFactory(
+        user=normal_user,
+        wallet=wallet,
+        note="Dinner with friends",
+    )
+    TransactionFactory(
+        user=normal_user,
+        wallet=wallet,
+        category=user_defined_category,
+        note="Weekly shopping",
+    )
+
+    assert search_transactions(api_client, search="din frie") == [
+        "Dinner with friends",
+    ]
+    assert search_transactions(api_client, search="grocer") == [
+        "Weekly shopping",
+    ]
+    assert len(search_transactions(api_client, search="?!")) == 2
+
+
+def test_transaction_search_api_ranking(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+    user_defined_category: Category,
+) -> None:
+    """Ensure note matches are ranked above category name matches."""
+    user_defined_category.name = "Coffee"
+    user_defined_category.save()
+    TransactionFactory(
+        user=normal_user,
+        wallet=wallet,
+        note="Coffee beans",
+    )
+    TransactionFactory(
+        user=normal_user,
+        wallet=wallet,
+        category=user_defined_category,
+        note="Cappuccino",
+    )
+
+    assert search_transactions(api_client, search="coffee") == [
+        "Coffee beans",
+        "Cappuccino",
+    ]
+
+
+def test_category_rename_updates_search(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+    user_defined_category: Category,
+) -> None:
+    """Ensure transactions are found by the new name of their category."""
+    TransactionFactory(
+        user=normal_user,
+        wallet=wallet,
+        category=user_defined_category,
+        note="Monthly fee",
+    )
+
+    user_defined_category.name = "Subscriptions"
+    user_defined_category.save()
+
+    assert search_transactions(api_client, search="subscr") == [
+        "Monthly fee",
+    ]
+    assert Transaction.objects.filter(note="Monthly fee").values_list(
+        "search_vector",
+        flat=True,
+    ).get()
+
+
+def test_transaction_search_api_ties_ordered_by_id(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure equally ranked transactions of a day keep a stable order."""
+    for note in ("Taxi one", "Taxi two", "Taxi six"):
+        TransactionFactory(
+            user=normal_user,
+            wallet=wallet,
+            note=note,
+            date=timezone.localdate(),
+        )
+
+    assert search_transactions(api_client, search="taxi") == [
+        "Taxi six",
+        "Taxi two",
+        "Taxi one",
+    ]
+
+
+def test_transaction_note_filter_api(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+    user_defined_category: Category,
+) -> None:
+    """Ensure note filter matches words of notes only."""
+    user_defined_category.name = "Taxes"
+    user_defined_category.save()
+    TransactionFactory(user=normal_user, wallet=wallet, note="Taxi home")
+    TransactionFactory(
+        user=normal_user,
+        wallet=wallet,
+        category=user_defined_category,
+        note="Bus ticket",
+    )
+
+    assert search_transactions(api_client, note="tax") == ["Taxi home"]
@@ -3,6 +3,7 @@ from decimal import Decimal
 from typing import Any
 
 from django.urls import reverse
+from django.utils import timezone
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -10,6 +11,7 @@ from rest_framework.test import APIClient
 import pytest
 
 from apps.rates.models import Currency
+from apps.transactions.factories import TransactionFactory, WalletFactory
 from apps.transactions.models import Wallet
 from apps.users.models import User
 
@@ -49,6 +51,69 @@ def test_wallet_detail_api(
     assert response.status_code == status.HTTP_200_OK
 
 
+def test_wallet_detail_api_transactions_summary(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure wallet detail API returns summary of wallet's transactions."""
+    today = timezone.now().date()
+    for day in (today.replace(day=1), today):
+        TransactionFactory(
+            user=normal_user,
+            wallet=wallet,
+            amount=Decimal(10),
+            date=day,
+        )
+
+    url = reverse("v1:wallet-detail", kwargs={"pk": wallet.pk})
+    response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["transactions_count"] == 2
+    assert Decimal(response.data["transactions_amount"]) == Decimal(20)
+    assert response.data["last_transaction_date"] == today.isoformat()
+
+
+def test_wallet_transactions_api(
+    api_client: APIClient,
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure wallet transactions API pages and filters the transactions."""
+    TransactionFactory.create_batch(
+        3,
+        user=normal_user,
+        wallet=wallet,
+        note="Coffee",
+    )
+    TransactionFactory(user=normal_user, wallet=wallet, note="Rent")
+    TransactionFactory(
+        user=normal_user,
+        wallet=WalletFactory(user=normal_user),
+        note="Coffee",
+    )
+
+    url = reverse("v1:wallet-transactions", kwargs={"pk": wallet.pk})
+    response = api_client.get(url, {"note": "coffee", "limit": 2})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["count"] == 3
+    assert len(response.data["results"]) == 2
+    assert response.data["next"]
+
+
+def test_not_owned_wallet_transactions_api(
+    another_api_client: APIClient,
+    wallet: Wallet,
+) -> None:
+    """Ensure that a user cannot list transactions of other's wallet."""
+    url = reverse("v1:wallet-transactions", kwargs={"pk": wallet.pk})
+    response = another_api_client.get(url)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 def test_not_owned_wallet_detail(
     another_api_client: APIClient,
     wallet: Wallet,
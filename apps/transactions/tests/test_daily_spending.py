@@ -0,0 +1,101 @@
+from datetime import date
+from decimal import Decimal
+
+from django.utils import timezone
+
+from apps.transactions.factories import CategoryFactory, TransactionFactory
+from apps.transactions.models import DailySpending, Transaction, Wallet
+from apps.transactions.services import get_period, get_period_spending_stats
+from apps.users.models import User
+
+
+def test_daily_spending_created_with_transactions(
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure transactions of the same day and category are rolled up."""
+    today = timezone.now().date()
+    category = CategoryFactory(user=normal_user)
+    TransactionFactory.create_batch(
+        3,
+        user=normal_user,
+        wallet=wallet,
+        category=category,
+        date=today,
+        amount=Decimal(10),
+    )
+
+    spending = DailySpending.objects.get(
+        user=normal_user,
+        date=today,
+        category=category,
+    )
+    assert spending.amount == Decimal(30)
+    assert spending.count == 3
+
+
+def test_daily_spending_moved_on_transaction_update(
+    normal_user: User,
+    transaction: Transaction,
+) -> None:
+    """Ensure updating a transaction moves its amount to the new rollup."""
+    old_date = transaction.date
+    old_category_id = transaction.category_id
+    new_category = CategoryFactory(user=normal_user)
+    transaction.category = new_category
+    transaction.date = timezone.now().date()
+    transaction.save()
+
+    assert not DailySpending.objects.filter(
+        user=normal_user,
+        date=old_date,
+        category=old_category_id,
+    ).exists()
+    assert DailySpending.objects.get(
+        user=normal_user,
+        date=transaction.date,
+        category=new_category,
+    ).amount == transaction.amount
+
+
+def test_daily_spending_removed_on_transaction_delete(
+    normal_user: User,
+    transaction: Transaction,
+) -> None:
+    """Ensure deleting the last transaction of a rollup removes the row."""
+    transaction.delete()
+
+    assert not DailySpending.objects.filter(user=normal_user).exists()
+
+
+def test_period_spending_stats_in_january(
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure January is compared with December of the previous year."""
+    category = CategoryFactory(user=normal_user, is_income=False)
+    for spending_date, amount in (
+        (date(2023, 12, 20), Decimal(20)),
+        (date(2024, 1, 10), Decimal(30)),
+    ):
+        TransactionFactory(
+            user=normal_user,
+            wallet=wallet,
+            category=category,
+            date=spending_date,
+            amount=amount,
+        )
+    now = date(2024, 1, 15)
+    begin_period, begin_prev_period = get_period(now, "month")
+
+    stats = get_period_spending_stats(
+        normal_user,
+        begin_prev_period,
+        begin_period,
+        now,
+    )
+
+    assert begin_prev_period == date(2023, 12, 1)
+    assert stats["total_period"] == Decimal(30)
+    assert stats["total_prev_period"] == Decimal(20)
+    assert stats["top_spending"][0]["category__name"] == category.name
@@ -1,9 +1,32 @@
+from decimal import Decimal
+
 from django.test import Client
 from django.urls import reverse
 
+from apps.rates.models import Currency
+from apps.transactions.factories import WalletFactory
+from apps.users.models import User
+
 
 def test_homepage_view(auth_client: Client) -> None:
     """Ensure homepage view responses with status code 200."""
     response = auth_client.get(reverse("home"))
 
     assert response.status_code == 200
+
+
+def test_homepage_view_invalidated_by_wallet(
+    auth_client: Client,
+    normal_user: User,
+) -> None:
+    """Ensure cached homepage balance is updated after a wallet is added."""
+    auth_client.get(reverse("home"))
+
+    WalletFactory(
+        user=normal_user,
+        currency=Currency.objects.get(code=normal_user.default_currency),
+        balance=Decimal(100),
+    )
+    response = auth_client.get(reverse("home"))
+
+    assert response.context["balance"] == Decimal(100)
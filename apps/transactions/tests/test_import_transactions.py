@@ -0,0 +1,54 @@
+from decimal import Decimal
+
+from django.core.management import call_command
+
+from apps.rates.models import Currency
+from apps.transactions.factories import WalletFactory
+from apps.transactions.models import Transaction
+from apps.users.models import User
+
+OFX_STATEMENT = """OFXHEADER:100
+DATA:OFXSGML
+
+<OFX>
+<BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20230501120000
+<TRNAMT>-25.50
+<NAME>Coffee shop
+</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20230502<TRNAMT>100.00<MEMO>Refund
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+"""
+
+
+def test_import_transactions_command_ofx(normal_user: User, tmp_path) -> None:
+    """Ensure OFX statements are imported with categories by amount sign."""
+    wallet = WalletFactory(
+        user=normal_user,
+        currency=Currency.objects.get(code=normal_user.default_currency),
+        balance=Decimal(0),
+    )
+    statement = tmp_path / "statement.ofx"
+    statement.write_text(OFX_STATEMENT)
+
+    call_command("import_transactions", wallet.pk, str(statement))
+    wallet.refresh_from_db()
+
+    transactions = Transaction.objects.filter(wallet=wallet).order_by("date")
+    assert [
+        (
+            transaction.amount,
+            transaction.category.name,
+            transaction.note,
+            transaction.date.isoformat(),
+        )
+        for transaction in transactions
+    ] == [
+        (Decimal("25.5"), "Outgoing transfer", "Coffee shop", "2023-05-01"),
+        (Decimal(100), "Incoming transfer", "Refund", "2023-05-02"),
+    ]
+    assert wallet.balance == Decimal("74.5")
@@ -0,0 +1,128 @@
+from django.db import connection
+from django.db.models import QuerySet
+from django.utils import timezone
+
+import pytest
+
+from libs.pagination import KeysetPaginator
+
+from apps.rates.models import Currency
+from apps.transactions.models import Category, Transaction, Wallet
+from apps.transactions.services import annotate_transactions_summary
+from apps.users.models import User
+
+# Large enough for the planner to prefer indexes over sequential scans,
+# while keeping the test fast. Raise it to check plans on bigger datasets.
+SEEDED_USERS_COUNT = 100
+SEEDED_TRANSACTIONS_PER_USER = 100
+
+
+@pytest.fixture
+def seeded_users(first_currency: Currency) -> list[User]:
+    """Seed many users with wallets and transactions, then analyze tables."""
+    users = User.objects.bulk_create(
+        User(
+            username=f"seeded_user_{index}",
+            email=f"seeded_user_{index}@example.com",
+            phone_number=f"+849{index:08}",
+        )
+        for index in range(SEEDED_USERS_COUNT)
+    )
+    wallets = Wallet.objects.bulk_create(
+        Wallet(name="Seeded", user=user, currency=first_currency)
+        for user in users
+    )
+    category = Category.objects.filter(user__isnull=True).first()
+    today = timezone.now().date()
+    Transaction.objects.bulk_create(
+        (
+            Transaction(
+                user=wallet.user,
+                wallet=wallet,
+                category=category,
+                amount=1,
+                date=today - timezone.timedelta(days=day),
+            )
+            for wallet in wallets
+            for day in range(SEEDED_TRANSACTIONS_PER_USER)
+        ),
+        batch_size=5000,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE transactions_transaction")
+    return users
+
+
+def assert_uses_index(queryset: QuerySet, index_name: str) -> None:
+    """Ensure the query plan reads transactions through the given index."""
+    plan = queryset.explain()
+
+    assert index_name in plan, plan
+    assert "Seq Scan on transactions_transaction" not in plan, plan
+
+
+def test_home_recent_transactions_plan(seeded_users: list[User]) -> None:
+    """Ensure recent transactions of the home page use the date index."""
+    queryset = Transaction.objects.filter(
+        user=seeded_users[0],
+    ).order_by("-date")[:5]
+
+    assert_uses_index(queryset, "transaction_user_date_id_idx")
+
+
+def test_transaction_list_plan(seeded_users: list[User]) -> None:
+    """Ensure filtered transaction list pages use the date index."""
+    today = timezone.now().date()
+    queryset = Transaction.objects.filter(
+        user=seeded_users[0],
+        date__gte=today - timezone.timedelta(days=30),
+    ).order_by("-date")[:10]
+
+    assert_uses_index(queryset, "transaction_user_date_id_idx")
+
+
+def test_wallet_detail_plan(seeded_users: list[User]) -> None:
+    """Ensure wallet detail transactions use the wallet index."""
+    wallet = Wallet.objects.filter(user=seeded_users[0]).first()
+    queryset = Transaction.objects.filter(
+        user=seeded_users[0],
+        wallet=wallet,
+    ).order_by("-date")[:10]
+
+    assert_uses_index(queryset, "transaction_user_wallet_id_idx")
+
+
+def test_keyset_deep_page_plan(seeded_users: list[User]) -> None:
+    """Ensure a deep keyset page starts an index scan at its position."""
+    queryset = Transaction.objects.filter(user=seeded_users[0])
+    paginator = KeysetPaginator(queryset, 10, ("-date", "-id"))
+    position = queryset.order_by("-date", "-id")[80]
+    page_queryset = paginator.queryset.filter(
+        paginator.get_position_filter([position.date, position.id]),
+    )[:10]
+
+    assert "OFFSET" not in str(page_queryset.query)
+    assert_uses_index(page_queryset, "transaction_user_date_id_idx")
+    index_condition = next(
+        line for line in page_queryset.explain().splitlines()
+        if "Index Cond" in line
+    )
+    assert "date <=" in index_condition
+
+
+def test_category_summary_plan(seeded_users: list[User]) -> None:
+    """Ensure category summary joins only user's transactions by index.
+
+    All seeded users have transactions in the same default category.
+
+    """
+    category = Category.objects.filter(user__isnull=True).first()
+    queryset = annotate_transactions_summary(
+        Category.objects.filter(user__isnull=True),
+        seeded_users[0],
+    )
+
+    assert_uses_index(queryset, "transaction_user_category_idx")
+    assert queryset.get(pk=category.pk).transactions_count == (
+        SEEDED_TRANSACTIONS_PER_USER
+    )
@@ -0,0 +1,129 @@
+from typing import Any
+
+from django.core.mail.backends import locmem
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+
+from apps.transactions.forms import TransactionForm
+from apps.transactions.models import Category, Transaction, Wallet
+from apps.transactions.tasks import send_shared_bill_notification
+from apps.users.factories import FriendshipFactory, UserFactory
+from apps.users.models import User
+from apps.users.services import get_sent_friend_ids
+
+
+@pytest.fixture
+def shared_transaction_data(wallet: Wallet) -> dict[str, Any]:
+    """Return data of a shared transaction."""
+    return {
+        "amount": wallet.balance / 2,
+        "category": Category.objects.filter(
+            user__isnull=True,
+            is_income=False,
+        ).first().pk,
+        "wallet": wallet.pk,
+        "date": timezone.now().date(),
+        "note": "Dinner",
+        "is_shared": True,
+    }
+
+
+def test_send_shared_bill_notification(
+    mailoutbox: list,
+    transaction: Transaction,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure tagged friends are notified through one connection."""
+    opened_connections = []
+    monkeypatch.setattr(
+        locmem.EmailBackend,
+        "open",
+        lambda backend: opened_connections.append(backend),
+    )
+    friends = UserFactory.create_batch(3)
+
+    send_shared_bill_notification.delay(
+        transaction.pk,
+        [friend.pk for friend in friends],
+    )
+
+    assert sorted(message.to[0] for message in mailoutbox) == sorted(
+        friend.email for friend in friends
+    )
+    assert len(opened_connections) == 1
+
+
+def test_shared_transaction_notifies_tagged_friends(
+    django_capture_on_commit_callbacks,
+    mailoutbox: list,
+    auth_client: Client,
+    normal_user: User,
+    shared_transaction_data: dict[str, Any],
+) -> None:
+    """Ensure tagged friends are notified after the transaction is saved."""
+    friend = UserFactory()
+    normal_user.friends.add(friend)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        auth_client.post(
+            reverse("transaction-create"),
+            {**shared_transaction_data, "tagged_friends": [friend.pk]},
+        )
+
+    assert [message.to for message in mailoutbox] == [[friend.email]]
+
+
+def test_transaction_without_tagged_friends_is_not_notified(
+    django_capture_on_commit_callbacks,
+    auth_client: Client,
+    shared_transaction_data: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure no notification task is enqueued without tagged friends."""
+    enqueued_tasks = []
+    monkeypatch.setattr(
+        send_shared_bill_notification,
+        "delay",
+        lambda *args: enqueued_tasks.append(args),
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        auth_client.post(
+            reverse("transaction-create"),
+            shared_transaction_data,
+        )
+
+    assert Transaction.objects.filter(note="Dinner").exists()
+    assert not enqueued_tasks
+
+
+def test_sent_friendships_can_be_tagged(
+    normal_user: User,
+    django_assert_num_queries,
+) -> None:
+    """Ensure users the user sent friendships to are offered for tagging."""
+    requested_friend, requesting_user = UserFactory.create_batch(2)
+    FriendshipFactory(
+        from_user=normal_user,
+        to_user=requested_friend,
+        accepted=False,
+    )
+    FriendshipFactory(
+        from_user=requesting_user,
+        to_user=normal_user,
+        accepted=True,
+    )
+    get_sent_friend_ids(normal_user.pk)
+
+    with django_assert_num_queries(1):
+        tagged_friends = list(
+            TransactionForm(user=normal_user).fields[
+                "tagged_friends"
+            ].queryset,
+        )
+
+    assert tagged_friends == list(normal_user.friends.all())
+    assert tagged_friends == [requested_friend]
@@ -9,7 +9,7 @@ import pytest
 from pytest_lazyfixture import lazy_fixture
 
 from apps.transactions.constants import PREMIUM_USER
-from apps.transactions.factories import TransactionFactory
+from apps.transactions.factories import TransactionFactory, WalletFactory
 from apps.transactions.models import Category, Transaction, Wallet
 from apps.users.models import User
 
@@ -31,13 +31,14 @@ def transaction_data_view(
 
 
 @pytest.fixture
-def transactions_premium_by_streak(normal_user: User, wallet: Wallet) -> None:
+def transactions_premium_by_streak(normal_user: User) -> None:
     """Create a batch of transactions for pre-premium by transaction streak.
 
     Return a batch of transactions that has PREMIUM_USER["transaction_streak"]
     - 1 transaction streak and qualified transaction count.
 
     """
+    wallet = WalletFactory(user=normal_user)
     today = timezone.now().date() - timezone.timedelta(days=1)
     num_days = PREMIUM_USER["transaction_streak"] - 1
     num_daily = int(PREMIUM_USER["transaction_count"] / num_days) + 1
@@ -52,13 +53,14 @@ def transactions_premium_by_streak(normal_user: User, wallet: Wallet) -> None:
 
 
 @pytest.fixture
-def transactions_premium_by_count(normal_user: User, wallet: Wallet) -> None:
+def transactions_premium_by_count(normal_user: User) -> None:
     """Create a batch of transactions for pre-premium by transaction count.
 
     Return a batch of transactions that has PREMIUM_USER["transaction_count]
     - 1 transaction count and qualified transaction streak.
 
     """
+    wallet = WalletFactory(user=normal_user)
     today = timezone.now().date()
     num_days = PREMIUM_USER["transaction_streak"] - 1
     num_transactions = (
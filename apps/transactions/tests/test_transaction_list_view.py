@@ -1,7 +1,8 @@
 from django.test import Client
 from django.urls import reverse
 
-from apps.transactions.models import Transaction
+from apps.transactions.factories import TransactionFactory
+from apps.transactions.models import Transaction, Wallet
 from apps.users.models import User
 
 
@@ -16,3 +17,36 @@ def test_transaction_list_view(auth_client: Client, normal_user: User) -> None:
         user=normal_user,
     )[:response.context_data["paginate_by"]]
     assert list(response_transaction) == list(db_transaction)
+
+
+def test_transaction_list_view_keyset_pagination(
+    auth_client: Client,
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure keyset pagination walks through all transactions in order."""
+    TransactionFactory.create_batch(7, user=normal_user, wallet=wallet)
+    url = reverse("transaction-list")
+    params = {"pagination": "keyset", "paginate-by": 5}
+
+    first_page = auth_client.get(url, params).context_data["page_obj"]
+    second_page = auth_client.get(
+        url,
+        {**params, "cursor": first_page.next_cursor},
+    ).context_data["page_obj"]
+
+    assert first_page.has_next()
+    assert not second_page.has_next()
+    assert [*first_page, *second_page] == list(
+        Transaction.objects.filter(user=normal_user).order_by("-date", "-id"),
+    )
+
+
+def test_transaction_list_view_invalid_cursor(auth_client: Client) -> None:
+    """Ensure malformed cursors are answered with 404."""
+    response = auth_client.get(
+        reverse("transaction-list"),
+        {"pagination": "keyset", "cursor": "invalid"},
+    )
+
+    assert response.status_code == 404
@@ -0,0 +1,122 @@
+from smtplib import SMTPException
+
+from django.core import mail
+from django.core.mail.backends import locmem
+from django.utils import timezone
+
+import pytest
+from celery.exceptions import Retry
+
+from apps.transactions.models import Transaction
+from apps.transactions.tasks import (
+    generate_transaction_report,
+    send_transaction_reports,
+)
+from apps.transactions.tasks.send_transaction_reports import (
+    get_transaction_report_progress,
+)
+from apps.users.models import User
+
+
+@pytest.fixture
+def report_period() -> tuple[str, str]:
+    """Return start and end dates of the report's week."""
+    end_date = timezone.localdate()
+    start_date = end_date - timezone.timedelta(days=7)
+    return start_date.isoformat(), end_date.isoformat()
+
+
+def get_user_reports(user: User) -> list[mail.EmailMessage]:
+    """Return sent reports of the user."""
+    return [message for message in mail.outbox if user.email in message.to]
+
+
+def test_generate_transaction_report(
+    mailoutbox: list,
+    normal_user: User,
+    transaction: Transaction,
+    report_period: tuple[str, str],
+) -> None:
+    """Ensure every user gets a report and the progress is counted."""
+    transaction.date = timezone.localdate()
+    transaction.save()
+
+    generate_transaction_report()
+    progress = get_transaction_report_progress(report_period[1])
+
+    [report] = get_user_reports(normal_user)
+    assert report.body.startswith("Hello from")
+    assert f"| {transaction.amount}" in report.body
+    assert progress["sent_count"] == progress["users_count"]
+    assert progress["sent_count"] == User.objects.count()
+    assert progress["done_batches_count"] == progress["batches_count"]
+
+
+def test_send_transaction_reports_queries_count(
+    django_assert_num_queries,
+    mailoutbox: list,
+    normal_user: User,
+    another_user: User,
+    report_period: tuple[str, str],
+) -> None:
+    """Ensure users and their transactions are loaded once per batch."""
+    with django_assert_num_queries(2):
+        send_transaction_reports(
+            [normal_user.pk, another_user.pk],
+            *report_period,
+        )
+
+    assert len(mailoutbox) == 2
+
+
+def test_send_transaction_reports_connections_count(
+    mailoutbox: list,
+    normal_user: User,
+    another_user: User,
+    report_period: tuple[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure reports of a batch are sent through one connection."""
+    opened_connections = []
+    monkeypatch.setattr(
+        locmem.EmailBackend,
+        "open",
+        lambda backend: opened_connections.append(backend),
+    )
+
+    send_transaction_reports(
+        [normal_user.pk, another_user.pk],
+        *report_period,
+    )
+
+    assert len(mailoutbox) == 2
+    assert len(opened_connections) == 1
+
+
+def test_retried_batch_does_not_resend_reports(
+    mailoutbox: list,
+    normal_user: User,
+    another_user: User,
+    report_period: tuple[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure a retried batch sends reports only to remaining users."""
+    send_messages = locmem.EmailBackend.send_messages
+    failed_recipients = []
+
+    def send_or_fail(backend: locmem.EmailBackend, messages: list) -> int:
+        if another_user.email in messages[0].to and not failed_recipients:
+            failed_recipients.append(another_user.email)
+            raise SMTPException("Connection unexpectedly closed")
+        return send_messages(backend, messages)
+
+    monkeypatch.setattr(locmem.EmailBackend, "send_messages", send_or_fail)
+    user_ids = [normal_user.pk, another_user.pk]
+    with pytest.raises(Retry):
+        send_transaction_reports.delay(user_ids, *report_period)
+    # Eager tasks raise `Retry` instead of running again, so retry manually
+    send_transaction_reports.delay(user_ids, *report_period)
+
+    assert failed_recipients == [another_user.email]
+    assert len(get_user_reports(normal_user)) == 1
+    assert len(get_user_reports(another_user)) == 1
@@ -0,0 +1,129 @@
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.transactions import signals
+from apps.transactions.factories import TransactionFactory
+from apps.transactions.models import Transaction, Wallet
+from apps.users.models import User
+
+
+def create_transactions(
+    user: User,
+    wallet: Wallet,
+    days_ago: list[int],
+) -> list[Transaction]:
+    """Create a transaction for each given number of days ago."""
+    today = timezone.now().date()
+    return [
+        TransactionFactory(
+            user=user,
+            wallet=wallet,
+            date=today - timezone.timedelta(days=days),
+        )
+        for days in days_ago
+    ]
+
+
+def test_stats_updated_on_create(normal_user: User, wallet: Wallet) -> None:
+    """Ensure transaction count and streak follow created transactions."""
+    create_transactions(normal_user, wallet, [5, 4, 4, 3, 1, 0])
+    normal_user.refresh_from_db()
+
+    assert normal_user.transaction_count == 6
+    assert normal_user.transaction_streak == 3
+    assert normal_user.last_transaction_date == timezone.now().date()
+    assert normal_user.streak_start_date == (
+        timezone.now().date() - timezone.timedelta(days=1)
+    )
+
+
+def test_stats_updated_on_create_without_reading_transactions(
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure a new transaction doesn't recalculate stats from scratch."""
+    create_transactions(normal_user, wallet, [2, 1])
+
+    with CaptureQueriesContext(connection) as context:
+        create_transactions(normal_user, wallet, [0])
+
+    assert not any(
+        'FROM "transactions_transaction"' in query["sql"]
+        for query in context.captured_queries
+    )
+
+
+def test_stats_updated_on_backdated_create(
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure a backdated transaction can join two streaks."""
+    create_transactions(normal_user, wallet, [4, 3, 1, 0])
+    create_transactions(normal_user, wallet, [2])
+    normal_user.refresh_from_db()
+
+    assert normal_user.transaction_count == 5
+    assert normal_user.transaction_streak == 5
+
+
+def test_stats_updated_on_delete(normal_user: User, wallet: Wallet) -> None:
+    """Ensure deleting a transaction recalculates the stats."""
+    transactions = create_transactions(normal_user, wallet, [2, 1, 0])
+    transactions[1].delete()
+    normal_user.refresh_from_db()
+
+    assert normal_user.transaction_count == 2
+    assert normal_user.transaction_streak == 1
+    assert normal_user.streak_start_date == timezone.now().date()
+
+
+def test_stats_recalculated_once_on_wallet_delete(
+    normal_user: User,
+    wallet: Wallet,
+    monkeypatch,
+    django_capture_on_commit_callbacks,
+) -> None:
+    """Ensure deleting a wallet recalculates owner's stats only once."""
+    create_transactions(normal_user, wallet, [2, 1, 0])
+    recalculated_user_ids = []
+    recalculate = signals.recalculate_transaction_stats
+
+    def recalculate_and_count(user_id: int) -> None:
+        recalculated_user_ids.append(user_id)
+        recalculate(user_id)
+
+    monkeypatch.setattr(
+        signals,
+        "recalculate_transaction_stats",
+        recalculate_and_count,
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        wallet.delete()
+    normal_user.refresh_from_db()
+
+    assert recalculated_user_ids == [normal_user.pk]
+    assert normal_user.transaction_count == 0
+    assert normal_user.transaction_streak == 0
+
+
+def test_recalculate_transaction_stats_command(
+    normal_user: User,
+    wallet: Wallet,
+) -> None:
+    """Ensure the command backfills stats of existing transactions."""
+    create_transactions(normal_user, wallet, [3, 2, 0])
+    User.objects.filter(pk=normal_user.pk).update(
+        transaction_count=0,
+        transaction_streak=0,
+        last_transaction_date=None,
+        streak_start_date=None,
+    )
+
+    call_command("recalculate_transaction_stats", normal_user.pk)
+    normal_user.refresh_from_db()
+
+    assert normal_user.transaction_count == 3
+    assert normal_user.transaction_streak == 2
+    assert normal_user.last_transaction_date == timezone.now().date()
@@ -0,0 +1,55 @@
+from decimal import Decimal
+
+import pytest
+
+from apps.rates.factories import ExchangeRateFactory
+from apps.rates.models import Currency
+from apps.transactions.factories import WalletFactory
+from apps.transactions.services import (
+    get_user_total_balance,
+    get_user_total_balance_by_currencies,
+)
+from apps.users.models import User
+
+
+@pytest.fixture
+def multi_currency_wallets(normal_user: User) -> None:
+    """Create VND and USD wallets with rates between both currencies."""
+    vnd = Currency.objects.get(code="VND")
+    usd = Currency.objects.get(code="USD")
+    WalletFactory(user=normal_user, currency=vnd, balance=Decimal(50000))
+    WalletFactory(user=normal_user, currency=usd, balance=Decimal(2))
+    ExchangeRateFactory(
+        user=normal_user,
+        source_currency=usd,
+        destination_currency=vnd,
+        rate=Decimal(25000),
+    )
+    ExchangeRateFactory(
+        user=normal_user,
+        source_currency=vnd,
+        destination_currency=usd,
+        rate=Decimal("0.00004"),
+    )
+
+
+@pytest.mark.usefixtures("multi_currency_wallets")
+def test_user_total_balance(normal_user: User) -> None:
+    """Ensure wallet balances are converted to the selected currency."""
+    assert get_user_total_balance(normal_user, "VND") == Decimal(100000)
+    assert get_user_total_balance(normal_user, "USD") == Decimal(4)
+
+
+@pytest.mark.usefixtures("multi_currency_wallets")
+def test_user_total_balance_by_currencies(
+    normal_user: User,
+    django_assert_num_queries,
+) -> None:
+    """Ensure totals in every currency are computed with two queries."""
+    with django_assert_num_queries(2):
+        total_balances = get_user_total_balance_by_currencies(normal_user)
+
+    assert total_balances == {
+        "VND": Decimal(100000),
+        "USD": Decimal(4),
+    }
@@ -0,0 +1,223 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Any, Callable
+
+from django.db import connections
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+import pytest
+
+from apps.rates.models import Currency
+from apps.transactions.factories import (
+    CategoryFactory,
+    TransactionFactory,
+    WalletFactory,
+)
+from apps.transactions.models import Category, Transaction, Wallet
+from apps.users.factories import UserFactory
+from apps.users.models import User
+
+CONCURRENT_TRANSACTIONS_COUNT = 8
+
+
+def run_in_threads(func: Callable, count: int = 1) -> list[Any]:
+    """Run function in separate threads, each with its own db connection.
+
+    Data saved by these threads is committed, so it is visible to other
+    threads, unlike data saved inside of the test's transaction.
+
+    """
+    def run() -> Any:
+        try:
+            return func()
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(run) for _ in range(count)]
+    return [future.result() for future in futures]
+
+
+@pytest.fixture
+def expense_category() -> Category:
+    """Return a default expense category."""
+    return Category.objects.filter(user__isnull=True, is_income=False).first()
+
+
+@pytest.fixture
+def committed_wallet(first_currency: Currency) -> Wallet:
+    """Create a wallet of a new user committed to the database."""
+
+    def create_wallet() -> Wallet:
+        user = UserFactory(default_currency=first_currency.code)
+        return WalletFactory(
+            user=user,
+            currency=first_currency,
+            balance=Decimal(1000),
+        )
+
+    [wallet] = run_in_threads(create_wallet)
+    yield wallet
+    run_in_threads(User.objects.filter(pk=wallet.user_id).delete)
+
+
+def test_concurrent_transactions_balance(
+    committed_wallet: Wallet,
+    expense_category: Category,
+) -> None:
+    """Ensure parallel transactions on a wallet don't lose balance updates."""
+    barrier = threading.Barrier(CONCURRENT_TRANSACTIONS_COUNT)
+
+    def create_transaction() -> int:
+        client = APIClient()
+        client.force_authenticate(user=committed_wallet.user)
+        barrier.wait()
+        return client.post(
+            reverse("v1:transaction-list"),
+            {
+                "amount": Decimal(10),
+                "category": expense_category.pk,
+                "wallet": committed_wallet.pk,
+                "date": timezone.now().date(),
+            },
+        ).status_code
+
+    status_codes = run_in_threads(
+        create_transaction,
+        count=CONCURRENT_TRANSACTIONS_COUNT,
+    )
+
+    assert status_codes == (
+        [status.HTTP_201_CREATED] * CONCURRENT_TRANSACTIONS_COUNT
+    )
+    committed_wallet.refresh_from_db()
+    assert committed_wallet.balance == (
+        Decimal(1000) - Decimal(10) * CONCURRENT_TRANSACTIONS_COUNT
+    )
+
+
+def test_transaction_update_api_moves_balance(
+    api_client: APIClient,
+    normal_user: User,
+    expense_category: Category,
+) -> None:
+    """Ensure updating transaction's wallet moves its amount."""
+    first_wallet, second_wallet = WalletFactory.create_batch(
+        2,
+        user=normal_user,
+        currency=Currency.objects.get(code=normal_user.default_currency),
+        balance=Decimal(100),
+    )
+    transaction_data = {
+        "amount": Decimal(10),
+        "category": expense_category.pk,
+        "wallet": first_wallet.pk,
+        "date": timezone.now().date(),
+    }
+    api_client.post(reverse("v1:transaction-list"), transaction_data)
+    transaction = Transaction.objects.get(wallet=first_wallet)
+
+    transaction_data["wallet"] = second_wallet.pk
+    api_client.put(
+        reverse("v1:transaction-detail", kwargs={"pk": transaction.pk}),
+        transaction_data,
+    )
+    first_wallet.refresh_from_db()
+    second_wallet.refresh_from_db()
+
+    assert first_wallet.balance == Decimal(100)
+    assert second_wallet.balance == Decimal(90)
+
+
+def test_transaction_delete_view_restores_balance(
+    auth_client: Client,
+    normal_user: User,
+    expense_category: Category,
+) -> None:
+    """Ensure deleting a transaction restores wallet's balance."""
+    wallet = WalletFactory(
+        user=normal_user,
+        currency=Currency.objects.get(code=normal_user.default_currency),
+        balance=Decimal(100),
+    )
+    transaction = TransactionFactory(
+        user=normal_user,
+        wallet=wallet,
+        category=expense_category,
+        amount=Decimal(10),
+    )
+    wallet.refresh_from_db()
+
+    assert wallet.balance == Decimal(90)
+
+    auth_client.post(
+        reverse("transaction-delete", kwargs={"pk": transaction.pk}),
+    )
+    wallet.refresh_from_db()
+
+    assert wallet.balance == Decimal(100)
+
+
+def test_transaction_model_update_moves_balance(
+    normal_user: User,
+    expense_category: Category,
+) -> None:
+    """Ensure saving a transaction outside of the views updates balances."""
+    first_wallet, second_wallet = WalletFactory.create_batch(
+        2,
+        user=normal_user,
+        currency=Currency.objects.get(code=normal_user.default_currency),
+        balance=Decimal(100),
+    )
+    transaction = TransactionFactory(
+        user=normal_user,
+        wallet=first_wallet,
+        category=expense_category,
+        amount=Decimal(10),
+    )
+
+    transaction.wallet = second_wallet
+    transaction.amount = Decimal(20)
+    transaction.save()
+    first_wallet.refresh_from_db()
+    second_wallet.refresh_from_db()
+
+    assert first_wallet.balance == Decimal(100)
+    assert second_wallet.balance == Decimal(80)
+
+    transaction.delete()
+    second_wallet.refresh_from_db()
+
+    assert second_wallet.balance == Decimal(100)
+
+
+def test_category_delete_restores_balance(normal_user: User) -> None:
+    """Ensure deleting a category reverts its transactions from balances."""
+    wallet = WalletFactory(
+        user=normal_user,
+        currency=Currency.objects.get(code=normal_user.default_currency),
+        balance=Decimal(100),
+    )
+    category = CategoryFactory(user=normal_user, is_income=False)
+    TransactionFactory.create_batch(
+        3,
+        user=normal_user,
+        wallet=wallet,
+        category=category,
+        amount=Decimal(10),
+    )
+    wallet.refresh_from_db()
+
+    assert wallet.balance == Decimal(70)
+
+    category.delete()
+    wallet.refresh_from_db()
+
+    assert not Transaction.objects.filter(wallet=wallet).exists()
+    assert wallet.balance == Decimal(100)
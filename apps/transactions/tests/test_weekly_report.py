@@ -0,0 +1,136 @@
+from decimal import Decimal
+
+from django.contrib.admin.sites import site
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+
+from apps.transactions.factories import TransactionFactory, WalletFactory
+from apps.transactions.models import WeeklyReport
+from apps.transactions.services import (
+    generate_weekly_report,
+    get_weekly_report_stats,
+)
+from apps.transactions.tasks import generate_admin_weekly_report
+from apps.users.factories import AdminUserFactory, UserFactory
+from apps.users.models import User
+
+
+@pytest.fixture
+def report_end_date() -> timezone.datetime:
+    """Return the last day of the period of the admin weekly report."""
+    return timezone.localdate() - timezone.timedelta(days=1)
+
+
+@pytest.fixture
+def report_start_date(report_end_date: timezone.datetime) -> timezone.datetime:
+    """Return the first day of the period of the admin weekly report."""
+    return report_end_date - timezone.timedelta(days=6)
+
+
+@pytest.fixture
+def report_users(report_end_date: timezone.datetime) -> list[User]:
+    """Create users registered in the period and their transactions."""
+    users = [
+        UserFactory(default_currency="USD"),
+        UserFactory(default_currency="VND"),
+    ]
+    User.objects.filter(pk__in=[user.pk for user in users]).update(
+        created=timezone.now() - timezone.timedelta(days=2),
+    )
+    for user in users:
+        wallet = WalletFactory(user=user)
+        for days in (0, 1, 10):
+            TransactionFactory(
+                user=user,
+                wallet=wallet,
+                amount=Decimal(10),
+                date=report_end_date - timezone.timedelta(days=days),
+            )
+    return users
+
+
+def test_get_weekly_report_stats(
+    django_assert_num_queries,
+    report_users: list[User],
+    report_start_date: timezone.datetime,
+    report_end_date: timezone.datetime,
+) -> None:
+    """Ensure admin KPIs are computed by one query per table."""
+    with django_assert_num_queries(2):
+        stats = get_weekly_report_stats(report_start_date, report_end_date)
+
+    assert stats["transactions_count"] == 4
+    assert stats["categories_count"] == 4
+    assert stats["active_users_count"] == 2
+    assert set(stats["new_usernames"]) == {
+        user.username for user in report_users
+    }
+    assert stats["volume_by_currency"] == {"USD": "20.000", "VND": "20.000"}
+    assert stats["daily_stats"][-1] == {
+        "date": report_end_date.isoformat(),
+        "transactions_count": 2,
+        "active_users_count": 2,
+        "volume_by_currency": {"USD": "10.000", "VND": "10.000"},
+    }
+
+
+def test_generate_admin_weekly_report(
+    mailoutbox: list,
+    report_users: list[User],
+    report_start_date: timezone.datetime,
+    report_end_date: timezone.datetime,
+) -> None:
+    """Ensure the report is stored and sent to admins."""
+    admin = AdminUserFactory()
+
+    generate_admin_weekly_report()
+    report = WeeklyReport.objects.get(
+        start_date=report_start_date,
+        end_date=report_end_date,
+    )
+
+    assert report.transactions_count == 4
+    assert [message.to for message in mailoutbox] == [[admin.email]]
+    assert "Number of active users: 2" in mailoutbox[0].body
+
+
+def test_generate_weekly_report_replaces_snapshot(
+    report_users: list[User],
+    report_start_date: timezone.datetime,
+    report_end_date: timezone.datetime,
+) -> None:
+    """Ensure regenerating a report of the same period updates it."""
+    generate_weekly_report(report_start_date, report_end_date)
+    TransactionFactory(
+        user=report_users[0],
+        wallet=WalletFactory(user=report_users[0]),
+        date=report_end_date,
+    )
+    report = generate_weekly_report(report_start_date, report_end_date)
+
+    assert WeeklyReport.objects.count() == 1
+    assert report.transactions_count == 5
+
+
+def test_weekly_report_admin_detail(
+    client: Client,
+    report_users: list[User],
+    report_start_date: timezone.datetime,
+    report_end_date: timezone.datetime,
+) -> None:
+    """Ensure admin shows a stored report."""
+    report = generate_weekly_report(report_start_date, report_end_date)
+    client.force_login(AdminUserFactory())
+
+    response = client.get(
+        reverse(
+            f"{site.name}:transactions_weeklyreport_change",
+            args=[report.pk],
+        ),
+    )
+
+    assert response.status_code == 200
+    assert response.context["original"] == report
@@ -5,7 +5,6 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import QuerySet
 from django.http import HttpResponse
 from django.urls import reverse_lazy
-from django.utils import timezone
 from django.views.generic.detail import DetailView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 
@@ -15,7 +14,6 @@ from ..constants import PREMIUM_USER
 from ..filters import TransactionFilter
 from ..forms import TransactionForm
 from ..models import Transaction
-from ..services import count_streak
 
 
 class TransactionListView(LoginRequiredMixin, BaseListView):
@@ -29,6 +27,7 @@ class TransactionListView(LoginRequiredMixin, BaseListView):
     context_object_name = "transactions"
     template_name = "transactions/transactions/transaction_list.html"
     filter_class = TransactionFilter
+    keyset_ordering = ("-date", "-id")
 
     def get_queryset(self) -> QuerySet:
         """Get queryset from base class and filter all user's transactions."""
@@ -57,30 +56,20 @@ class TransactionCreateView(LoginRequiredMixin, CreateView):
     form_class = TransactionForm
 
     def form_valid(self, form: TransactionForm) -> HttpResponse:
-        """Check if user is qualified for premium mode.
+        """Notify the user when the transaction upgrades them to premium.
 
-        Users must surpass transaction count and transaction streak threshold
-        to be upgraded as premium account. All criterias are listed in
-        `PREMIUM_USER` constant.
+        User's transaction count and streak are updated along with the
+        transaction, see `add_transaction_to_stats`. All criterias are listed
+        in `PREMIUM_USER` constant.
 
         """
-        if self.request.user.is_premium:
-            return super().form_valid(form)
+        was_premium = self.request.user.is_premium
+        response = super().form_valid(form)
+        if was_premium:
+            return response
 
-        today = timezone.now()
-        transaction_dates = Transaction.objects.filter(
-            user=self.request.user,
-            date__lte=today,
-        ).order_by("date").values("date")
-        transaction_count = transaction_dates.count()
-        transaction_streak = count_streak(transaction_dates.distinct())
-
-        if (
-            transaction_count >= PREMIUM_USER["transaction_count"] - 1 and
-            transaction_streak >= PREMIUM_USER["transaction_streak"] - 1
-        ):
-            self.request.user.is_premium = True
-            self.request.user.save()
+        self.request.user.refresh_from_db(fields=["is_premium"])
+        if self.request.user.is_premium:
             messages.add_message(
                 self.request,
                 messages.INFO,
@@ -88,8 +77,7 @@ class TransactionCreateView(LoginRequiredMixin, CreateView):
                 f"transactions and {PREMIUM_USER['transaction_streak']} day "
                 "transaction streak. Your account is now upgraded to premium.",
             )
-
-        return super().form_valid(form)
+        return response
 
     def get_form_kwargs(self) -> dict[str, Any]:
         """Add the request user to the form's kwargs."""
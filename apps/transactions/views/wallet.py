@@ -62,6 +62,7 @@ class WalletDetailView(LoginRequiredMixin, BaseListView):
     template_name = "transactions/wallets/wallet_detail.html"
     context_object_name = "transactions"
     filter_class = TransactionFilter
+    keyset_ordering = ("-date", "-id")
 
     def get_queryset(self) -> QuerySet:
         """Return a queryset of transactions for the this user and wallet."""
@@ -0,0 +1,53 @@
+import binascii
+
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import exceptions
+
+from knox.auth import TokenAuthentication
+from knox.crypto import hash_token
+from knox.settings import knox_settings
+
+from apps.users.models import User
+from apps.users.services import cache_auth_token, get_cached_auth_token
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Knox token authentication with validated tokens cached by digest.
+
+    Knox looks tokens up by their key, loads all tokens of the user to
+    delete expired ones and compares digests on every request. Here a
+    validated token is cached by its digest, so later requests with it
+    only hash the token, read the cache and load the user by primary key.
+    Cached tokens are dropped when they are deleted, e.g. on logout, and
+    when they expire. Expired tokens are deleted by a periodic task.
+
+    Tokens are not cached with `AUTO_REFRESH`, which has to save the
+    renewed expiry on each request.
+
+    """
+
+    def authenticate_credentials(self, token: bytes) -> tuple:
+        """Authenticate a token from cache or with knox."""
+        if knox_settings.AUTO_REFRESH:
+            return super().authenticate_credentials(token)
+
+        try:
+            digest = hash_token(token.decode())
+        except (TypeError, binascii.Error, UnicodeDecodeError) as error:
+            raise exceptions.AuthenticationFailed(
+                _("Invalid token."),
+            ) from error
+
+        auth_token = get_cached_auth_token(digest)
+        if auth_token is None:
+            user, auth_token = super().authenticate_credentials(token)
+            cache_auth_token(auth_token)
+            return user, auth_token
+
+        auth_token.user = User.objects.filter(pk=auth_token.user_id).first()
+        if auth_token.user is None:
+            raise exceptions.AuthenticationFailed(
+                _("User inactive or deleted."),
+            )
+        return self.validate_user(auth_token)
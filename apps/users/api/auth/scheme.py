@@ -11,9 +11,15 @@ from . import serializers, views
 
 
 class KnoxTokenScheme(OpenApiAuthenticationExtension):
-    """Scheme to describe knox auth scheme."""
+    """Scheme to describe knox auth scheme.
+
+    Subclasses are matched too, so `CachedTokenAuthentication` is described
+    the same way.
+
+    """
 
     target_class = "knox.auth.TokenAuthentication"
+    match_subclasses = True
     name = "TokenAuth"
 
     def get_security_definition(self, auto_schema):
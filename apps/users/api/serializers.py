@@ -1,5 +1,7 @@
 from django.contrib.auth import get_user_model
 
+from rest_framework import serializers
+
 from apps.core.api.serializers import ModelBaseSerializer
 
 
@@ -71,3 +73,30 @@ class FriendSerializer(ModelBaseSerializer):
         model = get_user_model()
         fields = ("friend_list",)
         read_only_fields = ("friend_list",)
+
+
+class UserAutocompleteSerializer(ModelBaseSerializer):
+    """Serializer for slim user representation in autocomplete."""
+
+    avatar_thumbnail = serializers.ImageField(read_only=True)
+
+    class Meta:
+        model = get_user_model()
+        fields = (
+            "id",
+            "username",
+            "avatar_thumbnail",
+        )
+        read_only_fields = fields
+
+
+class FriendSuggestionSerializer(UserAutocompleteSerializer):
+    """Serializer for users suggested as friends."""
+
+    mutual_friends_count = serializers.IntegerField(read_only=True)
+
+    class Meta(UserAutocompleteSerializer.Meta):
+        fields = UserAutocompleteSerializer.Meta.fields + (
+            "mutual_friends_count",
+        )
+        read_only_fields = fields
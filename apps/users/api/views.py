@@ -7,6 +7,7 @@ from rest_framework.response import Response
 
 from apps.core.api.views import ReadOnlyViewSet
 from apps.users.models import User
+from apps.users.services import get_friend_suggestions, get_user_autocomplete
 
 from . import serializers
 
@@ -17,9 +18,13 @@ class UsersViewSet(ReadOnlyViewSet):
     queryset = User.objects.all()
     serializer_class = serializers.UserSerializer
     permission_classes = (IsAuthenticated,)
+    prefetch_related_map = {
+        "default": ("friends",),
+    }
+    # Prefix search is served by user's upper-case prefix indexes
     search_fields = (
-        "first_name",
-        "last_name",
+        "^first_name",
+        "^last_name",
     )
     ordering_fields = (
         "first_name",
@@ -29,7 +34,39 @@ class UsersViewSet(ReadOnlyViewSet):
     @action(methods=["get"], detail=False)
     def friends(self, request: Request) -> Response:
         """Get user's list of friends."""
-        serializer = serializers.FriendSerializer(request.user)
+        user = User.objects.prefetch_related("friends__friends").get(
+            pk=request.user.pk,
+        )
+        serializer = serializers.FriendSerializer(user)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(methods=["get"], detail=False, url_path="friend-suggestions")
+    def friend_suggestions(self, request: Request) -> Response:
+        """Get friends of user's friends ranked by mutual friends count."""
+        serializer = serializers.FriendSuggestionSerializer(
+            get_friend_suggestions(request.user),
+            many=True,
+            context=self.get_serializer_context(),
+        )
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(methods=["get"], detail=False)
+    def autocomplete(self, request: Request) -> Response:
+        """Get other users whose username or names start with `q` param.
+
+        Meant to be called on each keystroke, so users are loaded in one
+        indexed query and only with id, username and avatar thumbnail.
+
+        """
+        prefix = request.query_params.get("q", "").strip()
+        if not prefix:
+            return Response([], status=status.HTTP_200_OK)
+
+        serializer = serializers.UserAutocompleteSerializer(
+            get_user_autocomplete(request.user, prefix),
+            many=True,
+            context=self.get_serializer_context(),
+        )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -5,3 +5,18 @@ DEFAULT_TRANSACTION_COUNT = 0
 DEFAULT_TRANSACTION_STREAK = 0
 
 DEFAULT_PHONE_NUMBER = "+84000000000"
+
+USER_AUTOCOMPLETE_LIMIT = 10
+
+FRIENDSHIPS_CACHE_KEY = "users:friendships:{user_id}"
+
+FRIENDSHIPS_CACHE_TIMEOUT = 60 * 60 * 24
+
+FRIEND_SUGGESTIONS_LIMIT = 10
+
+AUTH_TOKEN_CACHE_KEY = "users:auth_token:{digest}"
+
+# Cached tokens are also dropped once they expire or are deleted
+AUTH_TOKEN_CACHE_TIMEOUT = 60 * 60
+
+EXPIRED_AUTH_TOKENS_BATCH_SIZE = 1000
@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-18 12:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_rename_friend_list_user_friends'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='friendship',
+            index=models.Index(fields=['from_user', 'to_user'], name='friendship_from_to_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='friendship',
+            index=models.Index(fields=['to_user', 'from_user'], name='friendship_to_from_idx'),
+        ),
+    ]
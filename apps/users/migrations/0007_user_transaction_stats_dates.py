@@ -0,0 +1,23 @@
+# Generated by Django 4.2 on 2026-10-18 12:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_friendship_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='last_transaction_date',
+            field=models.DateField(blank=True, null=True, verbose_name='Last transaction date'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='streak_start_date',
+            field=models.DateField(blank=True, null=True, verbose_name='Streak start date'),
+        ),
+    ]
@@ -2,8 +2,10 @@ from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.contrib.auth.models import UserManager as DjangoUserManager
 from django.contrib.postgres.fields import CIEmailField
+from django.contrib.postgres.indexes import OpClass
 from django.core.validators import RegexValidator
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 from imagekit import models as imagekitmodels
@@ -63,7 +65,11 @@ class User(
         is_premium: premium status of the user, default is False
         default_currency: default currency of the user, default is VND
         transaction_count: number of transactions of the user, default is 0
-        transaction_streak: number of consecutive transactions of the user
+        transaction_streak: longest number of consecutive days the user made
+        transactions
+        last_transaction_date: date of the user's latest transaction
+        streak_start_date: first day of the streak ending at
+        `last_transaction_date`
 
     """
 
@@ -130,6 +136,18 @@ class User(
         default=constants.DEFAULT_TRANSACTION_STREAK,
     )
 
+    last_transaction_date = models.DateField(
+        verbose_name=_("Last transaction date"),
+        null=True,
+        blank=True,
+    )
+
+    streak_start_date = models.DateField(
+        verbose_name=_("Streak start date"),
+        null=True,
+        blank=True,
+    )
+
     is_staff = models.BooleanField(
         verbose_name=_("Staff status"),
         default=False,
@@ -186,6 +204,26 @@ class User(
     class Meta:
         verbose_name = _("User")
         verbose_name_plural = _("Users")
+        # Django's `istartswith` compares `UPPER(field) LIKE UPPER(prefix)`,
+        # pattern operator classes let these indexes serve prefix searches
+        indexes = [
+            models.Index(
+                OpClass(Upper("username"), name="text_pattern_ops"),
+                name="user_username_upper_idx",
+            ),
+            models.Index(
+                OpClass(Upper("first_name"), name="text_pattern_ops"),
+                name="user_first_name_upper_idx",
+            ),
+            models.Index(
+                OpClass(Upper("last_name"), name="text_pattern_ops"),
+                name="user_last_name_upper_idx",
+            ),
+            models.Index(
+                OpClass(Upper("phone_number"), name="text_pattern_ops"),
+                name="user_phone_number_upper_idx",
+            ),
+        ]
 
     def __str__(self):
         # pylint: disable=invalid-str-returned
@@ -223,6 +261,16 @@ class Friendship(BaseModel):
     class Meta:
         verbose_name = _("Friendship")
         verbose_name_plural = _("Friendships")
+        indexes = [
+            models.Index(
+                fields=["from_user", "to_user"],
+                name="friendship_from_to_idx",
+            ),
+            models.Index(
+                fields=["to_user", "from_user"],
+                name="friendship_to_from_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Friend request from {self.from_user} to {self.to_user}"
@@ -9,6 +9,7 @@ class UserPasswordResetEmailNotification(DefaultEmailNotification):
 
     subject = _("Password Reset")
     template = "users/emails/password_reset.html"
+    plain_template = "users/emails/password_reset.txt"
 
     def __init__(self, user, **template_context):
         super().__init__(**template_context)
@@ -32,9 +33,20 @@ class FriendRequestEmailNotification(DefaultEmailNotification):
     """Send an email notification of a friend request to target user."""
 
     template = "users/emails/friend_request.html"
+    plain_template = "users/emails/friend_request.txt"
 
 
 class SharedBillEmailNotification(DefaultEmailNotification):
     """Send an email notification to friends tagged in a transaction."""
 
     template = "transactions/emails/shared_bill_notification.html"
+    plain_template = "transactions/emails/shared_bill_notification.txt"
+
+
+class TransactionReportEmailNotification(DefaultEmailNotification):
+    """Send a weekly report of user's transactions."""
+
+    subject = _("Transaction Report")
+    from_email = settings.SERVER_EMAIL
+    template = "transactions/emails/weekly_report.html"
+    plain_template = "transactions/emails/weekly_report.txt"
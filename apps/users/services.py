@@ -1,8 +1,18 @@
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
-from . import models, notifications
+from knox.models import AuthToken
+
+from . import constants, models, notifications
 
 
 def reset_user_password(
@@ -19,3 +29,233 @@ def reset_user_password(
         uid=urlsafe_base64_encode(force_bytes(user.pk)),
         token=PasswordResetTokenGenerator().make_token(user),
     ).send()
+
+
+def get_user_autocomplete(user: models.User, prefix: str) -> QuerySet:
+    """Get other users whose username or names start with the prefix.
+
+    Prefixes are matched with `istartswith`, which is served by user's
+    upper-case prefix indexes. Only fields shown in autocomplete are loaded
+    and at most `USER_AUTOCOMPLETE_LIMIT` users are returned.
+
+    """
+    return models.User.objects.filter(
+        Q(username__istartswith=prefix)
+        | Q(first_name__istartswith=prefix)
+        | Q(last_name__istartswith=prefix),
+    ).exclude(
+        pk=user.pk,
+    ).only(
+        "id",
+        "username",
+        "avatar",
+    ).order_by("username")[:constants.USER_AUTOCOMPLETE_LIMIT]
+
+
+# Friendships of a user mapped by the other user's id to (friendship id,
+# whether it is accepted, whether the user has sent a friendship to them)
+Friendships = dict[int, tuple[int, bool, bool]]
+
+
+def get_many_user_friendships(
+    user_ids: Iterable[int],
+) -> dict[int, Friendships]:
+    """Get friendships of users, sent or received, accepted or not.
+
+    Friendships are cached per user, friendships of users missing in the
+    cache are loaded in one query. When users have several friendships
+    with each other, the accepted one is kept and the user is marked as a
+    sender if any of them was sent by the user.
+
+    """
+    keys = {
+        user_id: constants.FRIENDSHIPS_CACHE_KEY.format(user_id=user_id)
+        for user_id in user_ids
+    }
+    cached = cache.get_many(keys.values())
+    friendships = {
+        user_id: cached[key]
+        for user_id, key in keys.items()
+        if key in cached
+    }
+    missing_ids = keys.keys() - friendships.keys()
+    if not missing_ids:
+        return friendships
+
+    loaded = {user_id: {} for user_id in missing_ids}
+    for pk, from_user_id, to_user_id, accepted in (
+        models.Friendship.objects.filter(
+            Q(from_user_id__in=missing_ids) | Q(to_user_id__in=missing_ids),
+        ).order_by("accepted").values_list(
+            "pk",
+            "from_user_id",
+            "to_user_id",
+            "accepted",
+        )
+    ):
+        if from_user_id in loaded:
+            loaded[from_user_id][to_user_id] = (pk, accepted, True)
+        if to_user_id in loaded:
+            previous = loaded[to_user_id].get(from_user_id)
+            loaded[to_user_id][from_user_id] = (
+                pk,
+                accepted,
+                bool(previous and previous[2]),
+            )
+    cache.set_many(
+        {keys[user_id]: value for user_id, value in loaded.items()},
+        constants.FRIENDSHIPS_CACHE_TIMEOUT,
+    )
+    return friendships | loaded
+
+
+def get_user_friendships(user_id: int) -> Friendships:
+    """Get friendships of a user, sent or received, accepted or not."""
+    return get_many_user_friendships([user_id])[user_id]
+
+
+def get_friend_ids(user_id: int) -> set[int]:
+    """Get ids of user's friends, who accepted friendships in any way."""
+    return {
+        other_id
+        for other_id, (_, accepted, _) in get_user_friendships(
+            user_id,
+        ).items()
+        if accepted
+    }
+
+
+def get_sent_friend_ids(user_id: int) -> set[int]:
+    """Get ids of users the user has sent friendships to, accepted or not.
+
+    These are the users of `user.friends`.
+
+    """
+    return {
+        other_id
+        for other_id, (_, _, sent) in get_user_friendships(user_id).items()
+        if sent
+    }
+
+
+def invalidate_user_friendships(*user_ids: int) -> None:
+    """Drop cached friendships of users after their friendship is changed.
+
+    The cache is dropped right away and once again after the transaction is
+    committed, so a concurrent request can't cache friendships that are
+    about to change.
+
+    """
+    keys = [
+        constants.FRIENDSHIPS_CACHE_KEY.format(user_id=user_id)
+        for user_id in user_ids
+    ]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def get_friend_suggestions(user: models.User) -> list[models.User]:
+    """Get friends of user's friends ranked by their mutual friends count.
+
+    Friends of friends are counted from cached friendships, users already
+    connected to the user by any friendship are skipped. Suggested users
+    are loaded in one query and have `mutual_friends_count` attribute.
+
+    """
+    friendships = get_user_friendships(user.pk)
+    friend_ids = get_friend_ids(user.pk)
+    mutual_friends_counts = Counter(
+        other_id
+        for friend_friendships in get_many_user_friendships(
+            friend_ids,
+        ).values()
+        for other_id, (_, accepted, _) in friend_friendships.items()
+        if accepted and other_id != user.pk and other_id not in friendships
+    )
+    suggestions = sorted(
+        mutual_friends_counts.items(),
+        key=lambda suggestion: (-suggestion[1], suggestion[0]),
+    )[:constants.FRIEND_SUGGESTIONS_LIMIT]
+    users = models.User.objects.only(
+        "id",
+        "username",
+        "avatar",
+    ).in_bulk([user_id for user_id, _ in suggestions])
+    for user_id, count in suggestions:
+        if user_id in users:
+            users[user_id].mutual_friends_count = count
+    return [users[user_id] for user_id, _ in suggestions if user_id in users]
+
+
+def get_cached_auth_token(digest: str) -> AuthToken | None:
+    """Get a validated auth token by its digest from cache.
+
+    Returns:
+        AuthToken | None: unsaved token with user id, token key and expiry
+        of the stored one, or None if it isn't cached or has expired.
+
+    """
+    cached = cache.get(constants.AUTH_TOKEN_CACHE_KEY.format(digest=digest))
+    if cached is None:
+        return None
+
+    user_id, token_key, expiry = cached
+    if expiry is not None and expiry < timezone.now():
+        return None
+    return AuthToken(
+        digest=digest,
+        token_key=token_key,
+        user_id=user_id,
+        expiry=expiry,
+    )
+
+
+def cache_auth_token(auth_token: AuthToken) -> None:
+    """Cache a validated auth token until it expires.
+
+    Tokens are kept at most `AUTH_TOKEN_CACHE_TIMEOUT` seconds, so the
+    cache doesn't fill up with tokens of inactive sessions.
+
+    """
+    timeout = constants.AUTH_TOKEN_CACHE_TIMEOUT
+    if auth_token.expiry is not None:
+        timeout = min(
+            timeout,
+            int((auth_token.expiry - timezone.now()).total_seconds()),
+        )
+    if timeout <= 0:
+        return
+    cache.set(
+        constants.AUTH_TOKEN_CACHE_KEY.format(digest=auth_token.digest),
+        (auth_token.user_id, auth_token.token_key, auth_token.expiry),
+        timeout,
+    )
+
+
+def invalidate_cached_auth_token(digest: str) -> None:
+    """Drop a cached auth token after it is deleted, e.g. on logout."""
+    cache.delete(constants.AUTH_TOKEN_CACHE_KEY.format(digest=digest))
+
+
+def purge_expired_auth_tokens(now: datetime | None = None) -> int:
+    """Delete expired auth tokens in batches.
+
+    Each batch is deleted in its own transaction, so the token table isn't
+    locked for the whole purge.
+
+    Returns:
+        int: number of deleted tokens.
+
+    """
+    now = now or timezone.now()
+    deleted_count = 0
+    while digests := list(
+        AuthToken.objects.filter(expiry__lt=now).values_list(
+            "pk",
+            flat=True,
+        )[:constants.EXPIRED_AUTH_TOKENS_BATCH_SIZE],
+    ):
+        with transaction.atomic():
+            deleted, _ = AuthToken.objects.filter(pk__in=digests).delete()
+        deleted_count += deleted
+    return deleted_count
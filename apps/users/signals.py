@@ -0,0 +1,54 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from knox.models import AuthToken
+
+from .models import Friendship, User
+from .services import (
+    get_user_friendships,
+    invalidate_cached_auth_token,
+    invalidate_user_friendships,
+)
+
+
+@receiver(post_save, sender=Friendship)
+@receiver(post_delete, sender=Friendship)
+def invalidate_cached_friendships(
+    sender,
+    instance: Friendship,
+    **kwargs,
+) -> None:
+    """Drop cached friendships of both users of a changed friendship."""
+    invalidate_user_friendships(instance.from_user_id, instance.to_user_id)
+
+
+@receiver(m2m_changed, sender=User.friends.through)
+def invalidate_cached_friends(
+    sender,
+    instance: User,
+    action: str,
+    pk_set: set[int] | None,
+    **kwargs,
+) -> None:
+    """Drop cached friendships changed through `User.friends` manager.
+
+    The manager adds and removes friendships in bulk without model signals.
+
+    """
+    if action in ("post_add", "post_remove"):
+        invalidate_user_friendships(instance.pk, *pk_set)
+    elif action == "pre_clear":
+        invalidate_user_friendships(
+            instance.pk,
+            *get_user_friendships(instance.pk),
+        )
+
+
+@receiver(post_delete, sender=AuthToken)
+def revoke_cached_auth_token(
+    sender,
+    instance: AuthToken,
+    **kwargs,
+) -> None:
+    """Stop authenticating with a deleted token, e.g. after logout."""
+    invalidate_cached_auth_token(instance.digest)
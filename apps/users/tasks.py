@@ -3,13 +3,25 @@ from django.urls import reverse
 
 from celery import shared_task
 
+from . import services
 from .models import Friendship
 from .notifications import FriendRequestEmailNotification
 
 
 @shared_task
-def send_friend_request_notification(friend_request: Friendship) -> bool:
-    """Send a mail with friend request to target user."""
+def send_friend_request_notification(friend_request_id: int) -> bool:
+    """Send a mail with friend request to target user.
+
+    Returns False if the friend request doesn't exist anymore.
+
+    """
+    friend_request = Friendship.objects.select_related(
+        "from_user",
+        "to_user",
+    ).filter(pk=friend_request_id).first()
+    if friend_request is None:
+        return False
+
     subject = f"New friend request from {friend_request.from_user.username}!"
     url = reverse("user-detail", kwargs={"pk": friend_request.from_user.pk})
     friend_request_url = f"{settings.APP_DOMAIN}{url}"
@@ -19,3 +31,9 @@ def send_friend_request_notification(friend_request: Friendship) -> bool:
         recipient_list=[friend_request.to_user.email],
         friend_request_url=friend_request_url,
     ).send()
+
+
+@shared_task
+def purge_expired_auth_tokens() -> int:
+    """Delete expired auth tokens and return their number."""
+    return services.purge_expired_auth_tokens()
@@ -0,0 +1,40 @@
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from apps.users.factories import FriendshipFactory, UserFactory
+from apps.users.models import User
+
+
+def befriend(user: User, *friends: User) -> None:
+    """Create accepted friendships of user with friends."""
+    for friend in friends:
+        FriendshipFactory(from_user=user, to_user=friend, accepted=True)
+
+
+def test_friend_suggestions_api(
+    django_assert_num_queries,
+    api_client: APIClient,
+    normal_user: User,
+) -> None:
+    """Ensure friends of friends are suggested by mutual friends count."""
+    first_friend, second_friend = UserFactory.create_batch(2)
+    befriend(normal_user, first_friend, second_friend)
+    pending_friend, common_friend, other_friend = UserFactory.create_batch(3)
+    FriendshipFactory(from_user=normal_user, to_user=pending_friend)
+    befriend(first_friend, common_friend, other_friend, pending_friend)
+    befriend(second_friend, common_friend)
+    # Requests which are not accepted don't make mutual friends
+    FriendshipFactory(from_user=second_friend, to_user=UserFactory())
+
+    response = api_client.get(reverse("v1:user-friend-suggestions"))
+
+    assert response.status_code == 200
+    assert [
+        (user["id"], user["mutual_friends_count"]) for user in response.data
+    ] == [(common_friend.pk, 2), (other_friend.pk, 1)]
+
+    # Friendships are cached, so only suggested users are loaded, including
+    # the savepoint queries of the atomic request
+    with django_assert_num_queries(3):
+        api_client.get(reverse("v1:user-friend-suggestions"))
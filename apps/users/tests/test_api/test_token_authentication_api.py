@@ -0,0 +1,72 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+import pytest
+from knox.models import AuthToken
+
+from apps.users.factories import UserFactory
+from apps.users.models import User
+from apps.users.tasks import purge_expired_auth_tokens
+
+
+@pytest.fixture
+def token_client(normal_user: User) -> APIClient:
+    """Return api client authenticated with a new knox token."""
+    _, token = AuthToken.objects.create(normal_user)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Token {token}")
+    return client
+
+
+def test_cached_token_authentication(token_client: APIClient) -> None:
+    """Ensure a validated token is authenticated without the token table."""
+    assert token_client.get(reverse("v1:profile")).status_code == 200
+
+    with CaptureQueriesContext(connection) as context:
+        response = token_client.get(reverse("v1:profile"))
+
+    assert response.status_code == 200
+    assert not [
+        query for query in context.captured_queries
+        if AuthToken._meta.db_table in query["sql"]
+    ]
+
+
+def test_logout_revokes_cached_token(token_client: APIClient) -> None:
+    """Ensure a cached token can't be used after logout."""
+    assert token_client.get(reverse("v1:profile")).status_code == 200
+
+    assert token_client.post(reverse("v1:logout")).status_code == 204
+    assert token_client.get(reverse("v1:profile")).status_code == 401
+
+
+def test_expired_cached_token(
+    token_client: APIClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure a cached token isn't authenticated after its expiry."""
+    assert token_client.get(reverse("v1:profile")).status_code == 200
+
+    expired_time = timezone.now() + timedelta(weeks=3)
+    monkeypatch.setattr(timezone, "now", lambda: expired_time)
+
+    assert token_client.get(reverse("v1:profile")).status_code == 401
+
+
+def test_purge_expired_auth_tokens(normal_user: User) -> None:
+    """Ensure only expired tokens are deleted by the purge task."""
+    expired_users = UserFactory.create_batch(3)
+    for user in expired_users:
+        AuthToken.objects.create(user, expiry=timedelta(seconds=-1))
+    active_token, _ = AuthToken.objects.create(normal_user)
+
+    assert purge_expired_auth_tokens.delay().get() == 3
+    assert list(AuthToken.objects.values_list("pk", flat=True)) == [
+        active_token.pk,
+    ]
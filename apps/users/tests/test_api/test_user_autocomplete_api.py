@@ -0,0 +1,42 @@
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from apps.users.factories import UserFactory
+from apps.users.models import User
+
+
+def test_user_autocomplete_api(
+    django_assert_num_queries,
+    api_client: APIClient,
+    normal_user: User,
+) -> None:
+    """Ensure other users are found by username and name prefixes."""
+    by_username = UserFactory(username="Autocompleted")
+    by_first_name = UserFactory(first_name="autobot", username="zeta")
+    by_last_name = UserFactory(last_name="Automatic", username="zzz")
+    UserFactory(username="someone", first_name="Not", last_name="Matching")
+
+    # Includes the savepoint queries of the atomic request
+    with django_assert_num_queries(3):
+        response = api_client.get(
+            reverse("v1:user-autocomplete"),
+            {"q": "aUtO"},
+        )
+
+    assert response.status_code == 200
+    assert [user["id"] for user in response.data] == [
+        by_username.pk,
+        by_first_name.pk,
+        by_last_name.pk,
+    ]
+    assert set(response.data[0]) == {"id", "username", "avatar_thumbnail"}
+    assert "CACHE/images" in response.data[0]["avatar_thumbnail"]
+
+
+def test_user_autocomplete_api_empty_prefix(api_client: APIClient) -> None:
+    """Ensure no users are returned without a prefix."""
+    response = api_client.get(reverse("v1:user-autocomplete"), {"q": " "})
+
+    assert response.status_code == 200
+    assert response.data == []
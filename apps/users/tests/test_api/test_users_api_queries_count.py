@@ -0,0 +1,64 @@
+from typing import Callable
+
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from apps.users.factories import FriendshipFactory, UserFactory
+from apps.users.models import User
+
+
+def add_friends(user: User, count: int) -> list[User]:
+    """Add new friends to the user."""
+    friends = UserFactory.create_batch(count)
+    for friend in friends:
+        FriendshipFactory(from_user=user, to_user=friend)
+    return friends
+
+
+def test_user_list_api_queries_count(
+    api_client: APIClient,
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure user list api doesn't make queries per user."""
+
+    def add_users(count: int) -> None:
+        for user in UserFactory.create_batch(count):
+            add_friends(user, 1)
+
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:user-list"),
+        add_users,
+    )
+
+
+def test_user_detail_api_queries_count(
+    api_client: APIClient,
+    another_user: User,
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure user detail api doesn't make queries per user's friend."""
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:user-detail", kwargs={"pk": another_user.pk}),
+        lambda count: add_friends(another_user, count),
+    )
+
+
+def test_friend_list_api_queries_count(
+    api_client: APIClient,
+    normal_user: User,
+    assert_constant_queries_count: Callable,
+) -> None:
+    """Ensure friend list api doesn't make queries per friend."""
+
+    def add_friends_of_friends(count: int) -> None:
+        for friend in add_friends(normal_user, count):
+            add_friends(friend, 1)
+
+    assert_constant_queries_count(
+        api_client,
+        reverse("v1:user-friends"),
+        add_friends_of_friends,
+    )
@@ -17,3 +17,19 @@ def test_friend_list_view(auth_client: Client, normal_user: User) -> None:
     ).friends.all()[:response.context_data["paginate_by"]]
     assert response_friends.exists()
     assert list(response_friends) == list(db_friends)
+
+
+def test_add_friend_view_sends_friend_request(
+    django_capture_on_commit_callbacks,
+    mailoutbox: list,
+    auth_client: Client,
+) -> None:
+    """Ensure target user is notified about the friend request."""
+    target_user = UserFactory()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        auth_client.get(
+            reverse("add-friend", kwargs={"user_id": target_user.pk}),
+        )
+
+    assert [message.to for message in mailoutbox] == [[target_user.email]]
@@ -1,7 +1,7 @@
 from django.test import Client
 from django.urls import reverse
 
-from apps.users.models import User
+from apps.users.models import Friendship, User
 
 
 def test_add_friend_view(auth_client: Client, to_user: User) -> None:
@@ -32,3 +32,20 @@ def test_add_friend_view_invalid(
     )
 
     assert response.status_code == 404
+
+
+def test_add_friend_view_sends_one_request(
+    auth_client: Client,
+    from_user: User,
+    to_user: User,
+) -> None:
+    """Ensure cached friendships are updated after a request is sent."""
+    for _ in range(2):
+        auth_client.get(
+            reverse("add-friend", kwargs={"user_id": to_user.pk}),
+        )
+
+    assert Friendship.objects.filter(
+        from_user=from_user,
+        to_user=to_user,
+    ).count() == 1
@@ -0,0 +1,36 @@
+from django.db import connection
+
+import pytest
+
+from apps.users.models import User
+from apps.users.services import get_user_autocomplete
+
+# Large enough for the planner to prefer indexes over sequential scans
+SEEDED_USERS_COUNT = 2000
+
+
+@pytest.fixture
+def seeded_users() -> list[User]:
+    """Seed many users, then analyze the users table."""
+    users = User.objects.bulk_create(
+        User(
+            username=f"seeded_user_{index}",
+            first_name=f"first_{index}",
+            last_name=f"last_{index}",
+            email=f"seeded_user_{index}@example.com",
+            phone_number=f"+849{index:08}",
+        )
+        for index in range(SEEDED_USERS_COUNT)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE users_user")
+    return users
+
+
+def test_user_autocomplete_plan(seeded_users: list[User]) -> None:
+    """Ensure user autocomplete uses prefix indexes of all its fields."""
+    plan = get_user_autocomplete(seeded_users[0], "seeded_user_199").explain()
+
+    for field in ("username", "first_name", "last_name"):
+        assert f"user_{field}_upper_idx" in plan, plan
+    assert "Seq Scan on users_user" not in plan, plan
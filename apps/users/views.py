@@ -3,6 +3,7 @@ from typing import Any
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.views import LoginView
+from django.db import transaction
 from django.db.models import Q, QuerySet
 from django.forms.models import BaseModelForm
 from django.http import HttpResponse, HttpResponseRedirect
@@ -18,6 +19,7 @@ from apps.users.forms import UserFirstUpdateForm, UserRegistrationForm
 from apps.users.models import Friendship, User
 
 from .filters import UserFilter
+from .services import get_user_friendships
 from .tasks import send_friend_request_notification
 
 
@@ -146,12 +148,15 @@ class UserDetailView(LoginRequiredMixin, DetailView):
 
         target_user = kwargs.get("object", None)
         user_data["target_user"] = target_user
-        friend_request = Friendship.objects.filter(
-            Q(from_user=self.request.user, to_user=target_user) |
-            Q(from_user=target_user, to_user=self.request.user),
+        friendship = get_user_friendships(self.request.user.pk).get(
+            target_user.pk,
         )
 
-        if (friend_request := friend_request.first()):
+        if friendship and (
+            friend_request := Friendship.objects.filter(
+                pk=friendship[0],
+            ).first()
+        ):
             user_data["friend_request"] = friend_request
 
         context.update(user_data)
@@ -175,10 +180,7 @@ class AddFriendView(LoginRequiredMixin, View):
             pk=user_id,
         )
 
-        if Friendship.objects.filter(
-            Q(from_user=request.user, to_user=target_user) |
-            Q(from_user=target_user, to_user=request.user),
-        ).exists():
+        if target_user.pk in get_user_friendships(request.user.pk):
             messages.add_message(
                 request,
                 messages.WARNING,
@@ -191,7 +193,9 @@ class AddFriendView(LoginRequiredMixin, View):
             to_user=target_user,
         )
         friend_request.save()
-        send_friend_request_notification.delay(friend_request)
+        transaction.on_commit(
+            lambda: send_friend_request_notification.delay(friend_request.pk),
+        )
         return redirect(reverse("user-detail", kwargs={"pk": user_id}))
 
 
@@ -252,12 +256,7 @@ class RemoveFriendView(LoginRequiredMixin, View):
             User.objects.exclude(pk=request.user.pk),
             pk=user_id,
         )
-        friend_request = Friendship.objects.filter(
-            Q(from_user=request.user, to_user=target_user) |
-            Q(from_user=target_user, to_user=request.user),
-        )
-
-        if not friend_request.exists():
+        if target_user.pk not in get_user_friendships(request.user.pk):
             messages.add_message(
                 request,
                 messages.WARNING,
@@ -265,7 +264,10 @@ class RemoveFriendView(LoginRequiredMixin, View):
             )
             return redirect(reverse("user-detail", kwargs={"pk": user_id}))
 
-        friend_request.delete()
+        Friendship.objects.filter(
+            Q(from_user=request.user, to_user=target_user) |
+            Q(from_user=target_user, to_user=request.user),
+        ).delete()
         return redirect(reverse("user-detail", kwargs={"pk": user_id}))
 
 
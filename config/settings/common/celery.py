@@ -1,7 +1,9 @@
 from celery.schedules import crontab
 
-CELERY_TASK_SERIALIZER = "pickle"
-CELERY_ACCEPT_CONTENT = ["pickle", "json"]
+# Tasks receive primary keys and fetch fresh objects from the database
+CELERY_TASK_SERIALIZER = "json"
+CELERY_RESULT_SERIALIZER = "json"
+CELERY_ACCEPT_CONTENT = ["json"]
 
 # if this option is True - celery task will run like default functions,
 # not asynchronous
@@ -40,4 +42,15 @@ CELERY_BEAT_SCHEDULE = {
         ),
         "schedule": crontab(hour=23, minute=59, day_of_week=0),
     },
+    "refresh_monthly_statistics": {
+        "task": (
+            "apps.transactions.tasks.refresh_monthly_statistics."
+            "refresh_monthly_statistics"
+        ),
+        "schedule": crontab(minute=0),
+    },
+    "purge_expired_auth_tokens": {
+        "task": "apps.users.tasks.purge_expired_auth_tokens",
+        "schedule": crontab(hour=3, minute=0),
+    },
 }
@@ -6,7 +6,7 @@ from libs.utils import get_latest_version
 # https://www.django-rest-framework.org/api-guide/settings/
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "knox.auth.TokenAuthentication",
+        "apps.users.api.auth.authentication.CachedTokenAuthentication",
         # SessionAuthentication is also used for CSRF
         # validation on ajax calls from the frontend
         "rest_framework.authentication.SessionAuthentication",
@@ -22,7 +22,7 @@ REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": (
         "libs.api.filter_backends.CustomDjangoFilterBackend",
         "libs.open_api.filters.OrderingFilterBackend",
-        "libs.open_api.filters.SearchFilterBackend",
+        "libs.api.filter_backends.FullTextSearchFilterBackend",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
     "PAGE_SIZE": 25,
@@ -12,4 +12,8 @@ urlpatterns = [
     path("rates/", include("apps.rates.api.urls")),
     path("categories/", include("apps.transactions.api.category.urls")),
     path("home/", include("apps.transactions.api.home.urls")),
+    path(
+        "statistics/",
+        include("apps.transactions.api.statistics.urls"),
+    ),
 ]
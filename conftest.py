@@ -1,5 +1,6 @@
 """Configuration file for pytest."""
 from django.conf import settings
+from django.core.cache import cache
 from django.test import Client
 
 import pytest
@@ -40,6 +41,19 @@ def enable_db_access_for_all_tests(django_db_setup, db):
     """Enable access to DB for all tests."""
 
 
+@pytest.fixture(autouse=True)
+def clear_cache(normal_user: User, another_user: User):
+    """Drop cached values between tests.
+
+    Session users are shared by tests, so values memoized on them are
+    dropped as well.
+
+    """
+    cache.clear()
+    for user in (normal_user, another_user):
+        user.__dict__.pop("cached_rate_matrix", None)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def temp_directory_for_media(tmpdir_factory):
     """Fixture that set temp directory for all media files.
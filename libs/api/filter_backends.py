@@ -1,8 +1,18 @@
+import re
+
 from django import forms
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, QuerySet
 from django.template import loader
 
+from rest_framework.settings import api_settings
+
 from django_filters.rest_framework import DjangoFilterBackend, FilterSet
 
+from libs.open_api.filters import SearchFilterBackend
+
+SEARCH_TERM_REGEX = re.compile(r"\w+")
+
 
 class CustomDjangoFilterBackend(DjangoFilterBackend):
     """Customized DjangoFilterBackend to reduce queries count."""
@@ -26,3 +36,72 @@ class CustomDjangoFilterBackend(DjangoFilterBackend):
             "filter": filterset,
         }
         return template.render(context, request)
+
+
+def get_prefix_search_query(
+    text: str,
+    config: str,
+    weights: str = "",
+) -> SearchQuery | None:
+    """Build a full-text query matching documents with all words of text.
+
+    The last word may be typed partially, so every word is matched as a
+    prefix. Punctuation is dropped, so user's input can't break the query.
+    With `weights` (e.g. "A"), words are matched only in the parts of the
+    vector having these weights.
+
+    Returns:
+        SearchQuery | None: query, or None if text has no words.
+
+    """
+    terms = SEARCH_TERM_REGEX.findall(text.lower())
+    if not terms:
+        return None
+    return SearchQuery(
+        " & ".join(f"{term}:*{weights}" for term in terms),
+        config=config,
+        search_type="raw",
+    )
+
+
+class FullTextSearchFilterBackend(SearchFilterBackend):
+    """SearchFilter using an indexed full-text search vector of a view.
+
+    Views with `search_vector_field` are searched by this field with
+    `search_config` text search configuration, results are annotated with
+    `search_rank` and the best ones go first unless ordering is requested.
+    Ties are ordered by view's ordering and then by primary key, so pages
+    stay stable.
+    Other views are searched by `search_fields` as usual.
+
+    Example:
+        class TransactionViewSet(BaseViewSet):
+            search_fields = ("note", "category__name")
+            search_vector_field = "search_vector"
+            search_config = "simple"
+
+    """
+
+    def filter_queryset(self, request, queryset: QuerySet, view) -> QuerySet:
+        """Filter queryset by search terms of the request."""
+        vector_field = getattr(view, "search_vector_field", None)
+        if vector_field is None:
+            return super().filter_queryset(request, queryset, view)
+
+        query = get_prefix_search_query(
+            " ".join(self.get_search_terms(request)),
+            view.search_config,
+        )
+        if query is None:
+            return queryset
+
+        queryset = queryset.filter(**{vector_field: query}).annotate(
+            search_rank=SearchRank(F(vector_field), query),
+        )
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+        return queryset.order_by(
+            "-search_rank",
+            *queryset.query.order_by,
+            "-pk",
+        )
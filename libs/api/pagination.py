@@ -0,0 +1,92 @@
+from collections import OrderedDict
+
+from django.core.paginator import InvalidPage
+from django.db.models import QuerySet
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from libs.pagination import KeysetPaginator
+
+
+class LimitOffsetOrKeysetPagination(LimitOffsetPagination):
+    """Limit/offset pagination with an opt-in keyset mode.
+
+    Keyset mode is enabled by `pagination=keyset` query param. It orders
+    results by view's `keyset_ordering` and returns a `next` link with a
+    cursor instead of a count and offsets, so deep pages are as fast as the
+    first one.
+
+    Example:
+        class TransactionViewSet(BaseViewSet):
+            pagination_class = LimitOffsetOrKeysetPagination
+            keyset_ordering = ("-date", "-id")
+
+    """
+
+    mode_query_param = "pagination"
+    keyset_mode = "keyset"
+    cursor_query_param = "cursor"
+    keyset_page = None
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view=None,
+    ) -> list | None:
+        """Paginate queryset with keyset pagination if it's requested."""
+        if request.query_params.get(self.mode_query_param) != self.keyset_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        paginator = KeysetPaginator(
+            queryset,
+            per_page=self.get_limit(request),
+            ordering=view.keyset_ordering,
+        )
+        try:
+            self.keyset_page = paginator.get_page(
+                request.query_params.get(self.cursor_query_param),
+            )
+        except InvalidPage as error:
+            raise NotFound(str(error)) from error
+        return self.keyset_page.object_list
+
+    def get_paginated_response(self, data: list) -> Response:
+        """Return `next` link and results without count in keyset mode."""
+        if self.keyset_page is None:
+            return super().get_paginated_response(data)
+
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_keyset_next_link()),
+                    ("results", data),
+                ],
+            ),
+        )
+
+    def get_keyset_next_link(self) -> str | None:
+        """Return link to the page after the current one."""
+        if not self.keyset_page.has_next():
+            return None
+
+        url = remove_query_param(
+            self.request.build_absolute_uri(),
+            self.offset_query_param,
+        )
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            self.keyset_page.next_cursor,
+        )
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        """Describe that count and previous are absent in keyset mode."""
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["required"] = ["results"]
+        return response_schema
@@ -1,11 +1,14 @@
 # pylint: skip-file
+import contextlib
+import functools
 import logging
 import typing
 from collections import namedtuple
 from urllib.error import HTTPError
 
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import QuerySet
 from django.template.loader import render_to_string
 
 from html_sanitizer import Sanitizer
@@ -15,6 +18,12 @@ logger = logging.getLogger("django")
 EmailFile = namedtuple("EmailFile", ["filename", "content", "mimetype"])
 
 
+@functools.cache
+def get_sanitizer() -> Sanitizer:
+    """Get sanitizer instance shared by all notifications."""
+    return Sanitizer()
+
+
 class EmailNotification:
     """Wrap up of django.core send_mail function.
 
@@ -118,8 +127,7 @@ class EmailNotification:
             )
             return plain_message
 
-        sanitizer = Sanitizer()
-        plain_message = sanitizer.sanitize(html_message)
+        plain_message = get_sanitizer().sanitize(html_message)
         return plain_message
 
     def prepare_mail_text(self):
@@ -128,10 +136,36 @@ class EmailNotification:
         plain_text_content = self.prepare_plain_text(html_message)
         return html_message, plain_text_content
 
-    def prepare_mail_args(self):
-        """Prepare email arguments before sending."""
+    def get_render_key(self):
+        """Get key of email's rendered content.
+
+        Notifications with equal keys have equal templates and context, so
+        their content is rendered once by `send_email_notifications`.
+        Returns `None` if the context has values which can't be compared.
+
+        """
+        try:
+            key = (
+                self.get_template(),
+                self.get_plain_template(),
+                _freeze_context(self.get_template_context()),
+            )
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def prepare_mail_args(self, mail_text=None):
+        """Prepare email arguments before sending.
+
+        Arguments:
+            mail_text(tuple): already rendered html and plain text content
+
+        """
         subject = self.get_formatted_subject()
-        html_content, plain_text_content = self.prepare_mail_text()
+        html_content, plain_text_content = (
+            mail_text or self.prepare_mail_text()
+        )
         from_email = self.get_from_email()
         recipient_list = self.get_recipient_list()
         files = self.get_files()
@@ -145,19 +179,13 @@ class EmailNotification:
             "files": files,
         }
 
-    def send(self) -> bool:
-        """Send email.
-
-        Returns:
-            True: if it succeeded
-            False: if it failed
-
-        """
-        email_args = self.prepare_mail_args()
+    def prepare_mail(self, mail_text=None, connection=None):
+        """Prepare email message with html alternative and attachments."""
+        email_args = self.prepare_mail_args(mail_text)
         html_message = email_args.pop("html_message")
         files = email_args.pop("files")
 
-        mail = EmailMultiAlternatives(**email_args)
+        mail = EmailMultiAlternatives(connection=connection, **email_args)
         mail.attach_alternative(html_message, "text/html")
 
         # Attach files
@@ -167,6 +195,17 @@ class EmailNotification:
                 content=file.content,
                 mimetype=file.mimetype,
             )
+        return mail
+
+    def send(self) -> bool:
+        """Send email.
+
+        Returns:
+            True: if it succeeded
+            False: if it failed
+
+        """
+        mail = self.prepare_mail()
 
         # Send email
         try:
@@ -175,7 +214,7 @@ class EmailNotification:
             return True
         except HTTPError as error:
             logger.error(
-                f"Error while sending email to {email_args['to']}: {error}",
+                f"Error while sending email to {mail.to}: {error}",
             )
             self.on_email_send_failed(error)
             return False
@@ -195,3 +234,66 @@ class DefaultEmailNotification(EmailNotification):
     def get_formatted_subject(self):
         """Add app label to subject."""
         return f"{settings.APP_LABEL} - {self.get_subject()}"
+
+
+def _freeze_context(value):
+    """Convert template context to a hashable value for comparison."""
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                (key, _freeze_context(item)) for key, item in value.items()
+            ),
+        )
+    if isinstance(value, (list, tuple, QuerySet)):
+        return tuple(_freeze_context(item) for item in value)
+    return value
+
+
+def send_email_notifications(
+    notifications: typing.Sequence[EmailNotification],
+) -> list[bool]:
+    """Send many email notifications through one connection.
+
+    Content of notifications with equal templates and context is rendered
+    once. Messages are sent one by one, so a failed message doesn't stop
+    others, and the connection is reopened after a failure.
+
+    Returns:
+        list: results of `send` for each notification, True if it succeeded
+        and False if it failed
+
+    """
+    rendered_texts = {}
+    results = []
+    connection = get_connection()
+    connection.open()
+    try:
+        for notification in notifications:
+            render_key = notification.get_render_key()
+            if render_key is None:
+                mail_text = notification.prepare_mail_text()
+            elif render_key in rendered_texts:
+                mail_text = rendered_texts[render_key]
+            else:
+                mail_text = notification.prepare_mail_text()
+                rendered_texts[render_key] = mail_text
+            mail = notification.prepare_mail(mail_text, connection)
+
+            try:
+                connection.send_messages([mail])
+            except OSError as error:
+                logger.error(
+                    f"Error while sending email to {mail.to}: {error}",
+                )
+                notification.on_email_send_failed(error)
+                results.append(False)
+                # The connection may be broken by the failure
+                connection.close()
+                with contextlib.suppress(OSError):
+                    connection.open()
+                continue
+            notification.on_email_send_succeed()
+            results.append(True)
+    finally:
+        connection.close()
+    return results
@@ -0,0 +1,145 @@
+import base64
+import json
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
+
+
+class KeysetPage:
+    """Page of objects returned by `KeysetPaginator`.
+
+    Mimics the parts of Django's `Page` used by list views and templates,
+    except for page numbers which are unknown without counting.
+
+    """
+
+    number = None
+
+    def __init__(
+        self,
+        object_list: list[Any],
+        paginator: "KeysetPaginator",
+        cursor: str | None,
+        next_cursor: str | None,
+    ) -> None:
+        self.object_list = object_list
+        self.paginator = paginator
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        """Return whether there are objects after this page."""
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        """Return whether this page is not the first one."""
+        return self.cursor is not None
+
+    def has_other_pages(self) -> bool:
+        """Return whether there are pages besides this one."""
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """Paginate a queryset by the values of its ordering fields.
+
+    Instead of `OFFSET n` and `COUNT(*)` of Django's `Paginator`, each page
+    starts right after the ordering values of the previous page's last
+    object, so any page is as fast as the first one. The last ordering field
+    must be unique (e.g. `id`) to make the order strict.
+
+    Example:
+        paginator = KeysetPaginator(queryset, 25, ("-date", "-id"))
+        page = paginator.get_page(request.GET.get("cursor"))
+
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        per_page: int,
+        ordering: tuple[str, ...],
+    ) -> None:
+        self.queryset = queryset.order_by(*ordering)
+        self.per_page = per_page
+        self.ordering = ordering
+
+    def get_page(self, cursor: str | None = None) -> KeysetPage:
+        """Return the page starting after the position in the cursor.
+
+        Raises:
+            InvalidPage: if the cursor is malformed.
+
+        """
+        queryset = self.queryset
+        if cursor:
+            try:
+                queryset = queryset.filter(
+                    self.get_position_filter(self.decode_cursor(cursor)),
+                )
+            except (ValidationError, ValueError, TypeError) as error:
+                raise InvalidPage("Invalid cursor.") from error
+
+        # Fetch one more object to know whether there is a next page
+        object_list = list(queryset[:self.per_page + 1])
+        next_cursor = None
+        if len(object_list) > self.per_page:
+            object_list = object_list[:self.per_page]
+            next_cursor = self.encode_cursor(object_list[-1])
+        return KeysetPage(object_list, self, cursor, next_cursor)
+
+    def get_position_filter(self, values: list[Any]) -> Q:
+        """Build a filter for objects placed after the given position.
+
+        For ("-date", "-id") ordering it is
+        `date <= d AND (date < d OR (date = d AND id < i))`, the first
+        condition lets the database start an index scan at the position.
+
+        """
+        position_filter = None
+        for field, value in reversed(list(zip(self.ordering, values))):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            after = Q(**{f"{name}__{lookup}": value})
+            position_filter = (
+                after if position_filter is None
+                else after | Q(**{name: value}) & position_filter
+            )
+
+        first_field = self.ordering[0]
+        lookup = "lte" if first_field.startswith("-") else "gte"
+        return (
+            Q(**{f"{first_field.lstrip('-')}__{lookup}": values[0]})
+            & position_filter
+        )
+
+    def encode_cursor(self, obj: Any) -> str:
+        """Encode ordering values of an object into an opaque cursor."""
+        values = [getattr(obj, field.lstrip("-")) for field in self.ordering]
+        return base64.urlsafe_b64encode(
+            json.dumps(values, cls=DjangoJSONEncoder).encode(),
+        ).decode()
+
+    def decode_cursor(self, cursor: str) -> list[Any]:
+        """Decode ordering values from a cursor.
+
+        Raises:
+            InvalidPage: if the cursor is malformed.
+
+        """
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except ValueError as error:
+            raise InvalidPage("Invalid cursor.") from error
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise InvalidPage("Invalid cursor.")
+        return values